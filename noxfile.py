@@ -324,6 +324,17 @@ def coverage(session: nox.Session) -> None:
     )
 
 
+@nox.session
+def benchmark(session: nox.Session) -> None:
+    # Install source distribution
+    run_with_protected_pip(session, "install", ".")
+
+    # Install test dependencies, which the benchmarks use to build wheels.
+    run_with_protected_pip(session, "install", "--group", "test")
+
+    session.run("python", "-m", "tests.benchmarks", *session.posargs)
+
+
 # -----------------------------------------------------------------------------
 # Release Commands
 # -----------------------------------------------------------------------------
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
 import pathlib
+import shutil
 import site
+import stat
 import sys
+import tempfile
 import textwrap
 from collections import OrderedDict
 from collections.abc import Iterable, Sequence
@@ -16,6 +21,8 @@ from io import StringIO
 from types import TracebackType
 from typing import TYPE_CHECKING, Protocol, TypedDict
 
+from pip._vendor.packaging.specifiers import SpecifierSet
+from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.packaging.version import Version
 
 from pip import __file__ as pip_location
@@ -29,9 +36,11 @@ from pip._internal.exceptions import (
 from pip._internal.locations import get_platlib, get_purelib, get_scheme
 from pip._internal.metadata import get_default_environment, get_environment
 from pip._internal.utils.deprecation import deprecated
+from pip._internal.utils.filesystem import directory_size
 from pip._internal.utils.logging import VERBOSE, capture_logging
+from pip._internal.utils.misc import ensure_dir, rmtree
 from pip._internal.utils.packaging import get_requirement
-from pip._internal.utils.subprocess import call_subprocess
+from pip._internal.utils.subprocess import call_subprocess, thread_environ
 from pip._internal.utils.temp_dir import TempDirectory, tempdir_kinds
 
 if TYPE_CHECKING:
@@ -434,6 +443,271 @@ class InprocessBuildEnvironmentInstaller:
         )
 
 
+def _link_tree(src: str, dst: str) -> None:
+    """Recreate the src directory tree in dst, hard linking its files.
+
+    Files are copied instead where hard links are not possible, e.g. when
+    src and dst are on different file systems.
+    """
+    can_link = True
+    for root, _dirs, files in os.walk(src):
+        target_root = os.path.join(dst, os.path.relpath(root, src))
+        ensure_dir(target_root)
+        for name in files:
+            source, target = os.path.join(root, name), os.path.join(target_root, name)
+            if can_link and not os.path.islink(source):
+                try:
+                    os.link(source, target)
+                    continue
+                except OSError:
+                    can_link = False
+            shutil.copy2(source, target, follow_symlinks=False)
+
+
+_WRITE_BITS = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
+
+def _make_read_only(path: str) -> dict[str, tuple[int, int]]:
+    """Remove the write permissions of the files in the directory tree.
+
+    Return the size and modification time of each file, by relative path.
+    """
+    recorded = {}
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(root, name)
+            if os.path.islink(file_path):
+                continue
+            st = os.stat(file_path)
+            os.chmod(file_path, stat.S_IMODE(st.st_mode) & ~_WRITE_BITS)
+            recorded[os.path.relpath(file_path, path)] = (st.st_size, st.st_mtime_ns)
+    return recorded
+
+
+def _is_intact(path: str, recorded: dict[str, list[int]]) -> bool:
+    """Check the files of the directory tree against the recorded ones."""
+    for relpath, (size, mtime_ns) in recorded.items():
+        st = os.stat(os.path.join(path, relpath))
+        if st.st_size != size or st.st_mtime_ns != mtime_ns or st.st_mode & _WRITE_BITS:
+            return False
+    return True
+
+
+class _CachedDistribution(TypedDict):
+    name: str
+    version: str
+    requires: list[str]
+
+
+class CachingBuildEnvironmentInstaller:
+    """
+    Build dependency installer reusing prefixes populated by previous installs.
+
+    Populated prefixes are kept in a cache directory, keyed by the interpreter
+    and the requirements installed, along with the distributions installed in
+    them. A cached prefix is only used when the finder still selects the same
+    distributions for the requirements, in which case it is linked into place
+    instead of resolving and installing the requirements again. Otherwise it
+    is replaced. The files of cached prefixes are read-only, as they are hard
+    linked into build environments, and are checked before being linked, so
+    that a prefix modified nonetheless is replaced too. The least recently
+    used prefixes are removed to keep the cache under max_size bytes.
+    """
+
+    def __init__(
+        self,
+        installer: BuildEnvironmentInstaller,
+        finder: PackageFinder,
+        cache_dir: str,
+        max_size: int = 1024 * 1024 * 1024,
+    ) -> None:
+        self._installer = installer
+        self._finder = finder
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+
+    def _get_key(self, requirements: list[str]) -> str | None:
+        """Return the cache key for the requirements, or None if they must
+        not be cached.
+        """
+        for req_str in requirements:
+            if get_requirement(req_str).url:
+                # Direct references may point to mutable files or branches.
+                return None
+        key = {
+            "executable": sys.executable,
+            "version": sys.version,
+            "requirements": sorted(requirements),
+        }
+        serialized = json.dumps(key, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha224(serialized.encode("utf-8")).hexdigest()
+
+    def _is_current(
+        self, requirements: list[str], distributions: list[_CachedDistribution]
+    ) -> bool:
+        """Return whether resolving the requirements again would install the
+        cached distributions.
+
+        The resolver selects the best candidate of each project allowed by the
+        requirements on it, so the cached distributions are what it installs
+        as long as the finder selects each of them again, given the
+        requirements of the others.
+        """
+        installed = {dist["name"]: dist for dist in distributions}
+        specifiers: dict[str, SpecifierSet] = {}
+        seen: set[tuple[str, str]] = set()
+        pending = [(get_requirement(req_str), "") for req_str in requirements]
+        while pending:
+            req, extra = pending.pop()
+            if req.marker is not None and not req.marker.evaluate({"extra": extra}):
+                continue
+            name = canonicalize_name(req.name)
+            if req.url or name not in installed:
+                return False
+            specifiers[name] = specifiers.get(name, SpecifierSet()) & req.specifier
+            for requested in ["", *(canonicalize_name(e) for e in req.extras)]:
+                if (name, requested) not in seen:
+                    seen.add((name, requested))
+                    pending.extend(
+                        (get_requirement(dep), requested)
+                        for dep in installed[name]["requires"]
+                    )
+        if specifiers.keys() != installed.keys():
+            return False
+        for project, specifier in specifiers.items():
+            result = self._finder.find_best_candidate(project, specifier)
+            candidate = result.best_candidate
+            if candidate is None or candidate.version != Version(
+                installed[project]["version"]
+            ):
+                return False
+        return True
+
+    def install(
+        self,
+        requirements: Iterable[str],
+        prefix: _Prefix,
+        *,
+        kind: str,
+        for_req: InstallRequirement | None,
+    ) -> None:
+        requirements = list(requirements)
+        key = self._get_key(requirements)
+        if key is None:
+            self._installer.install(requirements, prefix, kind=kind, for_req=for_req)
+            return
+
+        entry = os.path.join(self._cache_dir, key)
+        if self._use_entry(entry, prefix, requirements):
+            logger.info("Using cached %s", kind)
+            return
+        self._installer.install(requirements, prefix, kind=kind, for_req=for_req)
+        try:
+            self._add_entry(entry, prefix, requirements)
+            self._evict(keep=entry)
+        except OSError as exc:
+            logger.debug("Could not cache build environment %s: %s", entry, exc)
+
+    def _use_entry(self, entry: str, prefix: _Prefix, requirements: list[str]) -> bool:
+        """Populate the prefix from the cache entry, returning whether it
+        exists and is current.
+        """
+        metadata_path = os.path.join(entry, "entry.json")
+        cached_prefix = os.path.join(entry, "prefix")
+        try:
+            with open(metadata_path, encoding="utf-8") as f:
+                metadata = json.load(f)
+            distributions = metadata["distributions"]
+            intact = _is_intact(cached_prefix, metadata["files"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        if not intact:
+            logger.warning("Replacing modified cached build environment %s", entry)
+            return False
+        if not self._is_current(requirements, distributions):
+            logger.debug("Cached build environment %s is outdated", entry)
+            return False
+        try:
+            _link_tree(cached_prefix, prefix.path)
+            # The modification time of the metadata tells when it was last used.
+            os.utime(metadata_path)
+        except OSError as exc:
+            # The entry may have been evicted concurrently.
+            logger.debug("Could not use cached build environment %s: %s", entry, exc)
+            rmtree(prefix.path, ignore_errors=True)
+            return False
+        return True
+
+    def _add_entry(self, entry: str, prefix: _Prefix, requirements: list[str]) -> None:
+        """Add the populated prefix to the cache, replacing an outdated entry."""
+        distributions: list[_CachedDistribution] = [
+            {
+                "name": dist.canonical_name,
+                "version": str(dist.version),
+                "requires": list(dist.iter_raw_dependencies()),
+            }
+            for dist in get_environment(list(prefix.lib_dirs)).iter_all_distributions()
+        ]
+        ensure_dir(self._cache_dir)
+        staging = tempfile.mkdtemp(prefix=".tmp-", dir=self._cache_dir)
+        try:
+            _link_tree(prefix.path, os.path.join(staging, "prefix"))
+            metadata = {
+                "requirements": requirements,
+                "distributions": distributions,
+                "files": _make_read_only(os.path.join(staging, "prefix")),
+                "size": directory_size(os.path.join(staging, "prefix")),
+            }
+            with open(os.path.join(staging, "entry.json"), "w", encoding="utf-8") as f:
+                json.dump(metadata, f)
+            if os.path.isdir(entry):
+                # Move the outdated entry out of the way first, as renaming
+                # a directory does not replace another one.
+                outdated = tempfile.mkdtemp(prefix=".tmp-", dir=self._cache_dir)
+                os.replace(entry, os.path.join(outdated, "entry"))
+                rmtree(outdated, ignore_errors=True)
+            # Renaming is atomic, so that other processes never see a partial
+            # entry. If one of them added the entry first, keep theirs.
+            os.rename(staging, entry)
+        except OSError:
+            rmtree(staging, ignore_errors=True)
+            if not os.path.isdir(entry):
+                raise
+
+    def _evict(self, keep: str) -> None:
+        """Remove the least recently used entries over the size limit."""
+        entries = []
+        for name in os.listdir(self._cache_dir):
+            entry = os.path.join(self._cache_dir, name)
+            metadata_path = os.path.join(entry, "entry.json")
+            if name.startswith(".") or not os.path.isfile(metadata_path):
+                continue
+            try:
+                with open(metadata_path, encoding="utf-8") as f:
+                    size = json.load(f)["size"]
+                mtime = os.path.getmtime(metadata_path)
+            except OSError:
+                # The entry may have been evicted concurrently.
+                continue
+            except (ValueError, KeyError, TypeError):
+                size = None
+            if not isinstance(size, (int, float)):
+                logger.debug("Removing invalid cached build environment %s", entry)
+                rmtree(entry, ignore_errors=True)
+                continue
+            entries.append((mtime, size, entry))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total_size <= self._max_size:
+                break
+            if entry == keep:
+                continue
+            logger.debug("Removing cached build environment %s", entry)
+            rmtree(entry, ignore_errors=True)
+            total_size -= size
+
+
 class BuildEnvironment:
     """Creates and manages an isolated environment to install build deps"""
 
@@ -492,26 +766,35 @@ class BuildEnvironment:
                 ).format(system_sites=system_sites, lib_dirs=self._lib_dirs)
             )
 
+    def _get_environ(self) -> dict[str, str]:
+        path = self._bin_dirs[:]
+        old_path = os.environ.get("PATH")
+        if old_path:
+            path.extend(old_path.split(os.pathsep))
+
+        pythonpath = [self._site_dir]
+
+        return {
+            "PATH": os.pathsep.join(path),
+            "PYTHONNOUSERSITE": "1",
+            "PYTHONPATH": os.pathsep.join(pythonpath),
+        }
+
     def __enter__(self) -> None:
         self._save_env = {
             name: os.environ.get(name, None)
             for name in ("PATH", "PYTHONNOUSERSITE", "PYTHONPATH")
         }
+        os.environ.update(self._get_environ())
 
-        path = self._bin_dirs[:]
-        old_path = self._save_env["PATH"]
-        if old_path:
-            path.extend(old_path.split(os.pathsep))
+    def for_current_thread(self) -> ContextManager[None]:
+        """Return a context manager entering the environment in this thread.
 
-        pythonpath = [self._site_dir]
-
-        os.environ.update(
-            {
-                "PATH": os.pathsep.join(path),
-                "PYTHONNOUSERSITE": "1",
-                "PYTHONPATH": os.pathsep.join(pythonpath),
-            }
-        )
+        Instead of changing os.environ, the environment is only given to the
+        subprocesses started by call_subprocess() from the current thread.
+        This lets several threads use their own build environment at once.
+        """
+        return thread_environ(self._get_environ())
 
     def __exit__(
         self,
@@ -592,6 +875,9 @@ class NoOpBuildEnvironment(BuildEnvironment):
     ) -> None:
         pass
 
+    def for_current_thread(self) -> ContextManager[None]:
+        return nullcontext()
+
     def cleanup(self) -> None:
         pass
 
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
 import logging
 import os
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +21,7 @@ from pip._internal.exceptions import InvalidWheelFilename
 from pip._internal.models.direct_url import DirectUrl
 from pip._internal.models.link import Link
 from pip._internal.models.wheel import Wheel
+from pip._internal.utils.filesystem import adjacent_tmp_file, replace
 from pip._internal.utils.temp_dir import TempDirectory, tempdir_kinds
 from pip._internal.utils.urls import path_to_url
 
@@ -23,6 +29,17 @@ logger = logging.getLogger(__name__)
 
 ORIGIN_JSON_NAME = "origin.json"
 
+# The index of a wheel cache, stored at the root of its wheels directory.
+WHEEL_CACHE_INDEX_NAME = "index-v1.json"
+
+# Bump this when the serialized form of the wheel cache index changes.
+_INDEX_FORMAT_VERSION = 1
+
+# A directory modified this recently (in nanoseconds) may be modified again
+# without its modification time changing, on filesystems with a coarse
+# resolution.
+_RACY_WINDOW_NS = 2 * 10**9
+
 
 def _hash_dict(d: dict[str, str]) -> str:
     """Return a stable sha224 of a dictionary."""
@@ -74,16 +91,6 @@ class Cache:
 
         return parts
 
-    def _get_candidates(self, link: Link, canonical_package_name: str) -> list[Any]:
-        can_not_cache = not self.cache_dir or not canonical_package_name or not link
-        if can_not_cache:
-            return []
-
-        path = self.get_path_for_link(link)
-        if os.path.isdir(path):
-            return [(candidate, path) for candidate in os.listdir(path)]
-        return []
-
     def get_path_for_link(self, link: Link) -> str:
         """Return a directory to store cached items in for link."""
         raise NotImplementedError()
@@ -100,11 +107,179 @@ class Cache:
         raise NotImplementedError()
 
 
+@dataclass(frozen=True)
+class CachedWheel:
+    filename: str
+    name: str
+    version: str
+    tags: frozenset[Tag]
+
+    @classmethod
+    def from_filename(cls, filename: str) -> CachedWheel:
+        wheel = Wheel(filename)
+        return cls(filename, wheel.name, wheel.version, wheel.file_tags)
+
+
+def _list_wheels(directory: str) -> list[CachedWheel]:
+    wheels = []
+    for filename in os.listdir(directory):
+        try:
+            wheels.append(CachedWheel.from_filename(filename))
+        except InvalidWheelFilename:
+            continue
+    return wheels
+
+
+class WheelCacheIndex:
+    """An on-disk index of the wheels in a wheel cache.
+
+    Entries are keyed by the path of a cache directory, relative to the root of
+    the cache, and list the wheels in that directory. An entry is valid as long
+    as the stamp (modification time and inode) of its directory is unchanged,
+    which adding or removing a wheel changes. Looking up a cache directory thus
+    takes a single stat() instead of listing it and parsing the name of every
+    file in it, and other tools adding wheels to the cache cannot make the
+    index stale.
+
+    Entries are only parsed when they are looked up. Changes are kept in memory
+    and written by close(), which runs at exit if it was not called before.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self.path = os.path.join(root, WHEEL_CACHE_INDEX_NAME)
+        self._lock = threading.Lock()
+        self._serialized: dict[str, Any] | None = None
+        self._entries: dict[str, tuple[list[int], list[CachedWheel]]] = {}
+        self._updated: set[str] = set()
+        self._removed: set[str] = set()
+
+    def _load(self) -> dict[str, Any]:
+        """Load the serialized entries of the index."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data["version"] != _INDEX_FORMAT_VERSION:
+                return {}
+            entries = data["entries"]
+        except (OSError, ValueError, KeyError, TypeError):
+            # A missing or invalid index is rebuilt from scratch.
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _get_entry(self, key: str) -> tuple[list[int], list[CachedWheel]] | None:
+        if key in self._entries:
+            return self._entries[key]
+        if self._serialized is None:
+            self._serialized = self._load()
+        try:
+            stamp, wheels = self._serialized[key]
+            entry = (
+                stamp,
+                [
+                    CachedWheel(
+                        filename, name, version, frozenset(map(_parse_tag, tags))
+                    )
+                    for filename, name, version, tags in wheels
+                ],
+            )
+        except (KeyError, ValueError, TypeError):
+            return None
+        self._entries[key] = entry
+        return entry
+
+    def _set_entry(
+        self, key: str, entry: tuple[list[int], list[CachedWheel]] | None
+    ) -> None:
+        if not self._updated and not self._removed:
+            atexit.register(self.close)
+        if entry is None:
+            self._entries.pop(key, None)
+            if self._serialized is not None:
+                self._serialized.pop(key, None)
+            self._updated.discard(key)
+            self._removed.add(key)
+        else:
+            self._entries[key] = entry
+            self._removed.discard(key)
+            self._updated.add(key)
+
+    def _get_key(self, directory: str) -> str:
+        return os.path.relpath(directory, self.root).replace(os.sep, "/")
+
+    def get_wheels(self, directory: str) -> list[CachedWheel]:
+        """Get the wheels in a cache directory, updating the index."""
+        key = self._get_key(directory)
+        try:
+            st = os.stat(directory)
+        except OSError:
+            return []
+        stamp = [st.st_mtime_ns, st.st_ino]
+        with self._lock:
+            entry = self._get_entry(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+
+        wheels = _list_wheels(directory)
+        if time.time_ns() - st.st_mtime_ns >= _RACY_WINDOW_NS:
+            with self._lock:
+                self._set_entry(key, (stamp, wheels))
+        return wheels
+
+    def discard(self, directories: Iterable[str]) -> None:
+        """Remove the entries of the given cache directories."""
+        with self._lock:
+            for directory in directories:
+                self._set_entry(self._get_key(directory), None)
+        self.close()
+
+    def close(self) -> None:
+        """Write the changes made to the index.
+
+        The index is loaded again first, so that the entries other processes
+        added since it was loaded are kept.
+        """
+        with self._lock:
+            atexit.unregister(self.close)
+            if not self._updated and not self._removed:
+                return
+            serialized = self._load()
+            for key in self._removed:
+                serialized.pop(key, None)
+            for key in self._updated:
+                stamp, wheels = self._entries[key]
+                serialized[key] = (
+                    stamp,
+                    [
+                        (w.filename, w.name, w.version, sorted(map(str, w.tags)))
+                        for w in wheels
+                    ],
+                )
+            self._updated.clear()
+            self._removed.clear()
+            data = {"version": _INDEX_FORMAT_VERSION, "entries": serialized}
+            try:
+                with adjacent_tmp_file(self.path) as f:
+                    f.write(json.dumps(data, separators=(",", ":")).encode())
+                replace(f.name, self.path)
+            except OSError as exc:
+                logger.debug("Could not write wheel cache index: %s", exc)
+
+
+def _parse_tag(tag: str) -> Tag:
+    interpreter, abi, platform = tag.split("-")
+    return Tag(interpreter, abi, platform)
+
+
 class SimpleWheelCache(Cache):
     """A cache of wheels for future installs."""
 
-    def __init__(self, cache_dir: str) -> None:
+    def __init__(self, cache_dir: str, use_index: bool = True) -> None:
         super().__init__(cache_dir)
+        self._index: WheelCacheIndex | None = None
+        if use_index and self.cache_dir:
+            self._index = WheelCacheIndex(os.path.join(self.cache_dir, "wheels"))
+        self._tag_priorities: tuple[list[Tag], dict[Tag, int]] | None = None
 
     def get_path_for_link(self, link: Link) -> str:
         """Return a directory to store cached wheels for link
@@ -134,41 +309,61 @@ class SimpleWheelCache(Cache):
     ) -> Link:
         candidates = []
 
-        if not package_name:
+        if not package_name or not self.cache_dir or not link:
             return link
 
         canonical_package_name = canonicalize_name(package_name)
-        for wheel_name, wheel_dir in self._get_candidates(link, canonical_package_name):
-            try:
-                wheel = Wheel(wheel_name)
-            except InvalidWheelFilename:
-                continue
+        tag_priorities = self._get_tag_priorities(supported_tags)
+        wheel_dir = self.get_path_for_link(link)
+        for wheel in self._get_wheels(wheel_dir):
             if wheel.name != canonical_package_name:
                 logger.debug(
                     "Ignoring cached wheel %s for %s as it "
                     "does not match the expected distribution name %s.",
-                    wheel_name,
+                    wheel.filename,
                     link,
                     package_name,
                 )
                 continue
-            if not wheel.supported(supported_tags):
+            priority = min(
+                (tag_priorities[tag] for tag in wheel.tags if tag in tag_priorities),
+                default=None,
+            )
+            if priority is None:
                 # Built for a different python/arch/etc
                 continue
-            candidates.append(
-                (
-                    wheel.support_index_min(supported_tags),
-                    wheel_name,
-                    wheel_dir,
-                )
-            )
+            candidates.append((priority, wheel.filename))
 
         if not candidates:
             return link
 
-        _, wheel_name, wheel_dir = min(candidates)
+        _, wheel_name = min(candidates)
         return Link(path_to_url(os.path.join(wheel_dir, wheel_name)))
 
+    def _get_tag_priorities(self, supported_tags: list[Tag]) -> dict[Tag, int]:
+        # The same list of supported tags is passed for every lookup.
+        if (
+            self._tag_priorities is None
+            or self._tag_priorities[0] is not supported_tags
+        ):
+            priorities: dict[Tag, int] = {}
+            for i, tag in enumerate(supported_tags):
+                priorities.setdefault(tag, i)
+            self._tag_priorities = (supported_tags, priorities)
+        return self._tag_priorities[1]
+
+    def _get_wheels(self, wheel_dir: str) -> list[CachedWheel]:
+        if self._index is None:
+            if not os.path.isdir(wheel_dir):
+                return []
+            return _list_wheels(wheel_dir)
+        return self._index.get_wheels(wheel_dir)
+
+    def close(self) -> None:
+        """Write the changes made to the index of the cache."""
+        if self._index is not None:
+            self._index.close()
+
 
 class EphemWheelCache(SimpleWheelCache):
     """A SimpleWheelCache that creates it's own temporary cache directory"""
@@ -179,7 +374,8 @@ class EphemWheelCache(SimpleWheelCache):
             globally_managed=True,
         )
 
-        super().__init__(self._temp_dir.path)
+        # The directory only lives as long as this process.
+        super().__init__(self._temp_dir.path, use_index=False)
 
 
 class CacheEntry:
@@ -224,6 +420,9 @@ class WheelCache(Cache):
     def get_ephem_path_for_link(self, link: Link) -> str:
         return self._ephem_cache.get_path_for_link(link)
 
+    def close(self) -> None:
+        self._wheel_cache.close()
+
     def get(
         self,
         link: Link,
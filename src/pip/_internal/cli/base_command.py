@@ -244,6 +244,14 @@ class Command(CommandContextMixIn):
                 )
                 options.cache_dir = None
 
+        if options.cache_dir:
+            # Imported here, as not every command inspects the environment.
+            from pip._internal.metadata import installed_index
+
+            self.enter_context(
+                installed_index(os.path.join(options.cache_dir, "installed-v1"))
+            )
+
         if (
             "inprocess-build-deps" in options.features_enabled
             and os.environ.get("PIP_CONSTRAINT", "")
@@ -18,7 +18,14 @@ import re
 import textwrap
 from datetime import datetime, timedelta, timezone
 from functools import partial
-from optparse import SUPPRESS_HELP, Option, OptionGroup, OptionParser, Values
+from optparse import (
+    SUPPRESS_HELP,
+    Option,
+    OptionGroup,
+    OptionParser,
+    OptionValueError,
+    Values,
+)
 from textwrap import dedent
 from typing import Any, Callable
 
@@ -144,11 +151,22 @@ def _package_name_option_check(option: Option, opt: str, value: str) -> str:
     return canonicalize_name(value)
 
 
+def _positive_int_option_check(option: Option, opt: str, value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise OptionValueError(f"option {opt}: invalid integer value: {value!r}")
+    if number < 1:
+        raise OptionValueError(f"option {opt}: value must be at least 1: {value!r}")
+    return number
+
+
 class PipOption(Option):
-    TYPES = Option.TYPES + ("path", "package_name")
+    TYPES = Option.TYPES + ("path", "package_name", "positive_int")
     TYPE_CHECKER = Option.TYPE_CHECKER.copy()
     TYPE_CHECKER["package_name"] = _package_name_option_check
     TYPE_CHECKER["path"] = _path_option_check
+    TYPE_CHECKER["positive_int"] = _positive_int_option_check
 
 
 ###########
@@ -271,6 +289,48 @@ progress_bar: Callable[..., Option] = partial(
     ),
 )
 
+download_concurrency: Callable[..., Option] = partial(
+    PipOption,
+    "--download-concurrency",
+    dest="download_concurrency",
+    type="positive_int",
+    metavar="n",
+    default=1,
+    help=(
+        "Maximum number of distribution files downloaded in parallel, once "
+        "dependencies are resolved. Per-file progress bars are replaced by a "
+        "single progress bar for the batch when this is greater than one. "
+        "(default: %default)"
+    ),
+)
+
+build_concurrency: Callable[..., Option] = partial(
+    PipOption,
+    "--build-concurrency",
+    dest="build_concurrency",
+    type="positive_int",
+    metavar="n",
+    default=1,
+    help=(
+        "Maximum number of wheels built from source in parallel. The output "
+        "of each build is shown once it is done. (default: %default)"
+    ),
+)
+
+install_concurrency: Callable[..., Option] = partial(
+    PipOption,
+    "--install-concurrency",
+    dest="install_concurrency",
+    type="positive_int",
+    metavar="n",
+    default=1,
+    help=(
+        "Maximum number of wheels installed in parallel. Wheels that write "
+        "to the same paths are still installed one after the other. "
+        "(default: %default)"
+    ),
+)
+
 log: Callable[..., Option] = partial(
     PipOption,
     "--log",
@@ -333,6 +393,45 @@ resume_retries: Callable[..., Option] = partial(
     "(default: %default)",
 )
 
+pool_maxsize: Callable[..., Option] = partial(
+    PipOption,
+    "--pool-maxsize",
+    dest="pool_maxsize",
+    type="positive_int",
+    metavar="n",
+    default=10,
+    help=(
+        "Maximum number of connections to each host kept open for reuse by "
+        "later requests. (default: %default)"
+    ),
+)
+
+max_host_connections: Callable[..., Option] = partial(
+    PipOption,
+    "--max-host-connections",
+    dest="max_host_connections",
+    type="positive_int",
+    metavar="n",
+    default=None,
+    help=(
+        "Maximum number of connections opened to each host at the same time. "
+        "Requests wait for a connection to be released once this limit is "
+        "reached, and --pool-maxsize is ignored. (default: no limit)"
+    ),
+)
+
+tcp_keepalive: Callable[..., Option] = partial(
+    Option,
+    "--tcp-keepalive",
+    dest="tcp_keepalive",
+    action="store_true",
+    default=False,
+    help=(
+        "Enable TCP keep-alive probes on HTTP connections, so that idle "
+        "connections kept for reuse are not dropped by proxies or firewalls."
+    ),
+)
+
 timeout: Callable[..., Option] = partial(
     Option,
     "--timeout",
@@ -503,6 +602,34 @@ def uploaded_prior_to() -> Option:
     )
 
 
+index_concurrency: Callable[..., Option] = partial(
+    PipOption,
+    "--index-concurrency",
+    dest="index_concurrency",
+    type="positive_int",
+    metavar="n",
+    default=1,
+    help=(
+        "Maximum number of index pages and --find-links pages fetched in "
+        "parallel when looking up a project. (default: %default)"
+    ),
+)
+
+
+lookup_concurrency: Callable[..., Option] = partial(
+    PipOption,
+    "--lookup-concurrency",
+    dest="lookup_concurrency",
+    type="positive_int",
+    metavar="n",
+    default=1,
+    help=(
+        "Maximum number of projects whose latest version is looked up in "
+        "parallel. (default: %default)"
+    ),
+)
+
+
 def trusted_host() -> Option:
     return Option(
         "--trusted-host",
@@ -1078,6 +1205,21 @@ no_clean: Callable[..., Option] = partial(
     help="Don't clean up build directories.",
 )
 
+resolver_trace: Callable[..., Option] = partial(
+    PipOption,
+    "--resolver-trace",
+    dest="resolver_trace",
+    type="path",
+    metavar="file",
+    default=None,
+    help=(
+        "Record where the resolver spends its time, per project: calls to find "
+        "candidates, metadata preparation, bytes downloaded and backtracking. "
+        "The trace is written to the given file in the Chrome trace event "
+        "format, which can be opened in https://ui.perfetto.dev."
+    ),
+)
+
 pre: Callable[..., Option] = partial(
     Option,
     "--pre",
@@ -1217,8 +1359,14 @@ use_new_feature: Callable[..., Option] = partial(
     default=[],
     choices=[
         "fast-deps",
+        "metadata-prefetch",
+        "parallel-compile",
+        "build-env-cache",
         "build-constraint",
         "inprocess-build-deps",
+        "wheel-store",
+        "pipelined-install",
+        "differential-upgrade",
     ]
     + ALWAYS_ENABLED_FEATURES,
     help="Enable new functionality, that may be backward incompatible.",
@@ -1259,6 +1407,9 @@ general_group: dict[str, Any] = {
         proxy,
         retries,
         timeout,
+        pool_maxsize,
+        max_host_connections,
+        tcp_keepalive,
         exists_action,
         trusted_host,
         cert,
@@ -1282,6 +1433,7 @@ index_group: dict[str, Any] = {
         no_index,
         find_links,
         uploaded_prior_to,
+        index_concurrency,
     ],
 }
 
@@ -11,7 +11,10 @@ from __future__ import annotations
 import contextlib
 import logging
 import os
+import threading
+import time
 from collections.abc import Iterator
+from concurrent.futures import Future, wait
 from functools import lru_cache
 from optparse import Values
 from typing import TYPE_CHECKING
@@ -31,6 +34,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# How long, in seconds from the start of the command, the self-version check
+# may take before its result is discarded.
+SELF_VERSION_CHECK_BUDGET = 2.0
+
 
 @lru_cache
 def _create_truststore_ssl_context() -> SSLContext | None:
@@ -107,6 +114,9 @@ class SessionCommandMixin(CommandContextMixIn):
             trusted_hosts=options.trusted_hosts,
             index_urls=self._get_index_urls(options),
             ssl_context=ssl_context,
+            pool_maxsize=options.pool_maxsize,
+            max_host_connections=options.max_host_connections,
+            tcp_keepalive=options.tcp_keepalive,
         )
 
         # Handle custom ca-bundles from the user
@@ -189,24 +199,52 @@ class IndexGroupCommand(Command, SessionCommandMixin):
             yield
             return
 
-        upgrade_prompt: UpgradePrompt | None = None
+        # The fetch may need a round trip to the index, so it runs in the
+        # background while the command body runs. It is a daemon thread so a
+        # slow index never keeps pip from exiting.
+        deadline = time.monotonic() + SELF_VERSION_CHECK_BUDGET
+        future: Future[UpgradePrompt | None] = Future()
+        threading.Thread(
+            target=self._fetch_upgrade_prompt,
+            args=(options, future),
+            name="pip-self-version-check",
+            daemon=True,
+        ).start()
+
+        try:
+            yield
+        finally:
+            wait([future], timeout=max(0, deadline - time.monotonic()))
+            if not future.done():
+                logger.debug(
+                    "Skipping the pip version check, as it took more than %s "
+                    "seconds.",
+                    SELF_VERSION_CHECK_BUDGET,
+                )
+            else:
+                try:
+                    _pip_self_version_check_emit(future.result())
+                except Exception:
+                    logger.warning(
+                        "There was an error checking the latest version of pip."
+                    )
+                    logger.debug("See below for error", exc_info=True)
+
+    def _fetch_upgrade_prompt(
+        self, options: Values, future: Future[UpgradePrompt | None]
+    ) -> None:
         try:
             session = self._build_session(
                 options,
                 retries=0,
                 timeout=min(5, options.timeout),
             )
+            # The check runs in the background, alongside the command, and
+            # must never ask for credentials.
+            session.auth.prompting = False
             with session:
                 upgrade_prompt = _pip_self_version_check_fetch(session, options)
-        except Exception:
-            logger.warning("There was an error checking the latest version of pip.")
-            logger.debug("See below for error", exc_info=True)
-
-        try:
-            yield
-        finally:
-            try:
-                _pip_self_version_check_emit(upgrade_prompt)
-            except Exception:
-                logger.warning("There was an error checking the latest version of pip.")
-                logger.debug("See below for error", exc_info=True)
+        except Exception as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(upgrade_prompt)
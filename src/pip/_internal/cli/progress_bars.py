@@ -94,6 +94,26 @@ def _rich_install_progress_bar(
             bar.advance(task)
 
 
+def _rich_batch_download_progress_bar(
+    iterable: Iterable[T], *, total: int
+) -> Iterator[T]:
+    columns = (
+        TextColumn("{task.fields[indent]}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("files downloaded"),
+        TimeElapsedColumn(),
+    )
+    console = get_console()
+
+    bar = Progress(*columns, refresh_per_second=5, console=console, transient=True)
+    task = bar.add_task("", total=total, indent=" " * (get_indentation() + 2))
+    with bar:
+        for item in iterable:
+            yield item
+            bar.advance(task)
+
+
 def _raw_progress_bar(
     iterable: Iterable[bytes],
     *,
@@ -141,6 +161,20 @@ def get_download_progress_renderer(
         return iter  # no-op, when passed an iterator
 
 
+def get_batch_download_progress_renderer(
+    *, bar_type: BarType, total: int
+) -> ProgressRenderer[T]:
+    """Get an object that can be used to render the aggregate progress of
+    several downloads running in parallel.
+
+    Returns a callable, that takes an iterable of completed downloads to "wrap".
+    """
+    if bar_type == "on":
+        return functools.partial(_rich_batch_download_progress_bar, total=total)
+    else:
+        return iter
+
+
 def get_install_progress_renderer(
     *, bar_type: BarType, total: int
 ) -> ProgressRenderer[InstallRequirement]:
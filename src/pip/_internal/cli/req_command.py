@@ -3,6 +3,10 @@
 This class is in a separate module so the commands that do not always
 need PackageFinder capability don't unnecessarily import the
 PackageFinder machinery and all its vendored dependencies, etc.
+
+Like its sister module, index_command, this module imports the network and
+resolution machinery lazily, so creating a command (e.g. for ``--help``) or
+running one that never resolves anything doesn't pay for importing them.
 """
 
 from __future__ import annotations
@@ -11,14 +15,8 @@ import logging
 import os
 from functools import partial
 from optparse import Values
-from typing import Any, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
-from pip._internal.build_env import (
-    BuildEnvironmentInstaller,
-    InprocessBuildEnvironmentInstaller,
-    SubprocessBuildEnvironmentInstaller,
-)
-from pip._internal.cache import WheelCache
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.cmdoptions import make_target_python
 from pip._internal.cli.index_command import IndexGroupCommand
@@ -28,36 +26,23 @@ from pip._internal.exceptions import (
     PreviousBuildDirError,
     UnsupportedPythonVersion,
 )
-from pip._internal.index.collector import LinkCollector
-from pip._internal.index.package_finder import PackageFinder
-from pip._internal.models.selection_prefs import SelectionPreferences
-from pip._internal.models.target_python import TargetPython
-from pip._internal.network.session import PipSession
-from pip._internal.operations.build.build_tracker import BuildTracker
-from pip._internal.operations.prepare import RequirementPreparer
-from pip._internal.req.constructors import (
-    install_req_from_editable,
-    install_req_from_line,
-    install_req_from_parsed_requirement,
-    install_req_from_pylock_package,
-    install_req_from_req_string,
-)
-from pip._internal.req.pep723 import PEP723Exception, pep723_metadata
-from pip._internal.req.req_dependency_group import parse_dependency_groups
-from pip._internal.req.req_file import parse_requirements
-from pip._internal.req.req_install import InstallRequirement
-from pip._internal.resolution.base import BaseResolver
-from pip._internal.utils.packaging import check_requires_python
-from pip._internal.utils.pylock import (
-    is_valid_pylock_filename,
-    select_from_pylock_path_or_url,
-)
 from pip._internal.utils.temp_dir import (
     TempDirectory,
     TempDirectoryTypeRegistry,
     tempdir_kinds,
 )
 
+if TYPE_CHECKING:
+    from pip._internal.build_env import BuildEnvironmentInstaller
+    from pip._internal.cache import WheelCache
+    from pip._internal.index.package_finder import PackageFinder
+    from pip._internal.models.target_python import TargetPython
+    from pip._internal.network.session import PipSession
+    from pip._internal.operations.build.build_tracker import BuildTracker
+    from pip._internal.operations.prepare import RequirementPreparer
+    from pip._internal.req.req_install import InstallRequirement
+    from pip._internal.resolution.base import BaseResolver
+
 logger = logging.getLogger(__name__)
 
 
@@ -115,6 +100,9 @@ def parse_constraint_files(
     options: Values,
     session: PipSession,
 ) -> list[InstallRequirement]:
+    from pip._internal.req.constructors import install_req_from_parsed_requirement
+    from pip._internal.req.req_file import parse_requirements
+
     requirements = []
     for filename in constraint_files:
         for parsed_req in parse_requirements(
@@ -140,6 +128,7 @@ class RequirementCommand(IndexGroupCommand):
 
         self.cmd_opts.add_option(cmdoptions.dependency_groups())
         self.cmd_opts.add_option(cmdoptions.no_clean())
+        self.cmd_opts.add_option(cmdoptions.resolver_trace())
 
     @staticmethod
     def determine_resolver_variant(options: Values) -> str:
@@ -164,6 +153,14 @@ class RequirementCommand(IndexGroupCommand):
         """
         Create a RequirementPreparer instance for the given parameters.
         """
+        from pip._internal.build_env import (
+            CachingBuildEnvironmentInstaller,
+            InprocessBuildEnvironmentInstaller,
+            SubprocessBuildEnvironmentInstaller,
+        )
+        from pip._internal.cache import WheelCache
+        from pip._internal.operations.prepare import RequirementPreparer
+
         temp_build_dir_path = temp_build_dir.path
         assert temp_build_dir_path is not None
         legacy_resolver = False
@@ -186,6 +183,11 @@ class RequirementCommand(IndexGroupCommand):
                 logger.warning(
                     "fast-deps has no effect when used with the legacy resolver."
                 )
+            if "metadata-prefetch" in options.features_enabled:
+                logger.warning(
+                    "metadata-prefetch has no effect when used with the legacy "
+                    "resolver."
+                )
 
         # Handle build constraints
         build_constraints = getattr(options, "build_constraints", [])
@@ -211,6 +213,19 @@ class RequirementCommand(IndexGroupCommand):
                 build_constraints=build_constraints,
                 build_constraint_feature_enabled=build_constraint_feature_enabled,
             )
+        if "build-env-cache" in options.features_enabled and options.cache_dir:
+            # Constraints change what gets installed without being part of
+            # the cache key, so don't cache build environments with them.
+            if build_constraints or getattr(options, "constraints", []):
+                logger.warning(
+                    "build-env-cache has no effect when constraints are used."
+                )
+            else:
+                env_installer = CachingBuildEnvironmentInstaller(
+                    env_installer,
+                    finder,
+                    os.path.join(options.cache_dir, "build-env-v1"),
+                )
 
         return RequirementPreparer(
             build_dir=temp_build_dir_path,
@@ -228,6 +243,8 @@ class RequirementCommand(IndexGroupCommand):
             lazy_wheel=lazy_wheel,
             verbosity=verbosity,
             legacy_resolver=legacy_resolver,
+            download_concurrency=options.download_concurrency,
+            metadata_prefetch="metadata-prefetch" in options.features_enabled,
         )
 
     @classmethod
@@ -247,6 +264,8 @@ class RequirementCommand(IndexGroupCommand):
         """
         Create a Resolver instance for the given parameters.
         """
+        from pip._internal.req.constructors import install_req_from_req_string
+
         make_install_req = partial(
             install_req_from_req_string,
             isolated=options.isolated_mode,
@@ -270,9 +289,14 @@ class RequirementCommand(IndexGroupCommand):
                 force_reinstall=force_reinstall,
                 upgrade_strategy=upgrade_strategy,
                 py_version_info=py_version_info,
+                trace_file=getattr(options, "resolver_trace", None),
             )
         import pip._internal.resolution.legacy.resolver
 
+        if getattr(options, "resolver_trace", None):
+            logger.warning(
+                "--resolver-trace has no effect when used with the legacy resolver."
+            )
         return pip._internal.resolution.legacy.resolver.Resolver(
             preparer=preparer,
             finder=finder,
@@ -297,6 +321,22 @@ class RequirementCommand(IndexGroupCommand):
         """
         Parse command-line arguments into the corresponding requirements.
         """
+        from pip._internal.req.constructors import (
+            install_req_from_editable,
+            install_req_from_line,
+            install_req_from_parsed_requirement,
+            install_req_from_pylock_package,
+            install_req_from_req_string,
+        )
+        from pip._internal.req.pep723 import PEP723Exception, pep723_metadata
+        from pip._internal.req.req_dependency_group import parse_dependency_groups
+        from pip._internal.req.req_file import parse_requirements
+        from pip._internal.utils.packaging import check_requires_python
+        from pip._internal.utils.pylock import (
+            is_valid_pylock_filename,
+            select_from_pylock_path_or_url,
+        )
+
         requirements: list[InstallRequirement] = []
 
         if not should_ignore_regular_constraints(options):
@@ -455,6 +495,10 @@ class RequirementCommand(IndexGroupCommand):
         :param ignore_requires_python: Whether to ignore incompatible
             "Requires-Python" values in links. Defaults to False.
         """
+        from pip._internal.index.collector import LinkCollector
+        from pip._internal.index.package_finder import PackageFinder
+        from pip._internal.models.selection_prefs import SelectionPreferences
+
         link_collector = LinkCollector.create(session, options=options)
         selection_prefs = SelectionPreferences(
             allow_yanked=True,
@@ -19,7 +19,7 @@ from pip._vendor.rich.measure import Measurement
 from pip._vendor.rich.text import Text
 
 from pip._internal.utils.compat import WINDOWS
-from pip._internal.utils.logging import get_console, get_indentation
+from pip._internal.utils.logging import get_console, get_indentation, logs_held
 
 logger = logging.getLogger(__name__)
 
@@ -134,8 +134,13 @@ def open_spinner(message: str) -> Generator[SpinnerInterface, None, None]:
     # through the logging system, but it acts like it has level INFO,
     # i.e. it's only displayed if we're at level INFO or better.
     # Non-interactive spinner goes through the logging system, so it is always
-    # in sync with logging configuration.
-    if sys.stdout.isatty() and logger.getEffectiveLevel() <= logging.INFO:
+    # in sync with logging configuration, and holds back its output along
+    # with the rest of the logs of the thread.
+    if (
+        sys.stdout.isatty()
+        and logger.getEffectiveLevel() <= logging.INFO
+        and not logs_held()
+    ):
         spinner: SpinnerInterface = InteractiveSpinner(message)
     else:
         spinner = NonInteractiveSpinner(message)
@@ -3,12 +3,13 @@ import textwrap
 from optparse import Values
 from typing import Callable
 
+from pip._internal.cache import WheelCacheIndex
 from pip._internal.cli.base_command import Command
 from pip._internal.cli.status_codes import ERROR, SUCCESS
 from pip._internal.exceptions import CommandError, PipError
 from pip._internal.utils import filesystem
 from pip._internal.utils.logging import getLogger
-from pip._internal.utils.misc import format_size
+from pip._internal.utils.misc import format_size, rmtree
 
 logger = getLogger(__name__)
 
@@ -103,8 +104,17 @@ class CacheCommand(Command):
         http_cache_size = filesystem.format_size(
             filesystem.directory_size(http_cache_location)
             + filesystem.directory_size(old_http_cache_location)
+            + filesystem.directory_size(self._cache_dir(options, "links-v1"))
         )
         wheels_cache_size = filesystem.format_directory_size(wheels_cache_location)
+        build_env_cache_location = self._cache_dir(options, "build-env-v1")
+        build_env_cache_size = filesystem.format_directory_size(
+            build_env_cache_location
+        )
+        unpacked_wheels_location = self._cache_dir(options, "unpacked-v1")
+        unpacked_wheels_size = filesystem.format_directory_size(
+            unpacked_wheels_location
+        )
 
         message = (
             textwrap.dedent(
@@ -116,6 +126,10 @@ class CacheCommand(Command):
                     Locally built wheels location: {wheels_cache_location}
                     Locally built wheels size: {wheels_cache_size}
                     Number of locally built wheels: {package_count}
+                    Build environments location: {build_env_cache_location}
+                    Build environments size: {build_env_cache_size}
+                    Unpacked wheels location: {unpacked_wheels_location}
+                    Unpacked wheels size: {unpacked_wheels_size}
                 """  # noqa: E501
             )
             .format(
@@ -126,6 +140,10 @@ class CacheCommand(Command):
                 wheels_cache_location=wheels_cache_location,
                 package_count=num_packages,
                 wheels_cache_size=wheels_cache_size,
+                build_env_cache_location=build_env_cache_location,
+                build_env_cache_size=build_env_cache_size,
+                unpacked_wheels_location=unpacked_wheels_location,
+                unpacked_wheels_size=unpacked_wheels_size,
             )
             .strip()
         )
@@ -171,7 +189,8 @@ class CacheCommand(Command):
         if not args:
             raise CommandError("Please provide a pattern")
 
-        files = self._find_wheels(options, args[0])
+        wheels = self._find_wheels(options, args[0])
+        files = list(wheels)
 
         no_matching_msg = "No matching packages"
         if args[0] == "*":
@@ -190,10 +209,17 @@ class CacheCommand(Command):
             os.unlink(filename)
             logger.verbose("Removed %s", filename)
 
+        wheels_dir = self._cache_dir(options, "wheels")
+        wheel_index = WheelCacheIndex(wheels_dir)
+        if args[0] == "*":
+            if os.path.isfile(wheel_index.path):
+                os.remove(wheel_index.path)
+                logger.verbose("Removed wheel cache index")
+        else:
+            wheel_index.discard({os.path.dirname(wheel) for wheel in wheels})
+
         http_dirs = filesystem.subdirs_without_files(self._cache_dir(options, "http"))
-        wheel_dirs = filesystem.subdirs_without_wheels(
-            self._cache_dir(options, "wheels")
-        )
+        wheel_dirs = filesystem.subdirs_without_wheels(wheels_dir)
         dirs = [*http_dirs, *wheel_dirs]
 
         for subdir in dirs:
@@ -206,6 +232,26 @@ class CacheCommand(Command):
                 pass
             logger.verbose("Removed %s", subdir)
 
+        build_env_cache = self._cache_dir(options, "build-env-v1")
+        if args[0] == "*" and os.path.isdir(build_env_cache):
+            rmtree(build_env_cache)
+            logger.verbose("Removed cached build environments")
+
+        wheel_store = self._cache_dir(options, "unpacked-v1")
+        if args[0] == "*" and os.path.isdir(wheel_store):
+            rmtree(wheel_store)
+            logger.verbose("Removed unpacked wheels")
+
+        installed_index = self._cache_dir(options, "installed-v1")
+        if args[0] == "*" and os.path.isdir(installed_index):
+            rmtree(installed_index)
+            logger.verbose("Removed installed distribution index")
+
+        check_state = self._cache_dir(options, "check-v1")
+        if args[0] == "*" and os.path.isdir(check_state):
+            rmtree(check_state)
+            logger.verbose("Removed the state of pip check")
+
         # selfcheck.json is no longer used by pip.
         selfcheck_json = self._cache_dir(options, "selfcheck.json")
         if os.path.isfile(selfcheck_json):
@@ -227,8 +273,11 @@ class CacheCommand(Command):
     def _find_http_files(self, options: Values) -> list[str]:
         old_http_dir = self._cache_dir(options, "http")
         new_http_dir = self._cache_dir(options, "http-v2")
-        return filesystem.find_files(old_http_dir, "*") + filesystem.find_files(
-            new_http_dir, "*"
+        links_dir = self._cache_dir(options, "links-v1")
+        return (
+            filesystem.find_files(old_http_dir, "*")
+            + filesystem.find_files(new_http_dir, "*")
+            + filesystem.find_files(links_dir, "*")
         )
 
     def _find_wheels(self, options: Values, pattern: str) -> list[str]:
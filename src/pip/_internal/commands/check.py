@@ -1,10 +1,12 @@
 import logging
+import os
 from optparse import Values
 
 from pip._internal.cli.base_command import Command
 from pip._internal.cli.status_codes import ERROR, SUCCESS
 from pip._internal.metadata import get_default_environment
 from pip._internal.operations.check import (
+    IncrementalChecker,
     check_package_set,
     check_unsupported,
     create_package_set_from_installed,
@@ -23,8 +25,13 @@ class CheckCommand(Command):
       %prog [options]"""
 
     def run(self, options: Values, args: list[str]) -> int:
-        package_set, parsing_probs = create_package_set_from_installed()
-        missing, conflicting = check_package_set(package_set)
+        if options.cache_dir:
+            checker = IncrementalChecker(os.path.join(options.cache_dir, "check-v1"))
+            versions, (missing, conflicting), parsing_probs = checker.check()
+        else:
+            package_set, parsing_probs = create_package_set_from_installed()
+            missing, conflicting = check_package_set(package_set)
+            versions = {name: details.version for name, details in package_set.items()}
         unsupported = list(
             check_unsupported(
                 get_default_environment().iter_installed_distributions(),
@@ -33,7 +40,7 @@ class CheckCommand(Command):
         )
 
         for project_name in missing:
-            version = package_set[project_name].version
+            version = versions[project_name]
             for dependency in missing[project_name]:
                 write_output(
                     "%s %s requires %s, which is not installed.",
@@ -43,7 +50,7 @@ class CheckCommand(Command):
                 )
 
         for project_name in conflicting:
-            version = package_set[project_name].version
+            version = versions[project_name]
             for dep_name, dep_version, req in conflicting[project_name]:
                 write_output(
                     "%s %s has requirement %s, but you have %s %s.",
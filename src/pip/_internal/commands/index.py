@@ -4,7 +4,7 @@ import json
 import logging
 from collections.abc import Iterable
 from optparse import Values
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.packaging.version import Version
@@ -12,18 +12,14 @@ from pip._vendor.packaging.version import Version
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.req_command import IndexGroupCommand
 from pip._internal.cli.status_codes import ERROR, SUCCESS
-from pip._internal.commands.search import (
-    get_installed_distribution,
-    print_dist_installation_info,
-)
 from pip._internal.exceptions import CommandError, DistributionNotFound, PipError
-from pip._internal.index.collector import LinkCollector
-from pip._internal.index.package_finder import PackageFinder
-from pip._internal.models.selection_prefs import SelectionPreferences
-from pip._internal.models.target_python import TargetPython
-from pip._internal.network.session import PipSession
 from pip._internal.utils.misc import write_output
 
+if TYPE_CHECKING:
+    from pip._internal.index.package_finder import PackageFinder
+    from pip._internal.models.target_python import TargetPython
+    from pip._internal.network.session import PipSession
+
 logger = logging.getLogger(__name__)
 
 
@@ -96,6 +92,10 @@ class IndexCommand(IndexGroupCommand):
         """
         Create a package finder appropriate to the index command.
         """
+        from pip._internal.index.collector import LinkCollector
+        from pip._internal.index.package_finder import PackageFinder
+        from pip._internal.models.selection_prefs import SelectionPreferences
+
         link_collector = LinkCollector.create(session, options=options)
 
         # Pass allow_yanked=False to ignore yanked versions.
@@ -114,6 +114,11 @@ class IndexCommand(IndexGroupCommand):
         )
 
     def get_available_package_versions(self, options: Values, args: list[Any]) -> None:
+        from pip._internal.commands.search import (
+            get_installed_distribution,
+            print_dist_installation_info,
+        )
+
         if len(args) != 1:
             raise CommandError("You need to specify exactly one argument")
 
@@ -43,6 +43,7 @@ from pip._internal.metadata import BaseEnvironment, get_environment
 from pip._internal.models.installation_report import InstallationReport
 from pip._internal.operations.build.build_tracker import get_build_tracker
 from pip._internal.operations.check import ConflictDetails, check_install_conflicts
+from pip._internal.operations.install.wheel import WheelStore
 from pip._internal.req import InstallationResult, install_given_reqs
 from pip._internal.req.req_install import (
     InstallRequirement,
@@ -322,6 +323,9 @@ class InstallCommand(RequirementCommand):
         )
         self.cmd_opts.add_option(cmdoptions.require_hashes())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_concurrency())
+        self.cmd_opts.add_option(cmdoptions.build_concurrency())
+        self.cmd_opts.add_option(cmdoptions.install_concurrency())
         self.cmd_opts.add_option(cmdoptions.root_user_action())
 
         index_opts = cmdoptions.make_option_group(
@@ -367,6 +371,8 @@ class InstallCommand(RequirementCommand):
 
     @with_cleanup
     def run(self, options: Values, args: list[str]) -> int:
+        from pip._internal.operations.prepare import BackgroundPreparer
+
         if options.use_user_site and options.target_dir is not None:
             raise CommandError("Can not combine '--user' and '--target'")
 
@@ -500,12 +506,30 @@ class InstallCommand(RequirementCommand):
                     )
                 return SUCCESS
 
+            to_install = resolver.get_installation_order(requirement_set)
+
             # If there is any more preparation to do for the actual installation, do
             # so now. This includes actually downloading the files in the case that
             # we have been using PEP-658 metadata so far.
-            preparer.prepare_linked_requirements_more(
-                requirement_set.requirements.values()
-            )
+            reqs_to_prepare = list(requirement_set.requirements.values())
+            wheels_to_prepare = []
+            if "pipelined-install" in options.features_enabled:
+                # Wheels don't need to be built, so they are downloaded in the
+                # background instead, in installation order, and each is
+                # installed once downloaded.
+                wheels_to_prepare = [
+                    r for r in to_install if r.needs_more_preparation and r.is_wheel
+                ]
+                reqs_to_prepare = [
+                    r for r in reqs_to_prepare if r not in wheels_to_prepare
+                ]
+            preparer.prepare_linked_requirements_more(reqs_to_prepare)
+            wait_for_preparation = None
+            if wheels_to_prepare:
+                background_preparer = self.enter_context(
+                    BackgroundPreparer(preparer, wheels_to_prepare)
+                )
+                wait_for_preparation = background_preparer.wait
 
             try:
                 pip_req = requirement_set.get_requirement("pip")
@@ -525,13 +549,12 @@ class InstallCommand(RequirementCommand):
                 reqs_to_build,
                 wheel_cache=wheel_cache,
                 verify=True,
+                concurrency=options.build_concurrency,
             )
 
             if build_failures:
                 raise InstallWheelBuildError(build_failures)
 
-            to_install = resolver.get_installation_order(requirement_set)
-
             # Check for conflicts in the package set we're installing.
             conflicts: ConflictDetails | None = None
             should_warn_about_conflicts = (
@@ -553,6 +576,10 @@ class InstallCommand(RequirementCommand):
             finally:
                 _prevent_further_imports()
 
+            wheel_store = None
+            if "wheel-store" in options.features_enabled and options.cache_dir:
+                wheel_store = WheelStore(os.path.join(options.cache_dir, "unpacked-v1"))
+
             installed = install_given_reqs(
                 to_install,
                 root=options.root_path,
@@ -562,6 +589,11 @@ class InstallCommand(RequirementCommand):
                 use_user_site=options.use_user_site,
                 pycompile=options.compile,
                 progress_bar=options.progress_bar,
+                parallel_pycompile="parallel-compile" in options.features_enabled,
+                concurrency=options.install_concurrency,
+                wheel_store=wheel_store,
+                wait_for_preparation=wait_for_preparation,
+                differential_upgrade="differential-upgrade" in options.features_enabled,
             )
 
             lib_locations = get_lib_location_guesses(
@@ -4,6 +4,7 @@ import contextlib
 import json
 import logging
 from collections.abc import Generator, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from email.parser import Parser
 from optparse import Values
 from typing import TYPE_CHECKING, cast
@@ -125,6 +126,7 @@ class ListCommand(IndexGroupCommand):
             default=True,
         )
         self.cmd_opts.add_option(cmdoptions.list_exclude())
+        self.cmd_opts.add_option(cmdoptions.lookup_concurrency())
         index_opts = cmdoptions.make_option_group(cmdoptions.index_group, self.parser)
 
         selection_opts = cmdoptions.make_option_group(
@@ -275,9 +277,27 @@ class ListCommand(IndexGroupCommand):
                 dist.latest_filetype = typ
                 return dist
 
-            for dist in map(latest_info, packages):
-                if dist is not None:
-                    yield dist
+            if options.lookup_concurrency == 1 or len(packages) < 2:
+                for dist in map(latest_info, packages):
+                    if dist is not None:
+                        yield dist
+                return
+
+            # The project pages are fetched in parallel through the shared
+            # session, and the results are still yielded in order.
+            with ThreadPoolExecutor(
+                options.lookup_concurrency, thread_name_prefix="pip-list"
+            ) as executor:
+                futures = [executor.submit(latest_info, dist) for dist in packages]
+                try:
+                    for future in futures:
+                        dist = future.result()
+                        if dist is not None:
+                            yield dist
+                finally:
+                    # Don't look up projects that are no longer needed.
+                    for future in futures:
+                        future.cancel()
 
     def output_package_listing(
         self, packages: _ProcessedDists, options: Values
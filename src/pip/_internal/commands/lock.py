@@ -76,6 +76,7 @@ class LockCommand(RequirementCommand):
 
         self.cmd_opts.add_option(cmdoptions.require_hashes())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_concurrency())
 
         index_opts = cmdoptions.make_option_group(
             cmdoptions.index_group,
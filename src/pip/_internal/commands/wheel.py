@@ -63,6 +63,8 @@ class WheelCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.ignore_requires_python())
         self.cmd_opts.add_option(cmdoptions.no_deps())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_concurrency())
+        self.cmd_opts.add_option(cmdoptions.build_concurrency())
 
         self.cmd_opts.add_option(
             "--no-verify",
@@ -151,6 +153,7 @@ class WheelCommand(RequirementCommand):
             reqs_to_build,
             wheel_cache=wheel_cache,
             verify=(not options.no_verify),
+            concurrency=options.build_concurrency,
         )
         for req in build_successes:
             assert req.link and req.link.is_wheel
@@ -13,12 +13,14 @@ import logging
 import os
 import urllib.parse
 from collections.abc import Iterable, MutableMapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from html.parser import HTMLParser
 from optparse import Values
 from typing import (
     Callable,
     NamedTuple,
+    Optional,
     Protocol,
 )
 
@@ -33,15 +35,21 @@ from pip._internal.network.session import PipSession
 from pip._internal.network.utils import raise_for_status
 from pip._internal.utils.filetypes import is_archive_file
 from pip._internal.utils.misc import redact_auth_from_url
+from pip._internal.utils.tracing import trace_bytes
 from pip._internal.utils.urls import url_to_path
 from pip._internal.vcs import vcs
 
-from .sources import CandidatesFromPage, LinkSource, build_source
+from .page_cache import ParsedPageCache
+from .sources import CandidatesFromPage, LinkSource, build_source, prefetch_source
 
 logger = logging.getLogger(__name__)
 
 ResponseHeaders = MutableMapping[str, str]
 
+# A callable deciding from a file's URL, "Requires-Python" value and yanked
+# reason, as listed by an index page, whether a Link is worth creating for it.
+FileFilter = Callable[[str, Optional[str], Optional[str]], bool]
+
 
 def _match_vcs_scheme(url: str) -> str | None:
     """Look for VCS schemes in the URL.
@@ -244,6 +252,29 @@ def parse_links(page: IndexContent) -> Iterable[Link]:
         yield link
 
 
+def _parse_json_links(page: IndexContent, file_filter: FileFilter) -> Iterable[Link]:
+    """
+    Parse a Simple API JSON response, skipping the files rejected by
+    file_filter before creating a Link for them.
+    """
+    data = json.loads(page.content)
+    for file in data.get("files", []):
+        url = file.get("url")
+        if url is None:
+            continue
+        yanked = file.get("yanked")
+        if isinstance(yanked, str):
+            yanked_reason: str | None = yanked
+        else:
+            yanked_reason = "" if yanked else None
+        if not file_filter(url, file.get("requires-python"), yanked_reason):
+            continue
+        link = Link.from_json(file, page.url)
+        if link is None:
+            continue
+        yield link
+
+
 @dataclass(frozen=True)
 class IndexContent:
     """Represents one response (or page), along with its URL.
@@ -253,6 +284,8 @@ class IndexContent:
     :param cache_link_parsing: whether links parsed from this page's url
                                should be cached. PyPI index urls should
                                have this set to False, for example.
+    :param etag: the ETag header of the response, if any.
+    :param last_modified: the Last-Modified header of the response, if any.
     """
 
     content: bytes
@@ -260,6 +293,8 @@ class IndexContent:
     encoding: str | None
     url: str
     cache_link_parsing: bool = True
+    etag: str | None = None
+    last_modified: str | None = None
 
     def __str__(self) -> str:
         return redact_auth_from_url(self.url)
@@ -307,12 +342,16 @@ def _make_index_content(
     response: Response, cache_link_parsing: bool = True
 ) -> IndexContent:
     encoding = _get_encoding_from_headers(response.headers)
+    if not getattr(response, "from_cache", False):
+        trace_bytes(len(response.content))
     return IndexContent(
         response.content,
         response.headers["Content-Type"],
         encoding=encoding,
         url=response.url,
         cache_link_parsing=cache_link_parsing,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
     )
 
 
@@ -393,9 +432,21 @@ class LinkCollector:
         self,
         session: PipSession,
         search_scope: SearchScope,
+        index_concurrency: int = 1,
+        page_cache: ParsedPageCache | None = None,
     ) -> None:
+        """
+        :param index_concurrency: The maximum number of pages fetched in
+            parallel for a single project. Pages are fetched serially if
+            this is 1.
+        :param page_cache: A cache of the links parsed from index pages,
+            persisted across runs.
+        """
         self.search_scope = search_scope
         self.session = session
+        self.index_concurrency = index_concurrency
+        self.page_cache = page_cache
+        self._executor: ThreadPoolExecutor | None = None
 
     @classmethod
     def create(
@@ -425,9 +476,14 @@ class LinkCollector:
             index_urls=index_urls,
             no_index=options.no_index,
         )
+        page_cache = None
+        if options.cache_dir:
+            page_cache = ParsedPageCache(os.path.join(options.cache_dir, "links-v1"))
         link_collector = LinkCollector(
             session=session,
             search_scope=search_scope,
+            index_concurrency=options.index_concurrency,
+            page_cache=page_cache,
         )
         return link_collector
 
@@ -441,6 +497,56 @@ class LinkCollector:
         """
         return _get_index_content(location, session=self.session)
 
+    def parse_links(
+        self, page: IndexContent, file_filter: FileFilter | None = None
+    ) -> list[Link]:
+        """
+        Parse the links of a page, reusing those cached from a previous run
+        if the page has not changed since.
+
+        :param file_filter: If given, files it rejects may be left out of the
+            returned links, which avoids creating a Link for each of them.
+            Links it rejects may still be returned.
+        """
+        if self.page_cache is not None and self.page_cache.can_cache(page):
+            links = self.page_cache.get(page, file_filter)
+            if links is None:
+                links = list(parse_links(page))
+                self.page_cache.set(page, links)
+            return links
+        # Pages parsed with the in-memory cache are shared by all projects,
+        # so they cannot be filtered.
+        if (
+            file_filter is not None
+            and not page.cache_link_parsing
+            and page.content_type.lower().startswith(
+                "application/vnd.pypi.simple.v1+json"
+            )
+        ):
+            return list(_parse_json_links(page, file_filter))
+        return list(parse_links(page))
+
+    def _prefetch_sources(
+        self, sources: Iterable[LinkSource | None]
+    ) -> list[LinkSource | None]:
+        """
+        Start fetching the pages of the given sources in parallel.
+
+        The returned sources are in the same order as the given ones, and
+        block on iteration until their page has been fetched and parsed.
+        The worker threads share this collector's session, and therefore
+        its connection pool.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.index_concurrency,
+                thread_name_prefix="pip-index",
+            )
+        return [
+            None if source is None else prefetch_source(source, self._executor)
+            for source in sources
+        ]
+
     def collect_sources(
         self,
         project_name: str,
@@ -482,7 +588,13 @@ class LinkCollector:
             ] + lines
             logger.debug("\n".join(lines))
 
+        find_links_list = list(find_links_sources)
+        index_urls_list = list(index_url_sources)
+        if self.index_concurrency > 1:
+            find_links_list = self._prefetch_sources(find_links_list)
+            index_urls_list = self._prefetch_sources(index_urls_list)
+
         return CollectedSources(
-            find_links=list(find_links_sources),
-            index_urls=list(index_url_sources),
+            find_links=find_links_list,
+            index_urls=index_urls_list,
         )
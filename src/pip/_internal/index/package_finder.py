@@ -7,8 +7,11 @@ import enum
 import functools
 import itertools
 import logging
+import posixpath
 import re
-from collections.abc import Iterable
+import threading
+import urllib.parse
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
@@ -29,7 +32,7 @@ from pip._internal.exceptions import (
     InvalidWheelFilename,
     UnsupportedWheel,
 )
-from pip._internal.index.collector import LinkCollector, parse_links
+from pip._internal.index.collector import LinkCollector
 from pip._internal.metadata import select_backend
 from pip._internal.models.candidate import InstallationCandidate
 from pip._internal.models.format_control import FormatControl
@@ -44,8 +47,9 @@ from pip._internal.utils._log import getLogger
 from pip._internal.utils.filetypes import WHEEL_EXTENSION
 from pip._internal.utils.hashes import Hashes
 from pip._internal.utils.logging import indent_log
-from pip._internal.utils.misc import build_netloc
+from pip._internal.utils.misc import build_netloc, redact_auth_from_url
 from pip._internal.utils.packaging import check_requires_python
+from pip._internal.utils.tracing import trace_span
 from pip._internal.utils.unpacking import SUPPORTED_EXTENSIONS
 
 if TYPE_CHECKING:
@@ -107,6 +111,31 @@ def _check_link_requires_python(
     return True
 
 
+def _unsupported_wheel_reason(wheel: Wheel) -> str:
+    # Include the wheel's tags in the reason string to
+    # simplify troubleshooting compatibility issues.
+    file_tags = ", ".join(wheel.get_formatted_file_tags())
+    return (
+        f"none of the wheel's tags ({file_tags}) are compatible "
+        f"(run pip debug --verbose to show compatible tags)"
+    )
+
+
+def _requires_python_mismatch_reason(version: str, requires_python: str | None) -> str:
+    if requires_python:
+
+        def get_version_sort_key(v: str) -> tuple[int, ...]:
+            return tuple(int(s) for s in v.split(".") if s.isdigit())
+
+        requires_python = ",".join(
+            sorted(
+                (str(s) for s in specifiers.SpecifierSet(requires_python)),
+                key=get_version_sort_key,
+            )
+        )
+    return f"{version} Requires-Python {requires_python}"
+
+
 class LinkType(enum.Enum):
     candidate = enum.auto()
     different_project = enum.auto()
@@ -215,13 +244,7 @@ class LinkEvaluator:
 
                 supported_tags = self._target_python.get_unsorted_tags()
                 if not wheel.supported(supported_tags):
-                    # Include the wheel's tags in the reason string to
-                    # simplify troubleshooting compatibility issues.
-                    file_tags = ", ".join(wheel.get_formatted_file_tags())
-                    reason = (
-                        f"none of the wheel's tags ({file_tags}) are compatible "
-                        f"(run pip debug --verbose to show compatible tags)"
-                    )
+                    reason = _unsupported_wheel_reason(wheel)
                     return (LinkType.platform_mismatch, reason)
 
                 version = wheel.version
@@ -277,25 +300,77 @@ class LinkEvaluator:
             ignore_requires_python=self._ignore_requires_python,
         )
         if not supports_python:
-            requires_python = link.requires_python
-            if requires_python:
-
-                def get_version_sort_key(v: str) -> tuple[int, ...]:
-                    return tuple(int(s) for s in v.split(".") if s.isdigit())
-
-                requires_python = ",".join(
-                    sorted(
-                        (str(s) for s in specifiers.SpecifierSet(requires_python)),
-                        key=get_version_sort_key,
-                    )
-                )
-            reason = f"{version} Requires-Python {requires_python}"
+            reason = _requires_python_mismatch_reason(version, link.requires_python)
             return (LinkType.requires_python_mismatch, reason)
 
         logger.debug("Found link %s, version: %s", link, version)
 
         return (LinkType.candidate, version)
 
+    def evaluate_file(
+        self, url: str, requires_python: str | None, yanked_reason: str | None
+    ) -> tuple[LinkType, str] | None:
+        """
+        Cheaply determine whether a file listed by an index page is rejected,
+        before a Link is created for it.
+
+        Only wheels are evaluated here, based on their filename and on the
+        "Requires-Python" and yanked values of the index page.
+
+        :return: The (result, detail) tuple evaluate_link() would return for
+            a link to the file if it is rejected, or None if the file needs
+            a full evaluation with evaluate_link().
+        """
+        parsed_url = urllib.parse.urlsplit(url)
+        if "egg=" in parsed_url.fragment:
+            return None
+        filename = urllib.parse.unquote(posixpath.basename(parsed_url.path))
+        if not filename.endswith(WHEEL_EXTENSION):
+            return None
+
+        if yanked_reason is not None and not self._allow_yanked:
+            reason = yanked_reason or "<none given>"
+            return (LinkType.yanked, f"yanked for reason: {reason}")
+        if "binary" not in self._formats:
+            reason = f"No binaries permitted for {self.project_name}"
+            return (LinkType.format_unsupported, reason)
+        try:
+            wheel = Wheel(filename)
+        except InvalidWheelFilename:
+            return None
+        if wheel.name != self._canonical_name:
+            reason = f"wrong project name (not {self.project_name})"
+            return (LinkType.different_project, reason)
+        if not wheel.supported(self._target_python.get_unsorted_tags()):
+            return (LinkType.platform_mismatch, _unsupported_wheel_reason(wheel))
+
+        # Links without upload times are rejected with an error, which must
+        # happen before the Requires-Python check.
+        if (
+            not requires_python
+            or self._ignore_requires_python
+            or self._uploaded_prior_to is not None
+            or self._py_version_re.search(wheel.version)
+        ):
+            return None
+        try:
+            is_compatible = check_requires_python(
+                requires_python,
+                version_info=self._target_python.py_version_info,
+            )
+        except specifiers.InvalidSpecifier:
+            return None
+        if is_compatible:
+            return None
+        logger.verbose(
+            "Link requires a different Python (%s not in: %r): %s",
+            ".".join(map(str, self._target_python.py_version_info)),
+            requires_python,
+            url,
+        )
+        reason = _requires_python_mismatch_reason(wheel.version, requires_python)
+        return (LinkType.requires_python_mismatch, reason)
+
 
 def filter_unallowed_hashes(
     candidates: list[InstallationCandidate],
@@ -448,6 +523,7 @@ class CandidateEvaluator:
             prefer_binary=prefer_binary,
             release_control=release_control,
             hashes=hashes,
+            tag_priorities=target_python.get_tag_priorities(),
         )
 
     def __init__(
@@ -458,10 +534,13 @@ class CandidateEvaluator:
         prefer_binary: bool = False,
         release_control: ReleaseControl | None = None,
         hashes: Hashes | None = None,
+        tag_priorities: Mapping[Tag, int] | None = None,
     ) -> None:
         """
         :param supported_tags: The PEP 425 tags supported by the target
             Python in order of preference (most preferred first).
+        :param tag_priorities: A mapping from each of the supported tags to
+            its index in supported_tags, if already computed.
         """
         self._release_control = release_control
         self._hashes = hashes
@@ -472,9 +551,9 @@ class CandidateEvaluator:
         # Since the index of the tag in the _supported_tags list is used
         # as a priority, precompute a map from tag to index/priority to be
         # used in wheel.find_most_preferred_tag.
-        self._wheel_tag_preferences = {
-            tag: idx for idx, tag in enumerate(supported_tags)
-        }
+        if tag_priorities is None:
+            tag_priorities = {tag: idx for idx, tag in enumerate(supported_tags)}
+        self._wheel_tag_preferences = tag_priorities
 
     def get_applicable_candidates(
         self,
@@ -659,6 +738,9 @@ class PackageFinder:
 
         # Cache of the result of finding candidates
         self._all_candidates: dict[str, list[InstallationCandidate]] = {}
+        # Serialize concurrent lookups of the same project, so its pages are
+        # only fetched once.
+        self._all_candidates_locks: dict[str, threading.Lock] = {}
         self._best_candidates: dict[
             tuple[str, specifiers.BaseSpecifier | None, Hashes | None],
             BestCandidateResult,
@@ -798,9 +880,14 @@ class PackageFinder:
                     no_eggs.append(link)
         return no_eggs + eggs
 
-    def _log_skipped_link(self, link: Link, result: LinkType, detail: str) -> None:
+    def _log_skipped_link(
+        self, link: Link | str, result: LinkType, detail: str
+    ) -> None:
         # Put the link at the end so the reason is more visible and because
-        # the link string is usually very long.
+        # the link string is usually very long. Links redact their own
+        # credentials when formatted, raw URLs need to be redacted here.
+        if isinstance(link, str):
+            link = redact_auth_from_url(link)
         logger.debug("Skipping link: %s: %s", detail, link)
         if result == LinkType.requires_python_mismatch:
             self._requires_python_skipped.add(detail)
@@ -855,7 +942,18 @@ class PackageFinder:
         if index_response is None:
             return []
 
-        page_links = list(parse_links(index_response))
+        def accepts_file(
+            url: str, requires_python: str | None, yanked_reason: str | None
+        ) -> bool:
+            rejection = link_evaluator.evaluate_file(
+                url, requires_python, yanked_reason
+            )
+            if rejection is None:
+                return True
+            self._log_skipped_link(url, *rejection)
+            return False
+
+        page_links = self._link_collector.parse_links(index_response, accepts_file)
 
         with indent_log():
             package_links = self.evaluate_links(
@@ -877,6 +975,15 @@ class PackageFinder:
         if project_name in self._all_candidates:
             return self._all_candidates[project_name]
 
+        with self._all_candidates_locks.setdefault(project_name, threading.Lock()):
+            if project_name not in self._all_candidates:
+                with trace_span("find_all_candidates", project_name):
+                    self._all_candidates[project_name] = self._find_all_candidates(
+                        project_name
+                    )
+        return self._all_candidates[project_name]
+
+    def _find_all_candidates(self, project_name: str) -> list[InstallationCandidate]:
         link_evaluator = self.make_link_evaluator(project_name)
 
         collected_sources = self._link_collector.collect_sources(
@@ -918,9 +1025,7 @@ class PackageFinder:
             logger.debug("Local files found: %s", ", ".join(paths))
 
         # This is an intentional priority ordering
-        self._all_candidates[project_name] = file_candidates + page_candidates
-
-        return self._all_candidates[project_name]
+        return file_candidates + page_candidates
 
     def make_candidate_evaluator(
         self,
@@ -0,0 +1,123 @@
+"""Persistent cache of the links parsed from index pages."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from typing import TYPE_CHECKING, Any
+
+from pip._vendor import msgpack
+
+from pip._internal.models.link import Link, MetadataFile
+from pip._internal.network.cache import suppressed_cache_errors
+from pip._internal.utils.datetime import parse_iso_datetime
+from pip._internal.utils.filesystem import adjacent_tmp_file, replace
+from pip._internal.utils.misc import ensure_dir
+
+if TYPE_CHECKING:
+    from pip._internal.index.collector import FileFilter, IndexContent
+
+logger = logging.getLogger(__name__)
+
+# Bump this when the serialized form of a link changes.
+_FORMAT_VERSION = 1
+
+
+def _serialize_link(link: Link) -> list[Any]:
+    metadata_file_data = link.metadata_file_data
+    return [
+        link.url,
+        link.comes_from,
+        link.requires_python,
+        link.yanked_reason,
+        # A metadata file without hashes is stored as an empty mapping.
+        None if metadata_file_data is None else (metadata_file_data.hashes or {}),
+        None if link.upload_time is None else link.upload_time.isoformat(),
+        link.hashes,
+    ]
+
+
+def _deserialize_link(row: list[Any]) -> Link:
+    url, comes_from, requires_python, yanked_reason, metadata, upload, hashes = row
+    return Link(
+        url,
+        comes_from=comes_from,
+        requires_python=requires_python,
+        yanked_reason=yanked_reason,
+        metadata_file_data=(
+            None if metadata is None else MetadataFile(metadata or None)
+        ),
+        upload_time=None if upload is None else parse_iso_datetime(upload),
+        hashes=hashes,
+    )
+
+
+class ParsedPageCache:
+    """An on-disk cache of the links parsed from index pages.
+
+    Entries are keyed by the URL, Content-Type and validators (ETag and
+    Last-Modified) of a page. As long as the server reports the same
+    validators for a page, which is what makes a conditional GET return 304,
+    the page is not parsed again. Pages without any validator are not cached.
+    """
+
+    def __init__(self, directory: str) -> None:
+        assert directory is not None, "Cache directory must not be None."
+        self.directory = directory
+
+    def can_cache(self, page: IndexContent) -> bool:
+        return page.etag is not None or page.last_modified is not None
+
+    def _get_cache_path(self, page: IndexContent) -> str | None:
+        if not self.can_cache(page):
+            return None
+        key = {
+            "url": page.url,
+            "content_type": page.content_type,
+            "etag": page.etag,
+            "last_modified": page.last_modified,
+        }
+        s = json.dumps(key, sort_keys=True, separators=(",", ":"))
+        hashed = hashlib.sha224(s.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, hashed[:2], hashed[2:4], hashed[4:])
+
+    def get(
+        self, page: IndexContent, file_filter: FileFilter | None = None
+    ) -> list[Link] | None:
+        """Return the links cached for the page, or None on a cache miss.
+
+        Files rejected by file_filter are left out of the returned links.
+        """
+        path = self._get_cache_path(page)
+        if path is None or not os.path.exists(path):
+            return None
+        with suppressed_cache_errors():
+            with open(path, "rb") as f:
+                data = f.read()
+            try:
+                version, rows = msgpack.unpackb(data, raw=False)
+                if version == _FORMAT_VERSION:
+                    return [
+                        _deserialize_link(row)
+                        for row in rows
+                        if file_filter is None or file_filter(row[0], row[2], row[3])
+                    ]
+            except Exception as exc:
+                logger.debug("Ignoring invalid cache entry %s: %s", path, exc)
+        return None
+
+    def set(self, page: IndexContent, links: list[Link]) -> None:
+        path = self._get_cache_path(page)
+        if path is None:
+            return
+        data = msgpack.packb(
+            [_FORMAT_VERSION, [_serialize_link(link) for link in links]],
+            use_bin_type=True,
+        )
+        with suppressed_cache_errors():
+            ensure_dir(os.path.dirname(path))
+            with adjacent_tmp_file(path) as f:
+                f.write(data)
+            replace(f.name, path)
@@ -5,6 +5,7 @@ import mimetypes
 import os
 from collections import defaultdict
 from collections.abc import Iterable
+from concurrent.futures import Executor, Future
 from typing import Callable
 
 from pip._vendor.packaging.utils import (
@@ -225,6 +226,46 @@ class _IndexDirectorySource(LinkSource):
         return ()
 
 
+class _PrefetchedSource(LinkSource):
+    """Wraps a source whose page candidates are computed in the background.
+
+    ``page_candidates`` blocks until the background computation finishes and
+    re-raises any exception it raised, so consumers observe the same results
+    (and the same errors) as if the wrapped source had been iterated directly.
+    """
+
+    def __init__(
+        self,
+        source: LinkSource,
+        page_candidates: Future[list[InstallationCandidate]],
+    ) -> None:
+        self._source = source
+        self._page_candidates = page_candidates
+
+    @property
+    def link(self) -> Link | None:
+        return self._source.link
+
+    def page_candidates(self) -> FoundCandidates:
+        yield from self._page_candidates.result()
+
+    def file_links(self) -> FoundLinks:
+        return self._source.file_links()
+
+
+def prefetch_source(source: LinkSource, executor: Executor) -> LinkSource:
+    """Start collecting the page candidates of ``source`` on ``executor``.
+
+    Only sources backed by a remote page are worth prefetching; local sources
+    are returned unchanged.
+    """
+    link = source.link
+    if link is None or link.is_file:
+        return source
+    future = executor.submit(lambda: list(source.page_candidates()))
+    return _PrefetchedSource(source, future)
+
+
 def build_source(
     location: str,
     *,
@@ -4,6 +4,7 @@ import contextlib
 import functools
 import os
 import sys
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Literal, Protocol, cast
 
 from pip._internal.utils.deprecation import deprecated
@@ -22,10 +23,14 @@ __all__ = [
     "Wheel",
     "get_default_environment",
     "get_environment",
+    "get_installed_index_directory",
     "get_wheel_distribution",
+    "installed_index",
     "select_backend",
 ]
 
+_installed_index_directory: str | None = None
+
 
 def _should_use_importlib_metadata() -> bool:
     """Whether to use the ``importlib.metadata`` or ``pkg_resources`` backend.
@@ -105,6 +110,29 @@ def select_backend() -> Backend:
     return cast(Backend, pkg_resources)
 
 
+@contextlib.contextmanager
+def installed_index(directory: str) -> Iterator[None]:
+    """Keep an index of the installed distributions in ``directory``.
+
+    While this is active, environments record the name, version, dependencies
+    and extras of the distributions found in each location, so these are not
+    read from the distributions' metadata again until it changes. This is only
+    implemented by the ``importlib.metadata`` backend.
+    """
+    global _installed_index_directory
+    previous = _installed_index_directory
+    _installed_index_directory = directory
+    try:
+        yield
+    finally:
+        _installed_index_directory = previous
+
+
+def get_installed_index_directory() -> str | None:
+    """Get the directory set by :func:`installed_index`, if any."""
+    return _installed_index_directory
+
+
 def get_default_environment() -> BaseEnvironment:
     """Get the default representation for the current environment.
 
@@ -223,7 +223,7 @@ class Distribution(BaseDistribution):
 
     def iter_dependencies(self, extras: Collection[str] = ()) -> Iterable[Requirement]:
         contexts: Sequence[dict[str, str]] = [{"extra": e} for e in extras]
-        for req_string in self.metadata.get_all("Requires-Dist", []):
+        for req_string in self.iter_raw_dependencies():
             # strip() because email.message.Message.get_all() may return a leading \n
             # in case a long header was wrapped.
             req = get_requirement(req_string.strip())
@@ -6,7 +6,7 @@ import os
 import pathlib
 import sys
 import zipfile
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from typing import Optional
 
 from pip._vendor.packaging.utils import (
@@ -21,6 +21,7 @@ from pip._internal.utils.filetypes import WHEEL_EXTENSION
 
 from ._compat import BadMetadata, BasePath, get_dist_canonical_name, get_info_location
 from ._dists import Distribution
+from ._index import get_indexed_distributions
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +82,10 @@ class _DistributionFinder:
 
         The path can be either a directory, or a ZIP archive.
         """
+        indexed = get_indexed_distributions(location)
+        if indexed is not None:
+            yield from self._find_indexed(indexed)
+            return
         for dist, info_location in self._find_impl(location):
             if info_location is None:
                 installed_location: BasePath | None = None
@@ -88,6 +93,20 @@ class _DistributionFinder:
                 installed_location = info_location.parent
             yield Distribution(dist, info_location, installed_location)
 
+    def _find_indexed(
+        self, distributions: Iterable[BaseDistribution]
+    ) -> Iterator[BaseDistribution]:
+        for dist in distributions:
+            try:
+                name = dist.canonical_name
+            except BadMetadata as e:
+                logger.warning("Skipping %s due to %s", dist.info_location, e.reason)
+                continue
+            if name in self._found_names:
+                continue
+            self._found_names.add(name)
+            yield dist
+
     def find_legacy_editables(self, location: str) -> Iterator[BaseDistribution]:
         """Read location in egg-link files and return distributions in there.
 
@@ -0,0 +1,240 @@
+"""Persistent index of the distributions installed in a location."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import pathlib
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Optional
+
+from pip._vendor.packaging.utils import NormalizedName
+from pip._vendor.packaging.version import Version
+from pip._vendor.packaging.version import parse as parse_version
+
+from pip._internal.metadata import get_installed_index_directory
+from pip._internal.utils.filesystem import adjacent_tmp_file, replace
+from pip._internal.utils.misc import ensure_dir
+
+from ._compat import get_info_location
+from ._dists import Distribution
+
+logger = logging.getLogger(__name__)
+
+# Bump this when the serialized form of the index changes.
+_FORMAT_VERSION = 1
+
+# Files whose contents end up in an entry. They are stamped along with their
+# metadata directory, since rewriting a file in place does not change the
+# modification time of the directory containing it.
+_METADATA_FILES = ("METADATA", "PKG-INFO", "requires.txt")
+
+# A path modified this recently (in nanoseconds) may be modified again without
+# its modification time changing, on filesystems with a coarse resolution.
+_RACY_WINDOW_NS = 2 * 10**9
+
+Stamp = list[Optional[list[int]]]
+
+
+def _stat(path: str) -> list[int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_ino, st.st_size]
+
+
+def _get_stamp(*paths: str) -> Stamp | None:
+    """Stamp the given paths, or return None if any was modified too recently
+    for the stamp to be trusted."""
+    stamp = [_stat(path) for path in paths]
+    now = time.time_ns()
+    if any(s is not None and now - s[0] < _RACY_WINDOW_NS for s in stamp):
+        return None
+    return stamp
+
+
+def _get_entry_stamp(info_location: pathlib.Path) -> Stamp | None:
+    return _get_stamp(
+        str(info_location),
+        *(str(info_location / name) for name in _METADATA_FILES),
+    )
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """The metadata pip most often needs from an installed distribution."""
+
+    stamp: Stamp
+    name: NormalizedName
+    version: str
+    requires: list[str]
+    extras: list[NormalizedName]
+
+    @classmethod
+    def from_distribution(cls, dist: Distribution, stamp: Stamp) -> IndexEntry:
+        return cls(
+            stamp=stamp,
+            name=dist.canonical_name,
+            version=str(dist.version),
+            requires=list(dist.iter_raw_dependencies()),
+            extras=list(dist.iter_provided_extras()),
+        )
+
+
+class IndexedDistribution(Distribution):
+    """A distribution whose name, version, dependencies and extras are read
+    from an index entry instead of its metadata."""
+
+    def __init__(
+        self,
+        dist: importlib.metadata.Distribution,
+        info_location: pathlib.Path,
+        entry: IndexEntry,
+    ) -> None:
+        super().__init__(dist, info_location, info_location.parent)
+        self.entry = entry
+
+    @property
+    def canonical_name(self) -> NormalizedName:
+        return self.entry.name
+
+    @property
+    def version(self) -> Version:
+        return parse_version(self.entry.version)
+
+    def iter_raw_dependencies(self) -> list[str]:
+        return self.entry.requires
+
+    def iter_provided_extras(self) -> list[NormalizedName]:
+        return self.entry.extras
+
+
+class LocationIndex:
+    """An on-disk index of the distributions found in a directory.
+
+    Entries are keyed by the name of their metadata directory, and are valid
+    as long as the stamps (modification time, inode and size) of that
+    directory and the metadata files in it are unchanged. Only distributions
+    that were added or changed since the index was written have their metadata
+    parsed again. The directory itself is not listed again if its own stamp is
+    unchanged.
+    """
+
+    def __init__(self, path: str, location: str) -> None:
+        self.path = path
+        self.location = location
+        self._stamp: Stamp | None = None
+        self._entries: dict[str, IndexEntry] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data["version"] != _FORMAT_VERSION or data["location"] != self.location:
+                return
+            stamp = data["stamp"]
+            entries = {
+                key: IndexEntry(**value) for key, value in data["entries"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            # A missing or invalid index is rebuilt from scratch.
+            return
+        self._stamp = stamp
+        self._entries = entries
+
+    def _save(self) -> None:
+        data = {
+            "version": _FORMAT_VERSION,
+            "location": self.location,
+            "stamp": self._stamp,
+            "entries": {
+                key: dataclasses.asdict(entry) for key, entry in self._entries.items()
+            },
+        }
+        try:
+            ensure_dir(os.path.dirname(self.path))
+            with adjacent_tmp_file(self.path) as f:
+                f.write(json.dumps(data, separators=(",", ":")).encode())
+            replace(f.name, self.path)
+        except OSError as exc:
+            logger.debug("Could not write installed distribution index: %s", exc)
+
+    def _iter_info_locations(
+        self, stamp: Stamp | None
+    ) -> Iterator[tuple[pathlib.Path, importlib.metadata.Distribution]]:
+        if stamp is not None and stamp == self._stamp:
+            for key in self._entries:
+                info_location = pathlib.Path(self.location, key)
+                yield info_location, importlib.metadata.Distribution.at(info_location)
+            return
+        for dist in importlib.metadata.distributions(path=[self.location]):
+            path = get_info_location(dist)
+            if isinstance(path, pathlib.Path):
+                yield path, dist
+
+    def get_distributions(self) -> list[Distribution]:
+        """Get the distributions in the location, updating the index."""
+        stamp = _get_stamp(self.location)
+        # The stamp of the location is only kept if every distribution in it
+        # has an entry, so the entries can stand in for listing it.
+        complete = stamp is not None
+        entries: dict[str, IndexEntry] = {}
+        dists: list[Distribution] = []
+        for info_location, dist in self._iter_info_locations(stamp):
+            key = info_location.name
+            entry = self._entries.get(key)
+            entry_stamp = _get_entry_stamp(info_location)
+            if entry is not None and entry_stamp == entry.stamp:
+                dists.append(IndexedDistribution(dist, info_location, entry))
+                entries[key] = entry
+                continue
+            found = Distribution(dist, info_location, info_location.parent)
+            dists.append(found)
+            if entry_stamp is None:
+                complete = False
+                continue
+            try:
+                entries[key] = IndexEntry.from_distribution(found, entry_stamp)
+            except Exception:
+                # Invalid metadata is reported when the distribution is used.
+                complete = False
+
+        if not complete:
+            stamp = None
+        if stamp != self._stamp or entries != self._entries:
+            self._stamp = stamp
+            self._entries = entries
+            self._save()
+        return dists
+
+
+_indexes: dict[str, LocationIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_indexed_distributions(location: str) -> list[Distribution] | None:
+    """Get the distributions in a location through its index.
+
+    Return None if the location is not indexed, because the index is disabled
+    or the location is not a directory.
+    """
+    directory = get_installed_index_directory()
+    if directory is None or not os.path.isdir(location):
+        return None
+    location = os.path.abspath(location)
+    name = hashlib.sha224(location.encode()).hexdigest()
+    path = os.path.join(directory, name)
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is None:
+            index = _indexes[path] = LocationIndex(path, location)
+        return index.get_distributions()
@@ -508,6 +508,10 @@ class Link:
     def as_hashes(self) -> Hashes:
         return Hashes({k: [v] for k, v in self._hashes.items()})
 
+    @property
+    def hashes(self) -> Mapping[str, str]:
+        return self._hashes
+
     @property
     def hash(self) -> str | None:
         return next(iter(self._hashes.values()), None)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from pip._vendor.packaging.tags import Tag
 
@@ -23,6 +25,7 @@ class TargetPython:
         "py_version_info",
         "_valid_tags",
         "_valid_tags_set",
+        "_tag_priorities",
     ]
 
     def __init__(
@@ -65,6 +68,7 @@ class TargetPython:
         # This is used to cache the return value of get_(un)sorted_tags.
         self._valid_tags: list[Tag] | None = None
         self._valid_tags_set: set[Tag] | None = None
+        self._tag_priorities: Mapping[Tag, int] | None = None
 
     def format_given(self) -> str:
         """
@@ -120,3 +124,17 @@ class TargetPython:
             self._valid_tags_set = set(self.get_sorted_tags())
 
         return self._valid_tags_set
+
+    def get_tag_priorities(self) -> Mapping[Tag, int]:
+        """Return a read-only mapping from each supported tag to its priority.
+
+        The priority of a tag is its index in get_sorted_tags(), so lower is
+        more preferred. This is computed once, so that ranking a wheel only
+        takes a lookup of each of its own tags.
+        """
+        if self._tag_priorities is None:
+            self._tag_priorities = MappingProxyType(
+                {tag: idx for idx, tag in enumerate(self.get_sorted_tags())}
+            )
+
+        return self._tag_priorities
@@ -4,30 +4,43 @@ name that have meaning.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import functools
+from collections.abc import Iterable, Mapping
 
 from pip._vendor.packaging.tags import Tag
+from pip._vendor.packaging.utils import (
+    BuildTag,
+    NormalizedName,
+    parse_wheel_filename,
+)
 from pip._vendor.packaging.utils import (
     InvalidWheelFilename as _PackagingInvalidWheelFilename,
 )
-from pip._vendor.packaging.utils import parse_wheel_filename
 
 from pip._internal.exceptions import InvalidWheelFilename
 
 
+# The same wheel filenames are parsed many times while finding and sorting
+# candidates, so keep the results of the most recent ones.
+@functools.lru_cache(maxsize=4096)
+def _parse_wheel_filename(
+    filename: str,
+) -> tuple[NormalizedName, str, BuildTag, frozenset[Tag]]:
+    try:
+        name, version, build_tag, file_tags = parse_wheel_filename(filename)
+    except _PackagingInvalidWheelFilename as e:
+        raise InvalidWheelFilename(e.args[0]) from None
+    return name, str(version), build_tag, file_tags
+
+
 class Wheel:
     """A wheel file"""
 
     def __init__(self, filename: str) -> None:
         self.filename = filename
-
-        try:
-            wheel_info = parse_wheel_filename(filename)
-        except _PackagingInvalidWheelFilename as e:
-            raise InvalidWheelFilename(e.args[0]) from None
-
-        self.name, _version, self.build_tag, self.file_tags = wheel_info
-        self.version = str(_version)
+        self.name, self.version, self.build_tag, self.file_tags = _parse_wheel_filename(
+            filename
+        )
 
     def get_formatted_file_tags(self) -> list[str]:
         """Return the wheel's tags as a sorted list of strings."""
@@ -52,7 +65,7 @@ class Wheel:
             raise ValueError()
 
     def find_most_preferred_tag(
-        self, tags: list[Tag], tag_to_priority: dict[Tag, int]
+        self, tags: list[Tag], tag_to_priority: Mapping[Tag, int]
     ) -> int:
         """Return the priority of the most preferred tag that one of the wheel's file
         tag combinations achieves in the given list of supported tags using the given
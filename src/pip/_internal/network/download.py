@@ -6,10 +6,11 @@ import email.message
 import logging
 import mimetypes
 import os
-from collections.abc import Iterable, Mapping
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from http import HTTPStatus
-from typing import BinaryIO
+from typing import TYPE_CHECKING, BinaryIO
 
 from pip._vendor.requests import PreparedRequest
 from pip._vendor.requests.models import Response
@@ -17,14 +18,23 @@ from pip._vendor.urllib3 import HTTPResponse as URLlib3Response
 from pip._vendor.urllib3._collections import HTTPHeaderDict
 from pip._vendor.urllib3.exceptions import ReadTimeoutError
 
-from pip._internal.cli.progress_bars import BarType, get_download_progress_renderer
+from pip._internal.cli.progress_bars import (
+    BarType,
+    ProgressRenderer,
+    get_batch_download_progress_renderer,
+    get_download_progress_renderer,
+)
 from pip._internal.exceptions import IncompleteDownloadError, NetworkConnectionError
 from pip._internal.models.link import Link
 from pip._internal.network.cache import SafeFileCache, is_from_cache
 from pip._internal.network.session import CacheControlAdapter, PipSession
 from pip._internal.network.utils import HEADERS, raise_for_status, response_chunks
+from pip._internal.utils.hashes import Hashes
 from pip._internal.utils.misc import format_size, redact_auth_from_url, splitext
 
+if TYPE_CHECKING:
+    from hashlib import _Hash
+
 logger = logging.getLogger(__name__)
 
 
@@ -146,6 +156,14 @@ class _FileDownload:
     size: int | None
     bytes_received: int = 0
     reattempts: int = 0
+    # The known-good hashes of the file, computed while it is written so it
+    # does not need to be read again to check them.
+    hashes: Hashes | None = None
+    hashers: dict[str, _Hash] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.hashes:
+            self.hashers = self.hashes.new_hashers()
 
     def is_incomplete(self) -> bool:
         return bool(self.size is not None and self.bytes_received < self.size)
@@ -153,12 +171,24 @@ class _FileDownload:
     def write_chunk(self, data: bytes) -> None:
         self.bytes_received += len(data)
         self.output_file.write(data)
+        for hasher in self.hashers.values():
+            hasher.update(data)
 
     def reset_file(self) -> None:
         """Delete any saved data and reset progress to zero."""
         self.output_file.seek(0)
         self.output_file.truncate()
         self.bytes_received = 0
+        if self.hashes:
+            self.hashers = self.hashes.new_hashers()
+
+    def check_hashes(self) -> None:
+        """Check the downloaded file against its known-good hashes, if any.
+
+        Raise HashMismatch if none match.
+        """
+        if self.hashes:
+            self.hashes.check_against_hashers(self.hashers)
 
 
 class Downloader:
@@ -166,33 +196,84 @@ class Downloader:
         self,
         session: PipSession,
         progress_bar: BarType,
+        concurrency: int = 1,
     ) -> None:
         self._session = session
         self._progress_bar = progress_bar
+        self._concurrency = concurrency
         self._resume_retries = session.resume_retries
         assert (
             self._resume_retries >= 0
         ), "Number of max resume retries must be bigger or equal to zero"
+        assert self._concurrency >= 1, "Download concurrency must be at least one"
 
     def batch(
-        self, links: Iterable[Link], location: str
+        self,
+        links: Iterable[Link],
+        location: str,
+        hashes: Mapping[Link, Hashes] | None = None,
     ) -> Iterable[tuple[Link, tuple[str, str]]]:
-        """Convenience method to download multiple links."""
+        """Convenience method to download multiple links.
+
+        If the downloader allows concurrency, the links are downloaded in
+        parallel and yielded in the order in which they complete.
+
+        :param hashes: The known-good hashes to check each link against.
+        """
+        links = list(links)
+        hashes = hashes or {}
+        if self._concurrency > 1 and len(links) > 1:
+            yield from self._batch_concurrently(links, location, hashes)
+            return
         for link in links:
-            filepath, content_type = self(link, location)
+            filepath, content_type = self(link, location, hashes.get(link))
             yield link, (filepath, content_type)
 
-    def __call__(self, link: Link, location: str) -> tuple[str, str]:
-        """Download a link and save it under location."""
+    def _batch_concurrently(
+        self, links: list[Link], location: str, hashes: Mapping[Link, Hashes]
+    ) -> Iterator[tuple[Link, tuple[str, str]]]:
+        # Each worker keeps the resume and retry behaviour of a single
+        # download, but only one progress bar can be rendered at a time, so
+        # per-file bars are replaced by a single bar tracking the whole batch.
+        worker = Downloader(self._session, progress_bar="off")
+        renderer: ProgressRenderer[Future[tuple[str, str]]]
+        renderer = get_batch_download_progress_renderer(
+            bar_type=self._progress_bar, total=len(links)
+        )
+        with ThreadPoolExecutor(
+            max_workers=self._concurrency, thread_name_prefix="pip-download"
+        ) as executor:
+            futures = {
+                executor.submit(worker, link, location, hashes.get(link)): link
+                for link in links
+            }
+            try:
+                for future in renderer(as_completed(futures)):
+                    yield futures[future], future.result()
+            finally:
+                # Don't start downloads that are no longer needed if one of
+                # them failed or the consumer stopped early.
+                for future in futures:
+                    future.cancel()
+
+    def __call__(
+        self, link: Link, location: str, hashes: Hashes | None = None
+    ) -> tuple[str, str]:
+        """Download a link and save it under location.
+
+        :param hashes: If given, the downloaded file is checked against these
+            known-good hashes, and HashMismatch is raised if none match.
+        """
         resp = self._http_get(link)
         download_size = _get_http_response_size(resp)
 
         filepath = os.path.join(location, _get_http_response_filename(resp, link))
         with open(filepath, "wb") as content_file:
-            download = _FileDownload(link, content_file, download_size)
+            download = _FileDownload(link, content_file, download_size, hashes=hashes)
             self._process_response(download, resp)
             if download.is_incomplete():
                 self._attempt_resumes_or_redownloads(download, resp)
+            download.check_hashes()
 
         content_type = resp.headers.get("Content-Type", "")
         return filepath, content_type
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 __all__ = ["HTTPRangeRequestUnsupported", "dist_from_wheel_url"]
 
+import re
+import struct
 from bisect import bisect_left, bisect_right
 from collections.abc import Generator
 from contextlib import contextmanager
+from email.message import Message
 from tempfile import NamedTemporaryFile
 from typing import Any
 from zipfile import BadZipFile, ZipFile
@@ -23,6 +26,48 @@ class HTTPRangeRequestUnsupported(Exception):
     pass
 
 
+_CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+
+# The fixed size part of the end of central directory record.
+_END_OF_CENTRAL_DIR = struct.Struct("<4s4H2LH")
+_END_OF_CENTRAL_DIR_SIGNATURE = b"PK\x05\x06"
+
+
+def _parse_content_range(value: str) -> tuple[int, int, int | None]:
+    """Return the first and last byte positions and the complete length
+    given in a Content-Range header.
+    """
+    match = _CONTENT_RANGE.match(value)
+    if match is None:
+        raise HTTPRangeRequestUnsupported(f"invalid Content-Range: {value!r}")
+    first, last, length = match.groups()
+    return int(first), int(last), None if length == "*" else int(length)
+
+
+def _iter_byteranges(
+    content: bytes, boundary: bytes
+) -> Generator[tuple[int, bytes], None, None]:
+    """Yield the start position and data of each part of a
+    multipart/byteranges response body.
+    """
+    delimiter = b"--" + boundary
+    pos = content.find(delimiter)
+    while pos != -1 and not content.startswith(b"--", pos + len(delimiter)):
+        headers_end = content.find(b"\r\n\r\n", pos)
+        if headers_end == -1:
+            return
+        part = Message()
+        for line in content[pos + len(delimiter) : headers_end].splitlines():
+            name, sep, value = line.decode("latin-1").partition(":")
+            if sep:
+                part[name.strip()] = value.strip()
+        first, last, _ = _parse_content_range(part.get("Content-Range", ""))
+        data_start = headers_end + 4
+        data_end = data_start + last - first + 1
+        yield first, content[data_start:data_end]
+        pos = content.find(delimiter, data_end)
+
+
 def dist_from_wheel_url(
     name: NormalizedName, url: str, session: PipSession
 ) -> BaseDistribution:
@@ -34,6 +79,7 @@ def dist_from_wheel_url(
     is raised.
     """
     with LazyZipOverHTTP(url, session) as zf:
+        zf.prefetch_dist_info()
         # For read-only ZIP files, ZipFile only needs methods read,
         # seek, seekable and tell, not the whole IO protocol.
         wheel = MemoryWheel(zf.name, zf)  # type: ignore
@@ -49,22 +95,35 @@ class LazyZipOverHTTP:
     which is supposed to be fed to ZipFile.  If such requests are not
     supported by the server, raise HTTPRangeRequestUnsupported
     during initialization.
+
+    The first request asks for the tail of the file, which also tells its
+    length. Ranges needed at once are fetched with a single multi-range
+    request, until the server shows it does not support those.
     """
 
     def __init__(
         self, url: str, session: PipSession, chunk_size: int = CONTENT_CHUNK_SIZE
     ) -> None:
-        head = session.head(url, headers=HEADERS)
-        raise_for_status(head)
-        assert head.status_code == 200
         self._session, self._url, self._chunk_size = session, url, chunk_size
-        self._length = int(head.headers["Content-Length"])
-        self._file = NamedTemporaryFile()
-        self.truncate(self._length)
         self._left: list[int] = []
         self._right: list[int] = []
-        if "bytes" not in head.headers.get("Accept-Ranges", "none"):
+        self._multiple_ranges = True
+        tail = self._range_response(f"-{chunk_size}")
+        raise_for_status(tail)
+        if tail.status_code != 206:
+            tail.close()
             raise HTTPRangeRequestUnsupported("range request is not supported")
+        start, end, length = _parse_content_range(tail.headers["Content-Range"])
+        if length is None:
+            tail.close()
+            raise HTTPRangeRequestUnsupported("length of the file is unknown")
+        self._length = length
+        self._file = NamedTemporaryFile()
+        self.truncate(self._length)
+        with self._stay():
+            self._write_response(start, tail)
+        self._left.append(start)
+        self._right.append(end)
         self._check_zip()
 
     @property
@@ -99,6 +158,8 @@ class LazyZipOverHTTP:
         """
         download_size = max(size, self._chunk_size)
         start, length = self.tell(), self._length
+        if self._is_downloaded(start, length - 1 if size < 0 else start + size - 1):
+            return self._file.read(size)
         stop = length if size < 0 else min(start + download_size, length)
         start = max(0, stop - download_size)
         self._download(start, stop - 1)
@@ -155,9 +216,52 @@ class LazyZipOverHTTP:
         finally:
             self.seek(pos)
 
+    def prefetch_dist_info(self) -> None:
+        """Download all members of .dist-info directories at once.
+
+        The central directory tells where each member is stored, so this
+        takes a single request, instead of one per member read later.
+        """
+        with self._stay():
+            zf = ZipFile(self)
+        infos = sorted(zf.infolist(), key=lambda info: info.header_offset)
+        ends = [info.header_offset - 1 for info in infos[1:]] + [zf.start_dir - 1]
+        ranges: list[tuple[int, int]] = []
+        for info, end in zip(infos, ends):
+            if not info.filename.split("/", 1)[0].endswith(".dist-info"):
+                continue
+            if ranges and ranges[-1][1] + 1 == info.header_offset:
+                ranges[-1] = (ranges[-1][0], end)
+            else:
+                ranges.append((info.header_offset, end))
+        self._download_ranges(ranges)
+
+    def _find_central_directory(self) -> int | None:
+        """Return the offset of the central directory, if its end record
+        has been downloaded and can be trusted.
+        """
+        start = self._left[-1]
+        with self._stay():
+            self.seek(start)
+            tail = self._file.read()
+        pos = tail.rfind(_END_OF_CENTRAL_DIR_SIGNATURE)
+        if pos == -1 or len(tail) - pos < _END_OF_CENTRAL_DIR.size:
+            return None
+        record = _END_OF_CENTRAL_DIR.unpack_from(tail, pos)
+        size, offset = record[5], record[6]
+        # Leave ZIP64 and inconsistent records to ZipFile.
+        if offset + size > start + pos:
+            return None
+        return offset
+
     def _check_zip(self) -> None:
         """Check and download until the file is a valid ZIP."""
         end = self._length - 1
+        # Get the whole central directory at once, when the tail tells
+        # where it starts.
+        central_directory = self._find_central_directory()
+        if central_directory is not None:
+            self._download(central_directory, end)
         for start in reversed(range(0, end, self._chunk_size)):
             self._download(start, end)
             with self._stay():
@@ -170,16 +274,28 @@ class LazyZipOverHTTP:
                 else:
                     break
 
-    def _stream_response(
-        self, start: int, end: int, base_headers: dict[str, str] = HEADERS
+    def _range_response(
+        self, byte_ranges: str, base_headers: dict[str, str] = HEADERS
     ) -> Response:
-        """Return HTTP response to a range request from start to end."""
+        """Return HTTP response to a request for the given byte ranges."""
         headers = base_headers.copy()
-        headers["Range"] = f"bytes={start}-{end}"
+        headers["Range"] = f"bytes={byte_ranges}"
         # TODO: Get range requests to be correctly cached
         headers["Cache-Control"] = "no-cache"
         return self._session.get(self._url, headers=headers, stream=True)
 
+    def _stream_response(
+        self, start: int, end: int, base_headers: dict[str, str] = HEADERS
+    ) -> Response:
+        """Return HTTP response to a range request from start to end."""
+        return self._range_response(f"{start}-{end}", base_headers)
+
+    def _write_response(self, start: int, response: Response) -> None:
+        """Write the body of the response to the file from start."""
+        self.seek(start)
+        for chunk in response_chunks(response, self._chunk_size):
+            self._file.write(chunk)
+
     def _merge(
         self, start: int, end: int, left: int, right: int
     ) -> Generator[tuple[int, int], None, None]:
@@ -202,14 +318,72 @@ class LazyZipOverHTTP:
             yield i, end
         self._left[left:right], self._right[left:right] = [start], [end]
 
+    def _is_downloaded(self, start: int, end: int) -> bool:
+        """Return whether bytes from start to end have all been downloaded."""
+        i = bisect_right(self._left, start) - 1
+        while i >= 0 and i < len(self._left) and self._left[i] <= start <= end:
+            start = max(start, self._right[i] + 1)
+            i += 1
+        return start > min(end, self._length - 1)
+
     def _download(self, start: int, end: int) -> None:
         """Download bytes from start to end inclusively."""
+        self._download_ranges([(start, end)])
+
+    def _download_ranges(self, ranges: list[tuple[int, int]]) -> None:
+        """Download the given inclusive byte ranges.
+
+        Missing parts of the ranges are requested at once if there are
+        several of them and the server may support multi-range requests.
+        """
         with self._stay():
-            left = bisect_left(self._right, start)
-            right = bisect_right(self._left, end)
-            for start, end in self._merge(start, end, left, right):
+            missing: list[tuple[int, int]] = []
+            for start, end in ranges:
+                left = bisect_left(self._right, start)
+                right = bisect_right(self._left, end)
+                missing.extend(self._merge(start, end, left, right))
+            if len(missing) > 1 and self._multiple_ranges:
+                missing = self._download_multiple(missing)
+            for start, end in missing:
                 response = self._stream_response(start, end)
                 response.raise_for_status()
+                self._write_response(start, response)
+
+    def _download_multiple(
+        self, ranges: list[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
+        """Download the ranges with a single multi-range request.
+
+        Return the ranges the response did not include, which happens when
+        the server answers with only one range or the whole file. In that
+        case, multi-range requests are not tried again.
+        """
+        response = self._range_response(",".join(f"{s}-{e}" for s, e in ranges))
+        response.raise_for_status()
+        if response.status_code != 206:
+            # The server sends the whole file, which is what lazy wheels
+            # avoid downloading: fall back to single-range requests.
+            response.close()
+            self._multiple_ranges = False
+            return ranges
+        content_type = Message()
+        content_type["Content-Type"] = response.headers.get("Content-Type", "")
+        boundary = content_type.get_param("boundary")
+        received: list[tuple[int, int]] = []
+        if content_type.get_content_type() == "multipart/byteranges" and isinstance(
+            boundary, str
+        ):
+            for start, data in _iter_byteranges(response.content, boundary.encode()):
                 self.seek(start)
-                for chunk in response_chunks(response, self._chunk_size):
-                    self._file.write(chunk)
+                self._file.write(data)
+                received.append((start, start + len(data) - 1))
+        else:
+            self._multiple_ranges = False
+            start, end, _ = _parse_content_range(response.headers["Content-Range"])
+            self._write_response(start, response)
+            received.append((start, end))
+        return [
+            (start, end)
+            for start, end in ranges
+            if not any(i <= start and end <= j for i, j in received)
+        ]
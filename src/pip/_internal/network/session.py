@@ -14,10 +14,13 @@ import mimetypes
 import os
 import platform
 import shutil
+import socket
 import subprocess
 import sys
+import threading
 import urllib.parse
 import warnings
+import weakref
 from collections.abc import Generator, Mapping, Sequence
 from typing import (
     TYPE_CHECKING,
@@ -28,10 +31,15 @@ from typing import (
 
 from pip._vendor import requests, urllib3
 from pip._vendor.cachecontrol import CacheControlAdapter as _BaseCacheControlAdapter
-from pip._vendor.requests.adapters import DEFAULT_POOLBLOCK, BaseAdapter
+from pip._vendor.requests.adapters import (
+    DEFAULT_POOLBLOCK,
+    DEFAULT_POOLSIZE,
+    BaseAdapter,
+)
 from pip._vendor.requests.adapters import HTTPAdapter as _BaseHTTPAdapter
 from pip._vendor.requests.models import PreparedRequest, Response
 from pip._vendor.requests.structures import CaseInsensitiveDict
+from pip._vendor.urllib3.connection import HTTPConnection
 from pip._vendor.urllib3.connectionpool import ConnectionPool
 from pip._vendor.urllib3.exceptions import InsecureRequestWarning
 
@@ -48,7 +56,7 @@ from pip._internal.utils.misc import build_url_from_netloc, parse_netloc
 from pip._internal.utils.urls import url_to_path
 
 if TYPE_CHECKING:
-    from ssl import SSLContext
+    from ssl import SSLContext, SSLSession, SSLSocket
 
     from pip._vendor.urllib3 import ProxyManager
     from pip._vendor.urllib3.poolmanager import PoolManager
@@ -252,23 +260,98 @@ class LocalFSAdapter(BaseAdapter):
         pass
 
 
+class TLSSessionResumingContext:
+    """Wrap an SSLContext so that new connections resume earlier TLS sessions.
+
+    The TLS session of the last connection made to each host is remembered and
+    offered when connecting to that host again. Resuming a session skips most
+    of a full handshake, which matters when the pool has to open several
+    connections to the same index, e.g. for parallel downloads. Servers are
+    free to decline, in which case a full handshake happens as usual.
+
+    Everything other than ``wrap_socket`` is delegated to the wrapped context.
+    """
+
+    def __init__(self, context: SSLContext) -> None:
+        object.__setattr__(self, "_context", context)
+        object.__setattr__(self, "_lock", threading.Lock())
+        # Sessions (TLS 1.3 tickets in particular) are only known after the
+        # server sent them, so keep the last socket too and look at it again
+        # when the session is needed.
+        object.__setattr__(self, "_sessions", {})
+        object.__setattr__(self, "_sockets", {})
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._context, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._context, name, value)
+
+    def _get_session(self, hostname: str) -> SSLSession | None:
+        with self._lock:
+            ref = self._sockets.get(hostname)
+            sock = None if ref is None else ref()
+            if sock is not None and sock.session is not None:
+                self._sessions[hostname] = sock.session
+            return self._sessions.get(hostname)
+
+    def _remember(self, hostname: str, sock: SSLSocket) -> None:
+        with self._lock:
+            self._sockets[hostname] = weakref.ref(sock)
+            if sock.session is not None:
+                self._sessions[hostname] = sock.session
+
+    def wrap_socket(
+        self,
+        sock: socket.socket,
+        *args: Any,
+        server_hostname: str | None = None,
+        session: SSLSession | None = None,
+        **kwargs: Any,
+    ) -> SSLSocket:
+        if server_hostname is None:
+            return self._context.wrap_socket(sock, *args, session=session, **kwargs)
+        if session is None:
+            session = self._get_session(server_hostname)
+        ssl_sock = self._context.wrap_socket(
+            sock, *args, server_hostname=server_hostname, session=session, **kwargs
+        )
+        if session is not None:
+            logger.debug(
+                "TLS session to %s %s",
+                server_hostname,
+                "resumed" if ssl_sock.session_reused else "not resumed",
+            )
+        self._remember(server_hostname, ssl_sock)
+        return ssl_sock
+
+
 class _SSLContextAdapterMixin:
-    """Mixin to add the ``ssl_context`` constructor argument to HTTP adapters.
+    """Mixin to add the ``ssl_context`` and ``socket_options`` constructor
+    arguments to HTTP adapters.
 
-    The additional argument is forwarded directly to the pool manager. This allows us
-    to dynamically decide what SSL store to use at runtime, which is used to implement
-    the optional ``truststore`` backend.
+    The additional arguments are forwarded directly to the pool manager. This allows
+    us to dynamically decide what SSL store to use at runtime, which is used to
+    implement the optional ``truststore`` backend.
     """
 
     def __init__(
         self,
         *,
         ssl_context: SSLContext | None = None,
+        socket_options: list[tuple[int, int, int]] | None = None,
         **kwargs: Any,
     ) -> None:
         self._ssl_context = ssl_context
+        self._socket_options = socket_options
         super().__init__(**kwargs)
 
+    def _add_pool_kwargs(self, pool_kwargs: dict[str, Any]) -> None:
+        if self._ssl_context is not None:
+            pool_kwargs.setdefault("ssl_context", self._ssl_context)
+        if self._socket_options is not None:
+            pool_kwargs.setdefault("socket_options", self._socket_options)
+
     def init_poolmanager(
         self,
         connections: int,
@@ -276,8 +359,7 @@ class _SSLContextAdapterMixin:
         block: bool = DEFAULT_POOLBLOCK,
         **pool_kwargs: Any,
     ) -> PoolManager:
-        if self._ssl_context is not None:
-            pool_kwargs.setdefault("ssl_context", self._ssl_context)
+        self._add_pool_kwargs(pool_kwargs)
         return super().init_poolmanager(  # type: ignore[misc, no-any-return]
             connections=connections,
             maxsize=maxsize,
@@ -288,8 +370,7 @@ class _SSLContextAdapterMixin:
     def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> ProxyManager:
         # Proxy manager replaces the pool manager, so inject our SSL
         # context here too. https://github.com/pypa/pip/issues/13288
-        if self._ssl_context is not None:
-            proxy_kwargs.setdefault("ssl_context", self._ssl_context)
+        self._add_pool_kwargs(proxy_kwargs)
         return super().proxy_manager_for(proxy, **proxy_kwargs)  # type: ignore[misc, no-any-return]
 
 
@@ -335,11 +416,20 @@ class PipSession(requests.Session):
         trusted_hosts: Sequence[str] = (),
         index_urls: list[str] | None = None,
         ssl_context: SSLContext | None = None,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        max_host_connections: int | None = None,
+        tcp_keepalive: bool = False,
         **kwargs: Any,
     ) -> None:
         """
         :param trusted_hosts: Domains not to emit warnings for when not using
             HTTPS.
+        :param pool_maxsize: Number of connections to each host kept open
+            for reuse.
+        :param max_host_connections: If given, never open more than this many
+            connections to a host at once. Requests block until a connection
+            is returned to the pool instead.
+        :param tcp_keepalive: Enable TCP keep-alive probes on connections.
         """
         super().__init__(*args, **kwargs)
 
@@ -374,12 +464,30 @@ class PipSession(requests.Session):
         )  # type: ignore
         self.resume_retries = resume_retries
 
+        # Every adapter keeps its own connection pools, sized alike.
+        pool_options: dict[str, Any] = {
+            "max_retries": retries,
+            "pool_maxsize": pool_maxsize,
+        }
+        if max_host_connections is not None:
+            pool_options["pool_maxsize"] = max_host_connections
+            pool_options["pool_block"] = True
+        if tcp_keepalive:
+            pool_options["socket_options"] = [
+                *HTTPConnection.default_socket_options,
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ]
+        if ssl_context is not None:
+            ssl_context = TLSSessionResumingContext(  # type: ignore[assignment]
+                ssl_context
+            )
+
         # Our Insecure HTTPAdapter disables HTTPS validation. It does not
         # support caching so we'll use it for all http:// URLs.
         # If caching is disabled, we will also use it for
         # https:// hosts that we've marked as ignoring
         # TLS errors for (trusted-hosts).
-        insecure_adapter = InsecureHTTPAdapter(max_retries=retries)
+        insecure_adapter = InsecureHTTPAdapter(**pool_options)
 
         # We want to _only_ cache responses on securely fetched origins or when
         # the host is specified as trusted. We do this because
@@ -390,15 +498,15 @@ class PipSession(requests.Session):
         if cache:
             secure_adapter: _BaseHTTPAdapter = CacheControlAdapter(
                 cache=SafeFileCache(cache),
-                max_retries=retries,
                 ssl_context=ssl_context,
+                **pool_options,
             )
             self._trusted_host_adapter = InsecureCacheControlAdapter(
                 cache=SafeFileCache(cache),
-                max_retries=retries,
+                **pool_options,
             )
         else:
-            secure_adapter = HTTPAdapter(max_retries=retries, ssl_context=ssl_context)
+            secure_adapter = HTTPAdapter(ssl_context=ssl_context, **pool_options)
             self._trusted_host_adapter = insecure_adapter
 
         self.mount("https://", secure_adapter)
@@ -3,6 +3,7 @@ from collections.abc import Generator
 from pip._vendor.requests.models import Response
 
 from pip._internal.exceptions import NetworkConnectionError
+from pip._internal.utils.tracing import trace_bytes
 
 # The following comments and HTTP headers were originally added by
 # Donald Stufft in git commit 22c562429a61bb77172039e480873fb239dd8c03.
@@ -60,6 +61,7 @@ def response_chunks(
     response: Response, chunk_size: int = DOWNLOAD_CHUNK_SIZE
 ) -> Generator[bytes, None, None]:
     """Given a requests Response, provide the data chunks."""
+    from_cache = getattr(response, "from_cache", False)
     try:
         # Special case for urllib3.
         for chunk in response.raw.stream(
@@ -88,6 +90,8 @@ def response_chunks(
             # hope to eliminate problems with the second case.
             decode_content=False,
         ):
+            if not from_cache:
+                trace_bytes(len(chunk))
             yield chunk
     except AttributeError:
         # Standard file-like object.
@@ -95,4 +99,6 @@ def response_chunks(
             chunk = response.raw.read(chunk_size)
             if not chunk:
                 break
+            if not from_cache:
+                trace_bytes(len(chunk))
             yield chunk
@@ -2,25 +2,35 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+import sys
 from collections.abc import Generator, Iterable
 from contextlib import suppress
 from email.parser import Parser
 from functools import reduce
 from typing import (
+    Any,
     Callable,
     NamedTuple,
 )
 
+from pip._vendor.packaging.markers import default_environment
 from pip._vendor.packaging.requirements import Requirement
 from pip._vendor.packaging.tags import Tag, parse_tag
 from pip._vendor.packaging.utils import NormalizedName, canonicalize_name
 from pip._vendor.packaging.version import Version
+from pip._vendor.packaging.version import parse as parse_version
 
 from pip._internal.distributions import make_distribution_for_install_requirement
 from pip._internal.metadata import get_default_environment
 from pip._internal.metadata.base import BaseDistribution
 from pip._internal.req.req_install import InstallRequirement
+from pip._internal.utils.filesystem import adjacent_tmp_file, replace
+from pip._internal.utils.misc import ensure_dir
+from pip._internal.utils.packaging import get_requirement
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +113,138 @@ def check_package_set(
     return missing, conflicting
 
 
+def _get_state_key() -> str:
+    # Which requirements apply depends on the interpreter, the marker
+    # environment and the distributions that are found.
+    key = [sys.executable, sys.version, default_environment(), sys.path]
+    return hashlib.sha224(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+
+class IncrementalChecker:
+    """Check the installed distributions, reusing the results of the last check.
+
+    The state of the last check is stored in a directory, with the version and
+    raw requirements of each distribution, what was missing or conflicting for
+    it, and the names it depends on. A distribution is only checked again if
+    its version or requirements changed since, or if one of the distributions
+    it depends on was added, removed or changed.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self._path = os.path.join(directory, _get_state_key())
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(state, dict) or state.get("version") != 1:
+            return {}
+        return state["packages"]
+
+    def _save(self, packages: dict[str, dict[str, Any]]) -> None:
+        text = json.dumps({"version": 1, "packages": packages}, separators=(",", ":"))
+        try:
+            ensure_dir(os.path.dirname(self._path))
+            with adjacent_tmp_file(self._path) as f:
+                f.write(text.encode())
+            replace(f.name, self._path)
+        except OSError as exc:
+            logger.debug("Could not save the state of pip check: %s", exc)
+
+    def check(self) -> tuple[dict[NormalizedName, Version], CheckResult, bool]:
+        """Check the installed distributions.
+
+        Returns the versions of the installed distributions, the result of the
+        check, and whether there were problems reading some of them.
+        """
+        previous = self._load()
+        dependents: dict[str, set[str]] = {}
+        for name, entry in previous.items():
+            for dep_name in entry["depends_on"]:
+                dependents.setdefault(dep_name, set()).add(name)
+
+        problems = False
+        dists: dict[NormalizedName, BaseDistribution] = {}
+        current: dict[str, dict[str, Any]] = {}
+        env = get_default_environment()
+        for dist in env.iter_installed_distributions(local_only=False, skip=()):
+            name = dist.canonical_name
+            try:
+                requires = list(dist.iter_raw_dependencies())
+            except (OSError, ValueError) as e:
+                # Don't crash on unreadable or broken metadata.
+                logger.warning("Error parsing dependencies of %s: %s", name, e)
+                problems = True
+                continue
+            dists[name] = dist
+            current[name] = {"version": str(dist.version), "requires": requires}
+        changed = {
+            name
+            for name in current.keys() | previous.keys()
+            if name not in previous
+            or name not in current
+            or previous[name]["version"] != current[name]["version"]
+            or previous[name]["requires"] != current[name]["requires"]
+        }
+        affected = set(changed)
+        for name in changed:
+            affected.update(dependents.get(name, ()))
+
+        package_set: PackageSet = {}
+        for name, dist in dists.items():
+            if name not in affected:
+                package_set[name] = PackageDetails(dist.version, [])
+                continue
+            try:
+                dependencies = list(dist.iter_dependencies())
+            except (OSError, ValueError) as e:
+                # Don't crash on unreadable or broken metadata.
+                logger.warning("Error parsing dependencies of %s: %s", name, e)
+                problems = True
+                continue
+            package_set[name] = PackageDetails(dist.version, dependencies)
+        logger.debug(
+            "Checking %d of %d packages",
+            len(affected & package_set.keys()),
+            len(package_set),
+        )
+
+        missing, conflicting = check_package_set(
+            package_set, should_ignore=lambda name: name not in affected
+        )
+
+        packages: dict[str, dict[str, Any]] = {}
+        for name, details in package_set.items():
+            if name in affected:
+                packages[name] = {
+                    **current[name],
+                    "depends_on": sorted(
+                        {canonicalize_name(req.name) for req in details.dependencies}
+                    ),
+                    "missing": [[n, str(req)] for n, req in missing.get(name, [])],
+                    "conflicting": [
+                        [n, str(v), str(req)] for n, v, req in conflicting.get(name, [])
+                    ],
+                }
+                continue
+            entry = packages[name] = previous[name]
+            if entry["missing"]:
+                missing[name] = [
+                    (n, get_requirement(req)) for n, req in entry["missing"]
+                ]
+            if entry["conflicting"]:
+                conflicting[name] = [
+                    (n, parse_version(v), get_requirement(req))
+                    for n, v, req in entry["conflicting"]
+                ]
+        self._save(packages)
+
+        versions = {name: details.version for name, details in package_set.items()}
+        return versions, (missing, conflicting), problems
+
+
 def check_install_conflicts(to_install: list[InstallRequirement]) -> ConflictDetails:
     """For checking if the dependency graph would be consistent after \
     installing given requirements
@@ -148,8 +290,13 @@ def _simulate_installation_of(
 
     # Modify it as installing requirement_set would (assuming no errors)
     for inst_req in to_install:
-        abstract_dist = make_distribution_for_install_requirement(inst_req)
-        dist = abstract_dist.get_metadata_distribution()
+        if inst_req.needs_more_preparation:
+            # The distribution is still being downloaded, so use the metadata
+            # it was resolved with.
+            dist = inst_req.get_dist()
+        else:
+            abstract_dist = make_distribution_for_install_requirement(inst_req)
+            dist = abstract_dist.get_metadata_distribution()
         name = dist.canonical_name
         package_set[name] = PackageDetails(dist.version, list(dist.iter_dependencies()))
 
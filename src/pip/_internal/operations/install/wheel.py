@@ -4,18 +4,26 @@ from __future__ import annotations
 
 import collections
 import compileall
+import configparser
 import contextlib
 import csv
 import importlib
+import json
 import logging
+import multiprocessing
 import os.path
 import re
 import shutil
+import stat
 import sys
+import tempfile
 import textwrap
+import threading
 import warnings
 from base64 import urlsafe_b64encode
-from collections.abc import Generator, Iterable, Iterator, Sequence
+from collections.abc import Collection, Generator, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from email.message import Message
 from itertools import chain, filterfalse, starmap
 from typing import (
@@ -43,8 +51,14 @@ from pip._internal.metadata import (
 )
 from pip._internal.models.direct_url import DIRECT_URL_METADATA_NAME, DirectUrl
 from pip._internal.models.scheme import SCHEME_KEYS, Scheme
-from pip._internal.utils.filesystem import adjacent_tmp_file, replace
-from pip._internal.utils.misc import StreamWrapper, ensure_dir, hash_file, partition
+from pip._internal.utils.filesystem import FileLinker, adjacent_tmp_file, replace
+from pip._internal.utils.misc import (
+    StreamWrapper,
+    ensure_dir,
+    hash_file,
+    partition,
+    rmtree,
+)
 from pip._internal.utils.unpacking import (
     current_umask,
     is_within_directory,
@@ -68,6 +82,13 @@ logger = logging.getLogger(__name__)
 RecordPath = NewType("RecordPath", str)
 InstalledCSVRow = tuple[RecordPath, str, Union[int, str]]
 
+# Wheels may be installed concurrently. Scripts are generated into a shared
+# directory, so generating them is serialized per directory.
+_script_dir_locks: dict[str, threading.Lock] = {}
+
+# The files of a WheelStore are kept without these permission bits.
+_WRITE_BITS = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
 
 def rehash(path: str, blocksize: int = 1 << 20) -> tuple[str, str]:
     """Return (encoded_digest, length) for path using hashlib.sha256()"""
@@ -262,6 +283,176 @@ def get_csv_rows_for_installed(
     ]
 
 
+def get_install_roots(wheel_path: str) -> set[tuple[str, str]]:
+    """Return the top-level paths a wheel installs into, per scheme key.
+
+    Each root is a (scheme key, top-level name) pair. Files installed into
+    the library directory are keyed as "lib", whether they are purelib or
+    platlib. Scripts, including the ones generated for entry points, are
+    keyed as "scripts" with their lowercased name. Wheels whose roots do not
+    intersect write disjoint file trees.
+    """
+    roots = set()
+    with ZipFile(wheel_path, allowZip64=True) as z:
+        for name in z.namelist():
+            parts = name.split("/")
+            if parts[0].endswith(".data") and len(parts) > 2:
+                if parts[1] == "scripts":
+                    roots.add(_script_root(parts[2]))
+                    continue
+                key = parts[1] if parts[1] not in ("purelib", "platlib") else "lib"
+                roots.add((key, parts[2]))
+            else:
+                roots.add(("lib", parts[0]))
+            if (
+                len(parts) == 2
+                and parts[0].endswith(".dist-info")
+                and parts[1] == "entry_points.txt"
+            ):
+                entry_points = configparser.ConfigParser(
+                    delimiters=("=",), interpolation=None, strict=False
+                )
+                try:
+                    entry_points.read_string(z.read(name).decode("utf-8"))
+                except (configparser.Error, UnicodeDecodeError):
+                    # The wheel fails to install anyway.
+                    continue
+                for group in ("console_scripts", "gui_scripts"):
+                    if entry_points.has_section(group):
+                        roots.update(
+                            ("scripts", script.lower())
+                            for script in entry_points.options(group)
+                        )
+    return roots
+
+
+def _script_root(path: str) -> tuple[str, str]:
+    name = os.path.basename(path).lower()
+    # Scripts generated on Windows are suffixed, unlike their entry points.
+    for suffix in (".exe", "-script.py", "-script.pyw"):
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+            break
+    return ("scripts", name)
+
+
+def get_installed_roots(
+    installed_dist: BaseDistribution, scheme: Scheme
+) -> set[tuple[str, str]]:
+    """Return the top-level paths an installed distribution removes when
+    uninstalled, keyed as ``get_install_roots`` keys the paths of a wheel
+    installed with the given scheme.
+
+    Files outside of the scheme are keyed as "other" with their absolute path.
+    """
+    location = installed_dist.location
+    entries = installed_dist.iter_declared_entries()
+    if location is None or entries is None:
+        return set()
+    # The data directory usually contains the others, so it is tried last.
+    scheme_dirs = [
+        (key, os.path.normcase(os.path.normpath(getattr(scheme, key))))
+        for key in ("scripts", "headers", "data")
+    ]
+    roots = set()
+    for entry in entries:
+        top_level = entry.replace(os.path.sep, "/").split("/")[0]
+        # Files outside of the library directory (like scripts) are recorded
+        # as relative paths starting with "..".
+        if top_level != "..":
+            roots.add(("lib", top_level))
+            continue
+        path = os.path.normcase(os.path.normpath(os.path.join(location, entry)))
+        for key, scheme_dir in scheme_dirs:
+            if is_within_directory(scheme_dir, path):
+                if key == "scripts":
+                    roots.add(_script_root(path))
+                else:
+                    relpath = os.path.relpath(path, scheme_dir)
+                    roots.add((key, relpath.split(os.path.sep)[0]))
+                break
+        else:
+            roots.add(("other", path))
+    return roots
+
+
+def get_unchanged_files(
+    name: str, wheel_path: str, scheme: Scheme, installed_dist: BaseDistribution
+) -> set[str]:
+    """Return the files of an installed distribution that a wheel would
+    install unchanged.
+
+    A file is unchanged when the wheel installs it to the path it is installed
+    at, with the hash and size recorded in the installed RECORD, and the file
+    on disk still has that size and executable bit. The paths are returned as
+    the destination paths of the wheel's files.
+
+    Scripts are rewritten when installed, so they are never unchanged.
+    """
+    location = installed_dist.location
+    if location is None:
+        return set()
+    try:
+        installed_record = installed_dist.read_text("RECORD")
+    except FileNotFoundError:
+        return set()
+    installed_rows = {}
+    for row in csv.reader(installed_record.splitlines()):
+        if len(row) < 3 or not row[1]:
+            continue
+        path = os.path.normcase(os.path.normpath(os.path.join(location, row[0])))
+        installed_rows[path] = (row[1], row[2])
+
+    with ZipFile(wheel_path, allowZip64=True) as z:
+        info_dir, metadata = parse_wheel(z, name)
+        try:
+            wheel_record = z.read(f"{info_dir}/RECORD").decode("utf-8")
+        except KeyError:
+            return set()
+        lib_dir = scheme.purelib if wheel_root_is_purelib(metadata) else scheme.platlib
+
+        # Map the destination of each file to its RECORD row and ZipInfo.
+        # Destinations written by more than one file are left out.
+        candidates: dict[str, tuple[list[str], ZipInfo] | None] = {}
+        for row in csv.reader(wheel_record.splitlines()):
+            if len(row) < 3 or not row[1]:
+                continue
+            # The destinations are computed as in _install_wheel.
+            normed_path = os.path.normpath(row[0])
+            if row[0].split("/", 1)[0].endswith(".data"):
+                parts = normed_path.split(os.path.sep, 2)
+                if len(parts) < 3 or parts[1] not in SCHEME_KEYS:
+                    continue
+                if parts[1] == "scripts":
+                    continue
+                dest = os.path.join(getattr(scheme, parts[1]), parts[2])
+            else:
+                dest = os.path.join(lib_dir, normed_path)
+            try:
+                info = z.getinfo(row[0])
+            except KeyError:
+                continue
+            candidates[dest] = None if dest in candidates else (row, info)
+
+    unchanged = set()
+    for dest, candidate in candidates.items():
+        if candidate is None:
+            continue
+        row, info = candidate
+        if installed_rows.get(os.path.normcase(dest)) != (row[1], row[2]):
+            continue
+        try:
+            st = os.lstat(dest)
+        except OSError:
+            continue
+        if not stat.S_ISREG(st.st_mode) or str(st.st_size) != row[2]:
+            continue
+        if bool(st.st_mode & 0o111) != zip_item_is_executable(info):
+            continue
+        unchanged.add(dest)
+    return unchanged
+
+
 def get_console_script_specs(console: dict[str, str]) -> list[str]:
     """
     Given the mapping from entrypoint name to callable, return the relevant
@@ -375,6 +566,122 @@ class ZipBackedFile:
             set_extracted_file_to_default_mode_plus_executable(self.dest_path)
 
 
+class LinkedFile:
+    """A file installed by linking it from an unpacked wheel in a WheelStore."""
+
+    def __init__(
+        self, file: ZipBackedFile, store_path: str, linker: FileLinker
+    ) -> None:
+        self._file = file
+        self._store_path = store_path
+        self._linker = linker
+        self.src_record_path = file.src_record_path
+        self.dest_path = file.dest_path
+        self.changed = False
+
+    def save(self) -> None:
+        # Unlink any existing file, for the reason given in ZipBackedFile.save.
+        # This also ensures that files shared with the store are replaced
+        # rather than written to.
+        if os.path.exists(self.dest_path):
+            os.unlink(self.dest_path)
+        try:
+            self._linker.link(self._store_path, self.dest_path)
+        except FileNotFoundError:
+            # The store entry was removed, e.g. by pip cache purge.
+            self._file.save()
+
+
+class WheelStore:
+    """A persistent store of unpacked wheels, to install files by linking them.
+
+    Each wheel is unpacked once, into a directory named after the sha256 of
+    the wheel. Entries are published with an atomic rename, and are never
+    modified afterwards: their files are read-only, as they may be hard linked
+    into environments. The size and modification time of each file is
+    recorded when the entry is added, and checked before the entry is used,
+    so that an entry modified nonetheless is replaced instead of being linked.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+
+    def get_entry(self, wheel_path: str, wheel_zip: ZipFile) -> str:
+        """Return the directory holding the unpacked wheel, unpacking the
+        wheel into it first if needed.
+        """
+        digest = hash_file(wheel_path)[0].hexdigest()
+        entry = os.path.join(self.root, digest[:2], digest[2:4], digest[4:])
+        if os.path.isdir(entry) and not self._is_intact(entry):
+            logger.warning("Replacing modified wheel store entry %s", entry)
+            self._remove_entry(entry)
+        if not os.path.isdir(entry):
+            self._add_entry(entry, wheel_path, wheel_zip)
+        return os.path.join(entry, "files")
+
+    def _is_intact(self, entry: str) -> bool:
+        """Check the files of an entry against the ones recorded in it."""
+        try:
+            with open(os.path.join(entry, "files.json"), encoding="utf-8") as f:
+                recorded = json.load(f)
+            for path, (size, mtime_ns) in recorded.items():
+                st = os.stat(os.path.join(entry, "files", path))
+                if (
+                    st.st_size != size
+                    or st.st_mtime_ns != mtime_ns
+                    or st.st_mode & _WRITE_BITS
+                ):
+                    return False
+        except (OSError, ValueError, TypeError):
+            return False
+        return True
+
+    def _remove_entry(self, entry: str) -> None:
+        # Move the entry out of the way first, so that other processes never
+        # link from a partially removed entry.
+        trash = tempfile.mkdtemp(prefix=".tmp-", dir=os.path.dirname(entry))
+        try:
+            os.replace(entry, os.path.join(trash, "entry"))
+        finally:
+            rmtree(trash, ignore_errors=True)
+
+    def _add_entry(self, entry: str, wheel_path: str, wheel_zip: ZipFile) -> None:
+        parent = os.path.dirname(entry)
+        ensure_dir(parent)
+        staging = tempfile.mkdtemp(prefix=".tmp-", dir=parent)
+        files = os.path.join(staging, "files")
+        try:
+            recorded = {}
+            for info in wheel_zip.infolist():
+                if info.is_dir():
+                    continue
+                record_path = cast(RecordPath, info.filename)
+                path = os.path.join(files, os.path.normpath(record_path))
+                if not is_within_directory(files, path):
+                    raise InstallationError(
+                        f"The wheel {wheel_path!r} has a file {record_path!r} "
+                        f"trying to install outside the target directory"
+                    )
+                ensure_dir(os.path.dirname(path))
+                ZipBackedFile(record_path, path, wheel_zip).save()
+                st = os.stat(path)
+                os.chmod(path, stat.S_IMODE(st.st_mode) & ~_WRITE_BITS)
+                recorded[os.path.relpath(path, files)] = (st.st_size, st.st_mtime_ns)
+            with open(os.path.join(staging, "files.json"), "w", encoding="utf-8") as f:
+                json.dump(recorded, f)
+        except BaseException:
+            rmtree(staging, ignore_errors=True)
+            raise
+        # Renaming is atomic, so that other processes never see a partial
+        # entry. If one of them added the entry first, keep theirs.
+        try:
+            os.rename(staging, entry)
+        except OSError:
+            rmtree(staging, ignore_errors=True)
+            if not os.path.isdir(entry):
+                raise
+
+
 class ScriptFile:
     def __init__(self, file: File) -> None:
         self._file = file
@@ -432,6 +739,9 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
     warn_script_location: bool = True,
     direct_url: DirectUrl | None = None,
     requested: bool = False,
+    bytecode_compiler: BytecodeCompiler | None = None,
+    wheel_store: WheelStore | None = None,
+    unchanged_files: Collection[str] = (),
 ) -> None:
     """Install a wheel.
 
@@ -443,6 +753,14 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
     :param pycompile: Whether to byte-compile installed Python files
     :param warn_script_location: Whether to check that scripts are installed
         into a directory on PATH
+    :param bytecode_compiler: If given, byte-compiling is left to this
+        compiler instead of being done as part of the installation
+    :param wheel_store: If given, the wheel is unpacked into this store, and
+        its files are linked from there instead of copied
+    :param unchanged_files: Destination paths already holding the content of
+        the wheel's file, as returned by :func:`get_unchanged_files`. They are
+        recorded as installed but left in place, and are not compiled again
+        if their bytecode exists
     :raises UnsupportedWheel:
         * when the directory holds an unpacked wheel with incompatible
           Wheel-Version
@@ -485,19 +803,38 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
                 message.format(wheel_path, target_path, dest_dir_path)
             )
 
+    def make_zip_backed_file(record_path: RecordPath, dest_path: str) -> File:
+        return ZipBackedFile(record_path, dest_path, wheel_zip)
+
+    make_file = make_zip_backed_file
+    if wheel_store is not None:
+        try:
+            store_entry = wheel_store.get_entry(wheel_path, wheel_zip)
+        except OSError as exc:
+            logger.debug("Could not add %s to the wheel store: %s", wheel_path, exc)
+        else:
+            linker = FileLinker()
+
+            def make_linked_file(record_path: RecordPath, dest_path: str) -> File:
+                store_path = os.path.join(store_entry, os.path.normpath(record_path))
+                file = ZipBackedFile(record_path, dest_path, wheel_zip)
+                return LinkedFile(file, store_path, linker)
+
+            make_file = make_linked_file
+
     def root_scheme_file_maker(
-        zip_file: ZipFile, dest: str
+        make_file: Callable[[RecordPath, str], File], dest: str
     ) -> Callable[[RecordPath], File]:
         def make_root_scheme_file(record_path: RecordPath) -> File:
             normed_path = os.path.normpath(record_path)
             dest_path = os.path.join(dest, normed_path)
             assert_no_path_traversal(dest, dest_path)
-            return ZipBackedFile(record_path, dest_path, zip_file)
+            return make_file(record_path, dest_path)
 
         return make_root_scheme_file
 
     def data_scheme_file_maker(
-        zip_file: ZipFile, scheme: Scheme
+        make_file: Callable[[RecordPath, str], File], scheme: Scheme
     ) -> Callable[[RecordPath], File]:
         scheme_paths = {key: getattr(scheme, key) for key in SCHEME_KEYS}
 
@@ -526,7 +863,7 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
 
             dest_path = os.path.join(scheme_path, dest_subpath)
             assert_no_path_traversal(scheme_path, dest_path)
-            return ZipBackedFile(record_path, dest_path, zip_file)
+            return make_file(record_path, dest_path)
 
         return make_data_scheme_file
 
@@ -537,7 +874,7 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
     file_paths = filterfalse(is_dir_path, paths)
     root_scheme_paths, data_scheme_paths = partition(is_data_scheme_path, file_paths)
 
-    make_root_scheme_file = root_scheme_file_maker(wheel_zip, lib_dir)
+    make_root_scheme_file = root_scheme_file_maker(make_file, lib_dir)
     files: Iterator[File] = map(make_root_scheme_file, root_scheme_paths)
 
     def is_script_scheme_path(path: RecordPath) -> bool:
@@ -548,7 +885,7 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
         is_script_scheme_path, data_scheme_paths
     )
 
-    make_data_scheme_file = data_scheme_file_maker(wheel_zip, scheme)
+    make_data_scheme_file = data_scheme_file_maker(make_file, scheme)
     other_scheme_files = map(make_data_scheme_file, other_scheme_paths)
     files = chain(files, other_scheme_files)
 
@@ -575,14 +912,17 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
         # Ignore setuptools-generated scripts
         return matchname in console or matchname in gui
 
+    # Scripts are rewritten in place when installed, so they are never linked.
+    make_script_scheme_file = data_scheme_file_maker(make_zip_backed_file, scheme)
     script_scheme_files: Iterator[File] = map(
-        make_data_scheme_file, script_scheme_paths
+        make_script_scheme_file, script_scheme_paths
     )
     script_scheme_files = filterfalse(is_entrypoint_wrapper, script_scheme_files)
     script_scheme_files = map(ScriptFile, script_scheme_files)
     files = chain(files, script_scheme_files)
 
     existing_parents = set()
+    left_in_place: set[RecordPath] = set()
     for file in files:
         # directory creation is lazy and after file filtering
         # to ensure we don't install empty dirs; empty dirs can't be
@@ -591,9 +931,16 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
         if parent_dir not in existing_parents:
             ensure_dir(parent_dir)
             existing_parents.add(parent_dir)
-        file.save()
+        if file.dest_path in unchanged_files:
+            left_in_place.add(_fs_to_record_path(file.dest_path, lib_dir))
+        else:
+            file.save()
         record_installed(file.src_record_path, file.dest_path, file.changed)
 
+    def pyc_output_path(path: str) -> str:
+        """Return the path the pyc file would have been written to."""
+        return importlib.util.cache_from_source(path)
+
     def pyc_source_file_paths() -> Generator[str, None, None]:
         # We de-duplicate installation paths, since there can be overlap (e.g.
         # file in .data maps to same location as file in wheel root).
@@ -605,14 +952,28 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
                 continue
             if not full_installed_path.endswith(".py"):
                 continue
+            if installed_path in compiled_in_place:
+                continue
             yield full_installed_path
 
-    def pyc_output_path(path: str) -> str:
-        """Return the path the pyc file would have been written to."""
-        return importlib.util.cache_from_source(path)
-
-    # Compile all of the pyc files for the installed files
-    if pycompile:
+    # The bytecode of a file left in place is still valid, so it is kept
+    # rather than compiled again.
+    compiled_in_place = set()
+    for installed_path in sorted(left_in_place):
+        if not installed_path.endswith(".py"):
+            continue
+        pyc_path = pyc_output_path(os.path.join(lib_dir, installed_path))
+        if os.path.isfile(pyc_path):
+            pyc_record_path = cast("RecordPath", pyc_path.replace(os.path.sep, "/"))
+            record_installed(pyc_record_path, pyc_path)
+            compiled_in_place.add(installed_path)
+
+    # Compile all of the pyc files for the installed files, unless compiling
+    # is deferred to the compiler shared by the whole installation.
+    deferred_pyc_sources: list[str] = []
+    if pycompile and bytecode_compiler is not None:
+        deferred_pyc_sources = list(pyc_source_file_paths())
+    elif pycompile:
         with contextlib.redirect_stdout(
             StreamWrapper.from_stream(sys.stdout)
         ) as stdout:
@@ -650,10 +1011,11 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
 
     gui_scripts_to_generate = list(starmap("{} = {}".format, gui.items()))
 
-    generated_console_scripts = maker.make_multiple(scripts_to_generate)
-    generated.extend(generated_console_scripts)
+    with _script_dir_locks.setdefault(scheme.scripts, threading.Lock()):
+        generated_console_scripts = maker.make_multiple(scripts_to_generate)
+        generated.extend(generated_console_scripts)
 
-    generated.extend(maker.make_multiple(gui_scripts_to_generate, {"gui": True}))
+        generated.extend(maker.make_multiple(gui_scripts_to_generate, {"gui": True}))
 
     if warn_script_location:
         msg = message_about_scripts_not_on_PATH(generated_console_scripts)
@@ -687,7 +1049,7 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
     # Record the REQUESTED file
     if requested:
         requested_path = os.path.join(dest_info_dir, "REQUESTED")
-        with open(requested_path, "wb"):
+        with _generate_file(requested_path):
             pass
         generated.append(requested_path)
 
@@ -711,6 +1073,107 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
         writer = csv.writer(cast("IO[str]", record_file))
         writer.writerows(_normalized_outrows(rows))
 
+    if deferred_pyc_sources:
+        assert bytecode_compiler is not None
+        bytecode_compiler.add(record_path, lib_dir, deferred_pyc_sources)
+
+
+def _compile_file(path: str) -> tuple[bool, str]:
+    """Byte-compile a single file, returning success and the captured output.
+
+    This is the unit of work of :class:`BytecodeCompiler`, and may run in a
+    worker process.
+    """
+    with contextlib.redirect_stdout(StreamWrapper.from_stream(sys.stdout)) as stdout:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            success = compileall.compile_file(path, force=True, quiet=True)
+    return bool(success), stdout.getvalue()
+
+
+class BytecodeCompiler:
+    """Byte-compile the Python files of several installed wheels at once.
+
+    Wheels installed with a compiler leave their files uncompiled. Calling
+    :meth:`compile` afterwards compiles the files of all of them over a pool
+    of processes, and adds the resulting pyc files to each wheel's RECORD.
+    """
+
+    def __init__(self, workers: int | None = None) -> None:
+        self._workers = workers or os.cpu_count() or 1
+        self._pending: list[tuple[str, str, list[str]]] = []
+
+    def add(self, record_path: str, lib_dir: str, sources: list[str]) -> None:
+        """Queue the sources of an installed wheel for compilation."""
+        self._pending.append((record_path, lib_dir, sources))
+
+    def compile(self) -> None:
+        sources = [path for _, _, paths in self._pending for path in paths]
+        if not sources:
+            return
+        logger.debug("Compiling %d files", len(sources))
+        compiled = set()
+        for path, (success, output) in zip(sources, self._compile_all(sources)):
+            if output:
+                logger.debug(output)
+            if success:
+                compiled.add(path)
+
+        for record_path, lib_dir, paths in self._pending:
+            pyc_paths = []
+            for path in paths:
+                if path not in compiled:
+                    continue
+                pyc_path = importlib.util.cache_from_source(path)
+                assert os.path.exists(pyc_path)
+                pyc_paths.append(pyc_path)
+            _add_to_record(record_path, lib_dir, pyc_paths)
+        self._pending.clear()
+
+    def _compile_all(self, sources: list[str]) -> list[tuple[bool, str]]:
+        workers = min(self._workers, len(sources))
+        if workers > 1:
+            try:
+                # Other threads may be running, e.g. downloads, and forking
+                # while one of them holds a lock can deadlock the workers.
+                method = "spawn"
+                if "forkserver" in multiprocessing.get_all_start_methods():
+                    method = "forkserver"
+                executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context(method),
+                )
+            except (ImportError, NotImplementedError, OSError, ValueError) as exc:
+                # The platform lacks working multiprocessing primitives.
+                logger.debug("Cannot compile in parallel: %s", exc)
+            else:
+                chunksize = max(1, len(sources) // (workers * 4))
+                try:
+                    with executor:
+                        return list(
+                            executor.map(_compile_file, sources, chunksize=chunksize)
+                        )
+                except BrokenProcessPool as exc:
+                    logger.debug("Parallel compilation failed: %s", exc)
+        return [_compile_file(path) for path in sources]
+
+
+def _add_to_record(record_path: str, lib_dir: str, paths: list[str]) -> None:
+    """Add the given files, as generated files, to an installed RECORD."""
+    if not paths:
+        return
+    with open(record_path, **csv_io_kwargs("r")) as record_file:
+        rows: list[InstalledCSVRow] = [
+            (cast("RecordPath", path), hash_, size)
+            for path, hash_, size in csv.reader(record_file)
+        ]
+    rows.extend((_fs_to_record_path(path, lib_dir), "", "") for path in paths)
+    with adjacent_tmp_file(record_path, **csv_io_kwargs("w")) as f:
+        writer = csv.writer(cast("IO[str]", f))
+        writer.writerows(_normalized_outrows(rows))
+    os.chmod(f.name, 0o666 & ~current_umask())
+    replace(f.name, record_path)
+
 
 @contextlib.contextmanager
 def req_error_context(req_description: str) -> Generator[None, None, None]:
@@ -730,6 +1193,9 @@ def install_wheel(
     warn_script_location: bool = True,
     direct_url: DirectUrl | None = None,
     requested: bool = False,
+    bytecode_compiler: BytecodeCompiler | None = None,
+    wheel_store: WheelStore | None = None,
+    unchanged_files: Collection[str] = (),
 ) -> None:
     with ZipFile(wheel_path, allowZip64=True) as z:
         with req_error_context(req_description):
@@ -742,4 +1208,7 @@ def install_wheel(
                 warn_script_location=warn_script_location,
                 direct_url=direct_url,
                 requested=requested,
+                bytecode_compiler=bytecode_compiler,
+                wheel_store=wheel_store,
+                unchanged_files=unchanged_files,
             )
@@ -7,18 +7,22 @@ from __future__ import annotations
 import mimetypes
 import os
 import shutil
-from collections.abc import Iterable
+import threading
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from types import TracebackType
+from typing import TYPE_CHECKING, Callable, TypeVar
 
-from pip._vendor.packaging.utils import canonicalize_name
+from pip._vendor.packaging.utils import NormalizedName, canonicalize_name
 
 from pip._internal.build_env import BuildEnvironmentInstaller
 from pip._internal.distributions import make_distribution_for_install_requirement
 from pip._internal.distributions.installed import InstalledDistribution
 from pip._internal.exceptions import (
     DirectoryUrlHashUnsupported,
+    HashError,
     HashMismatch,
     HashUnpinned,
     InstallationError,
@@ -37,6 +41,7 @@ from pip._internal.network.lazy_wheel import (
     dist_from_wheel_url,
 )
 from pip._internal.network.session import PipSession
+from pip._internal.network.utils import HEADERS, raise_for_status
 from pip._internal.operations.build.build_tracker import BuildTracker
 from pip._internal.req.req_install import InstallRequirement
 from pip._internal.utils._log import getLogger
@@ -61,6 +66,8 @@ if TYPE_CHECKING:
 
 logger = getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 def _get_prepared_distribution(
     req: InstallRequirement,
@@ -117,10 +124,8 @@ def get_http_url(
         from_path = already_downloaded_path
         content_type = None
     else:
-        # let's download to a tmp dir
-        from_path, content_type = download(link, temp_dir.path)
-        if hashes:
-            hashes.check_against_path(from_path)
+        # let's download to a tmp dir, checking the hashes while downloading
+        from_path, content_type = download(link, temp_dir.path, hashes)
 
     return File(from_path, content_type)
 
@@ -225,7 +230,7 @@ def _check_download_dir(
 class RequirementPreparer:
     """Prepares a Requirement"""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         build_dir: str,
@@ -243,6 +248,8 @@ class RequirementPreparer:
         lazy_wheel: bool,
         verbosity: int,
         legacy_resolver: bool,
+        download_concurrency: int = 1,
+        metadata_prefetch: bool = False,
     ) -> None:
         super().__init__()
 
@@ -250,7 +257,9 @@ class RequirementPreparer:
         self.build_dir = build_dir
         self.build_tracker = build_tracker
         self._session = session
-        self._download = Downloader(session, progress_bar)
+        self._download = Downloader(
+            session, progress_bar, concurrency=download_concurrency
+        )
         self.finder = finder
 
         # Where still-packed archives should be written to. If None, they are
@@ -279,8 +288,19 @@ class RequirementPreparer:
         # Are we using the legacy resolver?
         self.legacy_resolver = legacy_resolver
 
+        # Should metadata be fetched ahead of time for likely candidates?
+        self.metadata_prefetch = metadata_prefetch and not legacy_resolver
+
         # Memoized downloaded files, as mapping of url: path.
         self._downloaded: dict[str, str] = {}
+        # The hashes downloaded files were already checked against, as mapping
+        # of url: hashes, so they are not read again to check them.
+        self._checked_hashes: dict[str, Hashes] = {}
+
+        # Metadata fetched ahead of time by prefetch_metadata(), as mappings of
+        # metadata file url: contents, and of wheel url: lazy wheel dist.
+        self._prefetched_metadata_files: dict[str, Future[bytes]] = {}
+        self._prefetched_lazy_wheels: dict[str, Future[BaseDistribution | None]] = {}
 
         # Previous "header" printed for a link-based InstallRequirement
         self._previous_requirement_header = ("", "")
@@ -402,13 +422,15 @@ class RequirementPreparer:
             metadata_link,
         )
         # (2) Download the contents of the METADATA file, separate from the dist itself.
-        metadata_file = get_http_url(
-            metadata_link,
-            self._download,
-            hashes=metadata_link.as_hashes(),
-        )
-        with open(metadata_file.path, "rb") as f:
-            metadata_contents = f.read()
+        metadata_contents = self._get_prefetched_metadata_file(metadata_link)
+        if metadata_contents is None:
+            metadata_file = get_http_url(
+                metadata_link,
+                self._download,
+                hashes=metadata_link.as_hashes(),
+            )
+            with open(metadata_file.path, "rb") as f:
+                metadata_contents = f.read()
         # (3) Generate a dist just from those file contents.
         metadata_dist = get_metadata_distribution(
             metadata_contents,
@@ -450,18 +472,99 @@ class RequirementPreparer:
             wheel.version,
         )
         url = link.url.split("#", 1)[0]
+        future = self._prefetched_lazy_wheels.pop(url, None)
+        if future is not None and future.exception() is None:
+            logger.debug("Using prefetched metadata of %s", url)
+            return future.result()
         try:
             return dist_from_wheel_url(name, url, self._session)
         except HTTPRangeRequestUnsupported:
             logger.debug("%s does not support range requests", url)
             return None
 
+    def prefetch_metadata(self, link: Link) -> None:
+        """Fetch the metadata of a remote distribution ahead of time.
+
+        The result is kept for a later prepare_linked_requirement() call of a
+        requirement with this link, which then waits for it instead of
+        fetching the metadata itself. Errors are not reported here; the later
+        call simply fetches the metadata again.
+
+        This blocks on network I/O and is meant to be run in the background.
+        """
+        if not self.metadata_prefetch or self.require_hashes:
+            return
+        if link.is_file or link.url in self._downloaded:
+            return
+
+        metadata_link = link.metadata_link()
+        if metadata_link is not None:
+            self._run_prefetch(
+                self._prefetched_metadata_files,
+                metadata_link.url,
+                lambda: self._download_metadata_file(metadata_link),
+            )
+        elif self.use_lazy_wheel and link.is_wheel:
+            name = canonicalize_name(Wheel(link.filename).name)
+            url = link.url_without_fragment
+            self._run_prefetch(
+                self._prefetched_lazy_wheels,
+                url,
+                lambda: self._download_lazy_wheel_metadata(name, url),
+            )
+
+    @staticmethod
+    def _run_prefetch(
+        prefetches: dict[str, Future[_T]], url: str, fetch: Callable[[], _T]
+    ) -> None:
+        future: Future[_T] = Future()
+        # setdefault() is atomic, so concurrent prefetches of one url only
+        # fetch it once.
+        if prefetches.setdefault(url, future) is not future:
+            return
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(fetch())
+        except Exception as exc:
+            logger.debug("Could not prefetch metadata from %s: %s", url, exc)
+            future.set_exception(exc)
+
+    def _download_metadata_file(self, metadata_link: Link) -> bytes:
+        resp = self._session.get(metadata_link.url_without_fragment, headers=HEADERS)
+        raise_for_status(resp)
+        return resp.content
+
+    def _download_lazy_wheel_metadata(
+        self, name: NormalizedName, url: str
+    ) -> BaseDistribution | None:
+        try:
+            return dist_from_wheel_url(name, url, self._session)
+        except HTTPRangeRequestUnsupported:
+            return None
+
+    def _get_prefetched_metadata_file(self, metadata_link: Link) -> bytes | None:
+        """Wait for the prefetched contents of a metadata file, if any.
+
+        Returns None if the file was not prefetched, or could not be.
+        """
+        future = self._prefetched_metadata_files.pop(metadata_link.url, None)
+        if future is None or future.exception() is not None:
+            return None
+        logger.debug("Using prefetched metadata from %s", metadata_link)
+        metadata_contents = future.result()
+        hashes = metadata_link.as_hashes()
+        if hashes:
+            hashes.check_against_chunks([metadata_contents])
+        return metadata_contents
+
     def _complete_partial_requirements(
         self,
         partially_downloaded_reqs: Iterable[InstallRequirement],
         parallel_builds: bool = False,
-    ) -> None:
-        """Download any requirements which were only fetched by metadata."""
+    ) -> Iterator[InstallRequirement]:
+        """Download any requirements which were only fetched by metadata,
+        yielding each one once it is downloaded and prepared.
+        """
         # Download to a temporary directory. These will be copied over as
         # needed for downstream 'download', 'wheel', and 'install' commands.
         temp_dir = TempDirectory(kind="unpack", globally_managed=True).path
@@ -470,11 +573,19 @@ class RequirementPreparer:
         # `req.local_file_path` on the appropriate requirement after passing
         # all the links at once into BatchDownloader.
         links_to_fully_download: dict[Link, InstallRequirement] = {}
+        hashes: dict[Link, Hashes] = {}
         for req in partially_downloaded_reqs:
             assert req.link
             links_to_fully_download[req.link] = req
+            try:
+                hashes[req.link] = self._get_linked_req_hashes(req)
+            except HashError:
+                # This is reported when the requirement is prepared below.
+                pass
 
-        batch_download = self._download.batch(links_to_fully_download.keys(), temp_dir)
+        batch_download = self._download.batch(
+            links_to_fully_download.keys(), temp_dir, hashes
+        )
         for link, (filepath, _) in batch_download:
             logger.debug("Downloading link %s to %s", link, filepath)
             req = links_to_fully_download[link]
@@ -484,6 +595,8 @@ class RequirementPreparer:
             # Record that the file is downloaded so we don't do it again in
             # _prepare_linked_requirement().
             self._downloaded[req.link.url] = filepath
+            if link in hashes:
+                self._checked_hashes[link.url] = hashes[link]
 
             # If this is an sdist, we need to unpack it after downloading, but the
             # .source_dir won't be set up until we are in _prepare_linked_requirement().
@@ -492,10 +605,11 @@ class RequirementPreparer:
             if not req.is_wheel:
                 req.needs_unpacked_archive(Path(filepath))
 
-        # This step is necessary to ensure all lazy wheels are processed
-        # successfully by the 'download', 'wheel', and 'install' commands.
-        for req in partially_downloaded_reqs:
+            # This step is necessary to ensure all lazy wheels are processed
+            # successfully by the 'download', 'wheel', and 'install' commands.
             self._prepare_linked_requirement(req, parallel_builds)
+            req.needs_more_preparation = False
+            yield req
 
     def prepare_linked_requirement(
         self, req: InstallRequirement, parallel_builds: bool = False
@@ -525,6 +639,7 @@ class RequirementPreparer:
             if file_path is not None:
                 # The file is already available, so mark it as downloaded
                 self._downloaded[req.link.url] = file_path
+                self._checked_hashes[req.link.url] = hashes
             else:
                 # The file is not available, attempt to fetch only metadata
                 metadata_dist = self._fetch_metadata_only(req)
@@ -545,6 +660,18 @@ class RequirementPreparer:
         self, reqs: Iterable[InstallRequirement], parallel_builds: bool = False
     ) -> None:
         """Prepare linked requirements more, if needed."""
+        for _ in self.iter_prepared_requirements_more(reqs, parallel_builds):
+            pass
+
+    def iter_prepared_requirements_more(
+        self, reqs: Iterable[InstallRequirement], parallel_builds: bool = False
+    ) -> Generator[InstallRequirement, None, None]:
+        """Prepare linked requirements more, if needed, yielding each of the
+        requirements needing it as soon as it is prepared.
+
+        The requirements are yielded in no particular order: those whose
+        downloads complete first come first.
+        """
         reqs = [req for req in reqs if req.needs_more_preparation]
         for req in reqs:
             # Determine if any of these requirements were already downloaded.
@@ -553,6 +680,7 @@ class RequirementPreparer:
                 file_path = _check_download_dir(req.link, self.download_dir, hashes)
                 if file_path is not None:
                     self._downloaded[req.link.url] = file_path
+                    self._checked_hashes[req.link.url] = hashes
                     req.needs_more_preparation = False
 
         # Prepare requirements we found were already downloaded for some
@@ -563,10 +691,11 @@ class RequirementPreparer:
                 partially_downloaded_reqs.append(req)
             else:
                 self._prepare_linked_requirement(req, parallel_builds)
+                yield req
 
         # TODO: separate this part out from RequirementPreparer when the v1
         # resolver can be removed!
-        self._complete_partial_requirements(
+        yield from self._complete_partial_requirements(
             partially_downloaded_reqs,
             parallel_builds=parallel_builds,
         )
@@ -625,7 +754,7 @@ class RequirementPreparer:
                 )
         else:
             file_path = self._downloaded[link.url]
-            if hashes:
+            if hashes and self._checked_hashes.get(link.url) != hashes:
                 hashes.check_against_path(file_path)
             local_file = File(file_path, content_type=None)
 
@@ -749,3 +878,73 @@ class RequirementPreparer:
                     "empty virtualenv."
                 )
             return InstalledDistribution(req).get_metadata_distribution()
+
+
+class BackgroundPreparer:
+    """Prepare requirements more in a background thread.
+
+    Each requirement can be waited for on its own, so that it can be used as
+    soon as it is prepared, e.g. installed while the following ones are still
+    downloading. Leaving the context stops the preparation of the requirements
+    not started yet, and waits for the ones in progress.
+    """
+
+    def __init__(
+        self, preparer: RequirementPreparer, reqs: Iterable[InstallRequirement]
+    ) -> None:
+        reqs = [req for req in reqs if req.needs_more_preparation]
+        self._pending = {id(req) for req in reqs}
+        self._prepared = preparer.iter_prepared_requirements_more(reqs)
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._done = False
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._run, name="pip-prepare", daemon=True
+        )
+
+    def __enter__(self) -> BackgroundPreparer:
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        with self._condition:
+            self._stopped = True
+        self._thread.join()
+
+    def _run(self) -> None:
+        error = None
+        try:
+            for req in self._prepared:
+                with self._condition:
+                    self._pending.discard(id(req))
+                    self._condition.notify_all()
+                    if self._stopped:
+                        break
+        except BaseException as exc:
+            error = exc
+        finally:
+            # Closing the generator cancels the downloads not started yet.
+            self._prepared.close()
+            with self._condition:
+                self._done = True
+                self._error = error
+                self._condition.notify_all()
+
+    def wait(self, req: InstallRequirement) -> None:
+        """Wait for the requirement to be prepared.
+
+        If the preparation failed before getting to the requirement, its
+        error is raised.
+        """
+        with self._condition:
+            while id(req) in self._pending and not self._done:
+                self._condition.wait()
+            if id(req) in self._pending:
+                assert self._error is not None
+                raise self._error
@@ -2,15 +2,26 @@ from __future__ import annotations
 
 import collections
 import logging
-from collections.abc import Generator
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from typing import Any, Callable
 
 from pip._internal.cli.progress_bars import BarType, get_install_progress_renderer
+from pip._internal.locations import get_scheme
+from pip._internal.metadata import get_default_environment, get_environment
+from pip._internal.operations.install.wheel import (
+    BytecodeCompiler,
+    WheelStore,
+    get_install_roots,
+    get_installed_roots,
+)
 from pip._internal.utils.logging import indent_log
 
 from .req_file import parse_requirements
 from .req_install import InstallRequirement
 from .req_set import RequirementSet
+from .req_uninstall import UninstallPathSet, remove_installed_files
 
 __all__ = [
     "RequirementSet",
@@ -35,6 +46,200 @@ def _validate_requirements(
         yield req.name, req
 
 
+@dataclass
+class _Installation:
+    """An installation whose uninstallation of the previous version may still
+    need to be committed or rolled back."""
+
+    requirement: InstallRequirement
+    uninstalled_pathset: UninstallPathSet | None
+    unchanged_files: set[str]
+
+    def commit(self) -> None:
+        if self.uninstalled_pathset:
+            self.uninstalled_pathset.commit()
+
+    def rollback(
+        self,
+        root: str | None,
+        home: str | None,
+        prefix: str | None,
+        use_user_site: bool,
+        **install_options: Any,
+    ) -> None:
+        """Remove the installed distribution, and restore the previous one."""
+        requirement = self.requirement
+        assert requirement.name is not None
+        logger.info("Rolling back installation of %s", requirement.name)
+        scheme = get_scheme(
+            requirement.name,
+            user=use_user_site,
+            home=home,
+            root=root,
+            isolated=requirement.isolated,
+            prefix=prefix,
+        )
+        env = get_environment(list({scheme.purelib, scheme.platlib}))
+        dist = env.get_distribution(requirement.name)
+        if dist is not None:
+            remove_installed_files(dist, keep=self.unchanged_files)
+        if self.uninstalled_pathset:
+            self.uninstalled_pathset.rollback()
+
+
+def _install_one(
+    requirement: InstallRequirement,
+    differential_upgrade: bool = False,
+    commit: bool = True,
+    **install_options: Any,
+) -> _Installation:
+    """Install the requirement, replacing the installed version if needed.
+
+    If the installation fails, the previous version is restored. Otherwise,
+    its uninstallation is committed, unless commit is False.
+    """
+    req_name = requirement.name
+    assert req_name is not None
+    unchanged_files: set[str] = set()
+    if requirement.should_reinstall:
+        if differential_upgrade:
+            unchanged_files = requirement.get_unchanged_files(
+                root=install_options["root"],
+                home=install_options["home"],
+                prefix=install_options["prefix"],
+                use_user_site=install_options["use_user_site"],
+            )
+            logger.debug(
+                "Leaving %d unchanged files of %s in place",
+                len(unchanged_files),
+                req_name,
+            )
+        logger.info("Attempting uninstall: %s", req_name)
+        with indent_log():
+            uninstalled_pathset = requirement.uninstall(
+                auto_confirm=True, keep=unchanged_files
+            )
+    else:
+        uninstalled_pathset = None
+
+    try:
+        requirement.install(unchanged_files=unchanged_files, **install_options)
+    except Exception:
+        # if install did not succeed, rollback previous uninstall
+        if uninstalled_pathset and not requirement.install_succeeded:
+            uninstalled_pathset.rollback()
+        raise
+    installation = _Installation(requirement, uninstalled_pathset, unchanged_files)
+    if commit:
+        installation.commit()
+    return installation
+
+
+def _get_install_roots(
+    requirement: InstallRequirement,
+    root: str | None = None,
+    home: str | None = None,
+    prefix: str | None = None,
+    use_user_site: bool = False,
+    **install_options: Any,
+) -> set[tuple[str, str]]:
+    """Return the paths a requirement may write to or remove when installed."""
+    assert requirement.local_file_path
+    roots = get_install_roots(requirement.local_file_path)
+    if requirement.should_reinstall:
+        assert requirement.name
+        dist = get_default_environment().get_distribution(requirement.name)
+        if dist is not None:
+            scheme = get_scheme(
+                requirement.name,
+                user=use_user_site,
+                home=home,
+                root=root,
+                isolated=requirement.isolated,
+                prefix=prefix,
+            )
+            roots |= get_installed_roots(dist, scheme)
+    return roots
+
+
+def _wait_for_each(
+    requirements: Iterable[InstallRequirement],
+    wait: Callable[[InstallRequirement], None],
+    installations: list[_Installation],
+    **install_options: Any,
+) -> Iterator[InstallRequirement]:
+    """Yield each requirement once it is prepared.
+
+    If preparing one fails, the installations made so far are rolled back
+    before the error is raised, so that nothing is installed, as when every
+    requirement is prepared before installing any of them.
+    """
+    for requirement in requirements:
+        try:
+            wait(requirement)
+        except BaseException:
+            for installation in reversed(installations):
+                installation.rollback(**install_options)
+            installations.clear()
+            raise
+        yield requirement
+
+
+def _install_concurrently(
+    requirements: Iterable[InstallRequirement],
+    concurrency: int,
+    **install_options: Any,
+) -> Iterator[InstallRequirement]:
+    """Install requirements in parallel, yielding each one once installed.
+
+    Requirements whose install roots intersect are installed one after the
+    other, in the order they are given. If an installation fails, the ones
+    already running are allowed to finish before the error is raised.
+    """
+    pending = list(requirements)
+    roots = {id(req): _get_install_roots(req, **install_options) for req in pending}
+    running: dict[Future[None], InstallRequirement] = {}
+    busy_roots: set[tuple[str, str]] = set()
+    error: BaseException | None = None
+
+    def install(requirement: InstallRequirement) -> None:
+        with indent_log():
+            _install_one(requirement, **install_options)
+
+    with ThreadPoolExecutor(concurrency, thread_name_prefix="pip-install") as executor:
+        while pending or running:
+            # A requirement waiting on another also holds up the requirements
+            # after it that overlap with it, so that overlapping requirements
+            # are installed in order.
+            blocked = set(busy_roots)
+            for req in list(pending):
+                if error is not None or len(running) >= concurrency:
+                    break
+                if roots[id(req)] & blocked:
+                    blocked |= roots[id(req)]
+                    continue
+                pending.remove(req)
+                busy_roots |= roots[id(req)]
+                blocked |= roots[id(req)]
+                running[executor.submit(install, req)] = req
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                req = running.pop(future)
+                busy_roots -= roots[id(req)]
+                exc = future.exception()
+                if exc is None:
+                    yield req
+                elif error is None:
+                    error = exc
+                else:
+                    logger.error("Failed to install %s: %s", req.name, exc)
+    if error is not None:
+        raise error
+
+
 def install_given_reqs(
     requirements: list[InstallRequirement],
     root: str | None,
@@ -44,11 +249,27 @@ def install_given_reqs(
     use_user_site: bool,
     pycompile: bool,
     progress_bar: BarType,
+    parallel_pycompile: bool = False,
+    concurrency: int = 1,
+    wheel_store: WheelStore | None = None,
+    wait_for_preparation: Callable[[InstallRequirement], None] | None = None,
+    differential_upgrade: bool = False,
 ) -> list[InstallationResult]:
     """
     Install everything in the given list.
 
     (to be called after having downloaded and unpacked the packages)
+
+    With parallel_pycompile, byte-compiling is deferred until every package
+    is installed, and the files of all packages are compiled in parallel.
+    With a concurrency greater than one, packages that do not install to the
+    same paths are installed in parallel.
+    With a wheel store, the files of wheels are linked from the store instead
+    of copied.
+    With wait_for_preparation, requirements may still be in preparation, and
+    each one is waited for just before being installed.
+    With differential_upgrade, reinstalling a package leaves the files that
+    the new version installs unchanged in place, and only replaces the others.
     """
     to_install = collections.OrderedDict(_validate_requirements(requirements))
 
@@ -59,10 +280,41 @@ def install_given_reqs(
         )
 
     installed = []
+    bytecode_compiler = BytecodeCompiler() if pycompile and parallel_pycompile else None
+    install_options: dict[str, Any] = {
+        "root": root,
+        "home": home,
+        "prefix": prefix,
+        "warn_script_location": warn_script_location,
+        "use_user_site": use_user_site,
+        "pycompile": pycompile,
+        "bytecode_compiler": bytecode_compiler,
+        "wheel_store": wheel_store,
+        "differential_upgrade": differential_upgrade,
+    }
 
-    show_progress = logger.isEnabledFor(logging.INFO) and len(to_install) > 1
+    # Requirements still in preparation render their own download progress.
+    show_progress = (
+        logger.isEnabledFor(logging.INFO)
+        and len(to_install) > 1
+        and wait_for_preparation is None
+    )
 
-    items = iter(to_install.values())
+    items: Iterator[InstallRequirement] = iter(to_install.values())
+    # The uninstallations of previous versions are committed once every
+    # requirement is prepared, so that a failed preparation can roll back
+    # the installations made before it. Parallel installations only start
+    # once every requirement is prepared.
+    installations: list[_Installation] = []
+    if wait_for_preparation is not None:
+        items = _wait_for_each(
+            items, wait_for_preparation, installations, **install_options
+        )
+    parallel = concurrency > 1 and len(to_install) > 1
+    if parallel:
+        # Installations are started as the items are consumed, and each one
+        # is yielded once installed.
+        items = _install_concurrently(items, concurrency, **install_options)
     if show_progress:
         renderer = get_install_progress_renderer(
             bar_type=progress_bar, total=len(to_install)
@@ -70,34 +322,25 @@ def install_given_reqs(
         items = renderer(items)
 
     with indent_log():
-        for requirement in items:
-            req_name = requirement.name
-            assert req_name is not None
-            if requirement.should_reinstall:
-                logger.info("Attempting uninstall: %s", req_name)
-                with indent_log():
-                    uninstalled_pathset = requirement.uninstall(auto_confirm=True)
-            else:
-                uninstalled_pathset = None
-
-            try:
-                requirement.install(
-                    root=root,
-                    home=home,
-                    prefix=prefix,
-                    warn_script_location=warn_script_location,
-                    use_user_site=use_user_site,
-                    pycompile=pycompile,
-                )
-            except Exception:
-                # if install did not succeed, rollback previous uninstall
-                if uninstalled_pathset and not requirement.install_succeeded:
-                    uninstalled_pathset.rollback()
-                raise
-            else:
-                if uninstalled_pathset and requirement.install_succeeded:
-                    uninstalled_pathset.commit()
-
-            installed.append(InstallationResult(req_name))
+        try:
+            for requirement in items:
+                req_name = requirement.name
+                assert req_name is not None
+                if not parallel:
+                    installation = _install_one(
+                        requirement,
+                        commit=wait_for_preparation is None,
+                        **install_options,
+                    )
+                    if wait_for_preparation is not None:
+                        installations.append(installation)
+                installed.append(InstallationResult(req_name))
+        finally:
+            # A failed installation leaves the ones before it installed.
+            for installation in installations:
+                installation.commit()
+
+        if bytecode_compiler is not None:
+            bytecode_compiler.compile()
 
     return installed
@@ -34,7 +34,12 @@ from pip._internal.models.direct_url import DirectUrl
 from pip._internal.models.link import Link
 from pip._internal.operations.build.metadata import generate_metadata
 from pip._internal.operations.build.metadata_editable import generate_editable_metadata
-from pip._internal.operations.install.wheel import install_wheel
+from pip._internal.operations.install.wheel import (
+    BytecodeCompiler,
+    WheelStore,
+    get_unchanged_files,
+    install_wheel,
+)
 from pip._internal.pyproject import load_pyproject_toml, make_pyproject_path
 from pip._internal.req.req_uninstall import UninstallPathSet
 from pip._internal.utils.deprecation import deprecated
@@ -660,7 +665,10 @@ class InstallRequirement:
 
     # Top-level Actions
     def uninstall(
-        self, auto_confirm: bool = False, verbose: bool = False
+        self,
+        auto_confirm: bool = False,
+        verbose: bool = False,
+        keep: Iterable[str] = (),
     ) -> UninstallPathSet | None:
         """
         Uninstall the distribution currently satisfying this requirement.
@@ -673,6 +681,7 @@ class InstallRequirement:
         modify that virtual environment, even if the virtualenv is
         linked to global site-packages.
 
+        The files in ``keep`` are left in place.
         """
         assert self.req
         dist = get_default_environment().get_distribution(self.req.name)
@@ -682,6 +691,7 @@ class InstallRequirement:
         logger.info("Found existing installation: %s", dist)
 
         uninstalled_pathset = UninstallPathSet.from_dist(dist)
+        uninstalled_pathset.keep(keep)
         uninstalled_pathset.remove(auto_confirm, verbose)
         return uninstalled_pathset
 
@@ -766,6 +776,32 @@ class InstallRequirement:
 
         logger.info("Saved %s", display_path(archive_path))
 
+    def get_unchanged_files(
+        self,
+        root: str | None = None,
+        home: str | None = None,
+        prefix: str | None = None,
+        use_user_site: bool = False,
+    ) -> set[str]:
+        """Return the files of the installed distribution that installing
+        this requirement would leave unchanged.
+        """
+        assert self.req is not None
+        assert self.is_wheel
+        assert self.local_file_path
+        dist = get_default_environment().get_distribution(self.req.name)
+        if not dist:
+            return set()
+        scheme = get_scheme(
+            self.req.name,
+            user=use_user_site,
+            home=home,
+            root=root,
+            isolated=self.isolated,
+            prefix=prefix,
+        )
+        return get_unchanged_files(self.req.name, self.local_file_path, scheme, dist)
+
     def install(
         self,
         root: str | None = None,
@@ -774,6 +810,9 @@ class InstallRequirement:
         warn_script_location: bool = True,
         use_user_site: bool = False,
         pycompile: bool = True,
+        bytecode_compiler: BytecodeCompiler | None = None,
+        wheel_store: WheelStore | None = None,
+        unchanged_files: Collection[str] = (),
     ) -> None:
         assert self.req is not None
         scheme = get_scheme(
@@ -797,6 +836,9 @@ class InstallRequirement:
             warn_script_location=warn_script_location,
             direct_url=self.download_info if self.is_direct else None,
             requested=self.user_supplied,
+            bytecode_compiler=bytecode_compiler,
+            wheel_store=wheel_store,
+            unchanged_files=unchanged_files,
         )
         self.install_succeeded = True
 
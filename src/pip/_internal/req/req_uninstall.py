@@ -96,14 +96,18 @@ def compact(paths: Iterable[str]) -> set[str]:
 
     sep = os.path.sep
     short_paths: set[str] = set()
+    # The directories of the paths kept so far. A path is left out when one
+    # of its parent directories is in there.
+    short_dirs: set[str] = set()
     for path in sorted(paths, key=len):
-        should_skip = any(
-            path.startswith(shortpath.rstrip("*"))
-            and path[len(shortpath.rstrip("*").rstrip(sep))] == sep
-            for shortpath in short_paths
-        )
-        if not should_skip:
+        head, tail = path, None
+        while head != tail:
+            head, tail = os.path.dirname(head), head
+            if head in short_dirs:
+                break
+        else:
             short_paths.add(path)
+            short_dirs.add(path.rstrip("*").rstrip(sep))
     return short_paths
 
 
@@ -114,31 +118,72 @@ def compress_for_rename(paths: Iterable[str]) -> set[str]:
     included every file on disk.
     """
     case_map = {os.path.normcase(p): p for p in paths}
-    remaining = set(case_map)
-    unchecked = sorted({os.path.split(p)[0] for p in case_map.values()}, key=len)
-    wildcards: set[str] = set()
 
-    def norm_join(*a: str) -> str:
-        return os.path.normcase(os.path.join(*a))
-
-    for root in unchecked:
-        if any(os.path.normcase(root).startswith(w) for w in wildcards):
-            # This directory has already been handled.
+    # The directories holding the paths are the candidates to be renamed as a
+    # whole. Each of them, and every directory above them, is a prefix.
+    roots: dict[str, str] = {}
+    for key, path in case_map.items():
+        roots.setdefault(os.path.dirname(key), os.path.dirname(path))
+    prefixes: set[str] = set()
+    for root in roots:
+        head, tail = root, None
+        while head != tail and head not in prefixes:
+            prefixes.add(head)
+            head, tail = os.path.dirname(head), head
+
+    # Whether each candidate only holds files in the set, found with a single
+    # pass over the tree under each top-level candidate.
+    complete: dict[str, bool] = {}
+
+    def scan(directory: str) -> bool:
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            entries = []
+        is_complete = True
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                if os.path.normcase(entry.path) not in case_map:
+                    is_complete = False
+            elif not entry.is_symlink():
+                # Like os.walk, do not follow links to directories.
+                subdirs.append(entry.path)
+        for subdir in subdirs:
+            # Once incomplete, only the directories holding other candidates
+            # are left to scan.
+            if is_complete or os.path.normcase(subdir) in prefixes:
+                is_complete = scan(subdir) and is_complete
+        key = os.path.normcase(directory)
+        if key in roots:
+            complete[key] = is_complete
+        return is_complete
+
+    # A candidate is renamed as a whole when it is complete, unless one of
+    # the directories above it already is.
+    covered: dict[str, bool] = {}
+    wildcards: set[str] = set()
+    for root in sorted(roots, key=len):
+        head, tail = os.path.dirname(root), root
+        while head != tail and head not in roots:
+            head, tail = os.path.dirname(head), head
+        if covered.get(head, False):
+            covered[root] = True
             continue
+        if root not in complete:
+            scan(roots[root])
+        covered[root] = complete[root]
+        if complete[root]:
+            wildcards.add(roots[root] + os.sep)
 
-        all_files: set[str] = set()
-        all_subdirs: set[str] = set()
-        for dirname, subdirs, files in os.walk(root):
-            all_subdirs.update(norm_join(root, dirname, d) for d in subdirs)
-            all_files.update(norm_join(root, dirname, f) for f in files)
-        # If all the files we found are in our remaining set of files to
-        # remove, then remove them from the latter set and add a wildcard
-        # for the directory.
-        if not (all_files - remaining):
-            remaining.difference_update(all_files)
-            wildcards.add(root + os.sep)
-
-    return set(map(case_map.__getitem__, remaining)) | wildcards
+    return {
+        path for key, path in case_map.items() if not covered[os.path.dirname(key)]
+    } | wildcards
 
 
 def compress_for_output_listing(paths: Iterable[str]) -> tuple[set[str], set[str]]:
@@ -206,12 +251,19 @@ class StashedUninstallPathSet:
         """Stashes a directory.
 
         Directories are stashed adjacent to their original location if
-        possible, or else moved/copied into the user's temp dir."""
+        possible, or else moved/copied into the user's temp dir. Metadata
+        directories are always moved into the user's temp dir, so that they
+        are not found as invalid distributions until the uninstall is
+        committed."""
 
-        try:
-            save_dir: TempDirectory = AdjacentTempDirectory(path)
-        except OSError:
+        save_dir: TempDirectory
+        if os.path.normpath(path).endswith((".dist-info", ".egg-info")):
             save_dir = TempDirectory(kind="uninstall")
+        else:
+            try:
+                save_dir = AdjacentTempDirectory(path)
+            except OSError:
+                save_dir = TempDirectory(kind="uninstall")
         self._save_dirs[os.path.normcase(path)] = save_dir
 
         return save_dir.path
@@ -349,6 +401,22 @@ class UninstallPathSet:
         else:
             self._refuse.add(pth_file)
 
+    def keep(self, paths: Iterable[str]) -> None:
+        """Leave the given paths in place when removing the others.
+
+        This is used when upgrading, for the files that the new version
+        installs unchanged. Like in ``add``, the bytecode of .py files goes
+        with them.
+        """
+        for path in paths:
+            head, tail = os.path.split(path)
+            path = os.path.join(
+                self._normalize_path_cached(head), os.path.normcase(tail)
+            )
+            self._paths.discard(path)
+            if os.path.splitext(path)[1] == ".py":
+                self.keep([cache_from_source(path)])
+
     def remove(self, auto_confirm: bool = False, verbose: bool = False) -> None:
         """Remove paths in ``self._paths`` with confirmation (unless
         ``auto_confirm`` is True)."""
@@ -581,6 +649,34 @@ class UninstallPathSet:
         return paths_to_remove
 
 
+def remove_installed_files(dist: BaseDistribution, keep: Iterable[str] = ()) -> None:
+    """Remove the files recorded as installed by a distribution.
+
+    This undoes an installation made by this process, so unlike
+    ``UninstallPathSet``, paths outside of the environment are removed too.
+    The files in ``keep``, and their bytecode, are left in place.
+    """
+    kept = set()
+    for path in keep:
+        path = os.path.normcase(os.path.normpath(path))
+        kept.add(path)
+        if path.endswith(".py"):
+            kept.add(os.path.normcase(cache_from_source(path)))
+
+    paths = set()
+    for path in uninstallation_paths(dist):
+        path = os.path.normcase(os.path.normpath(path))
+        if path.endswith(".py"):
+            paths.add(os.path.normcase(cache_from_source(path)))
+        paths.add(path)
+    paths = {p for p in paths - kept if os.path.lexists(p)}
+
+    stash = StashedUninstallPathSet()
+    for path in sorted(compact(compress_for_rename(paths))):
+        stash.stash(path)
+    stash.commit()
+
+
 class UninstallPthEntries:
     def __init__(self, pth_file: str) -> None:
         self.file = pth_file
@@ -27,6 +27,7 @@ from pip._internal.req.constructors import (
 from pip._internal.req.req_install import InstallRequirement
 from pip._internal.utils.direct_url_helpers import direct_url_from_link
 from pip._internal.utils.misc import normalize_version_info
+from pip._internal.utils.tracing import trace_span
 
 from .base import Candidate, Requirement, format_name
 
@@ -243,7 +244,9 @@ class _InstallRequirementBackedCandidate(Candidate):
 
     def _prepare(self) -> BaseDistribution:
         try:
-            dist = self._prepare_distribution()
+            # The name of a candidate may only be known from its metadata.
+            with trace_span("prepare_metadata", self._name, link=str(self._link)):
+                dist = self._prepare_distribution()
         except HashError as e:
             # Provide HashError the underlying ireq that caused it. This
             # provides context for the resulting error message to show the
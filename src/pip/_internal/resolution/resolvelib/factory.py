@@ -5,6 +5,7 @@ import copy
 import functools
 import logging
 from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Callable,
@@ -78,6 +79,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Number of projects looked up in the background when metadata prefetching
+# is enabled.
+_PREFETCH_WORKERS = 4
+
 C = TypeVar("C")
 Cache = dict[Link, C]
 
@@ -128,10 +133,65 @@ class Factory:
         else:
             self._installed_dists = {}
 
+        self._prefetch_executor: ThreadPoolExecutor | None = None
+        self._prefetched_names: set[NormalizedName] = set()
+        if preparer.metadata_prefetch:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=_PREFETCH_WORKERS, thread_name_prefix="pip-prefetch"
+            )
+
     @property
     def force_reinstall(self) -> bool:
         return self._force_reinstall
 
+    def close(self) -> None:
+        """Stop prefetching metadata that will not be needed anymore."""
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_executor = None
+
+    def prefetch_candidates(self, requirements: Iterable[Requirement]) -> None:
+        """Start fetching the metadata of likely candidates in the background.
+
+        For each requirement that needs to be looked up on the index, this
+        finds its best candidate and fetches its metadata ahead of time, so it
+        is likely to be available when the resolver gets to the requirement.
+        """
+        if self._prefetch_executor is None:
+            return
+        for requirement in requirements:
+            _, ireq = requirement.get_candidate_lookup()
+            if ireq is None or ireq.req is None or ireq.editable:
+                continue
+            name = canonicalize_name(ireq.req.name)
+            if name in self._prefetched_names:
+                continue
+            self._prefetched_names.add(name)
+            specifier = ireq.req.specifier
+            installed_dist = self._installed_dists.get(name)
+            if installed_dist is not None and specifier.contains(
+                installed_dist.version, prereleases=True
+            ):
+                # The installed distribution will most likely be used.
+                continue
+            self._prefetch_executor.submit(
+                self._prefetch_best_candidate,
+                name,
+                specifier,
+                ireq.hashes(trust_internet=False),
+            )
+
+    def _prefetch_best_candidate(
+        self, name: NormalizedName, specifier: SpecifierSet, hashes: Hashes
+    ) -> None:
+        result = self._finder.find_best_candidate(name, specifier, hashes)
+        best = result.best_candidate
+        if best is None or best.link.is_yanked:
+            return
+        if self.get_wheel_cache_entry(best.link, name) is not None:
+            return
+        self.preparer.prefetch_metadata(best.link)
+
     def _fail_if_link_is_unsupported_wheel(self, link: Link) -> None:
         if not link.is_wheel:
             return
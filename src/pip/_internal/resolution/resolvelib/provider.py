@@ -302,5 +302,13 @@ class PipProvider(_ProviderBase):
 
     def get_dependencies(self, candidate: Candidate) -> Iterable[Requirement]:
         with_requires = not self._ignore_dependencies
+        if with_requires and self._factory.preparer.metadata_prefetch:
+            # The resolver looks up every dependency next, so start fetching
+            # their metadata in the background right away.
+            dependencies = [
+                r for r in candidate.iter_dependencies(with_requires) if r is not None
+            ]
+            self._factory.prefetch_candidates(dependencies)
+            return dependencies
         # iter_dependencies() can perform nontrivial work so delay until needed.
         return (r for r in candidate.iter_dependencies(with_requires) if r is not None)
@@ -7,7 +7,12 @@ import os
 from typing import TYPE_CHECKING, cast
 
 from pip._vendor.packaging.utils import canonicalize_name
-from pip._vendor.resolvelib import BaseReporter, ResolutionImpossible, ResolutionTooDeep
+from pip._vendor.resolvelib import (
+    AbstractProvider,
+    BaseReporter,
+    ResolutionImpossible,
+    ResolutionTooDeep,
+)
 from pip._vendor.resolvelib import Resolver as RLResolver
 from pip._vendor.resolvelib.structs import DirectedGraph
 
@@ -24,7 +29,12 @@ from pip._internal.resolution.resolvelib.reporter import (
     PipDebuggingReporter,
     PipReporter,
 )
+from pip._internal.resolution.resolvelib.tracing import (
+    TracingProvider,
+    TracingReporter,
+)
 from pip._internal.utils.packaging import get_requirement
+from pip._internal.utils.tracing import tracing
 
 from .base import Candidate, Requirement
 from .factory import Factory
@@ -54,6 +64,7 @@ class Resolver(BaseResolver):
         force_reinstall: bool,
         upgrade_strategy: str,
         py_version_info: tuple[int, ...] | None = None,
+        trace_file: str | None = None,
     ):
         super().__init__()
         assert upgrade_strategy in self._allowed_strategies
@@ -71,43 +82,55 @@ class Resolver(BaseResolver):
         )
         self.ignore_dependencies = ignore_dependencies
         self.upgrade_strategy = upgrade_strategy
+        self.trace_file = trace_file
         self._result: Result | None = None
 
     def resolve(
         self, root_reqs: list[InstallRequirement], check_supported_wheels: bool
     ) -> RequirementSet:
         collected = self.factory.collect_root_requirements(root_reqs)
-        provider = PipProvider(
+        pip_provider = PipProvider(
             factory=self.factory,
             constraints=collected.constraints,
             ignore_dependencies=self.ignore_dependencies,
             upgrade_strategy=self.upgrade_strategy,
             user_requested=collected.user_requested,
         )
+        provider: AbstractProvider[Requirement, Candidate, str] = pip_provider
         if "PIP_RESOLVER_DEBUG" in os.environ:
             reporter: BaseReporter[Requirement, Candidate, str] = PipDebuggingReporter()
         else:
-            reporter = PipReporter(constraints=provider.constraints)
+            reporter = PipReporter(constraints=pip_provider.constraints)
 
-        resolver: RLResolver[Requirement, Candidate, str] = RLResolver(
-            provider,
-            reporter,
-        )
+        with contextlib.ExitStack() as stack:
+            if self.trace_file is not None:
+                tracer = stack.enter_context(tracing(self.trace_file))
+                provider = TracingProvider(provider, tracer)
+                reporter = TracingReporter(reporter, tracer)
 
-        try:
-            limit_how_complex_resolution_can_be = 200000
-            result = self._result = resolver.resolve(
-                collected.requirements, max_rounds=limit_how_complex_resolution_can_be
+            resolver: RLResolver[Requirement, Candidate, str] = RLResolver(
+                provider,
+                reporter,
             )
 
-        except ResolutionImpossible as e:
-            error = self.factory.get_installation_error(
-                cast("ResolutionImpossible[Requirement, Candidate]", e),
-                collected.constraints,
-            )
-            raise error from e
-        except ResolutionTooDeep:
-            raise ResolutionTooDeepError from None
+            self.factory.prefetch_candidates(collected.requirements)
+            try:
+                limit_how_complex_resolution_can_be = 200000
+                result = self._result = resolver.resolve(
+                    collected.requirements,
+                    max_rounds=limit_how_complex_resolution_can_be,
+                )
+
+            except ResolutionImpossible as e:
+                error = self.factory.get_installation_error(
+                    cast("ResolutionImpossible[Requirement, Candidate]", e),
+                    collected.constraints,
+                )
+                raise error from e
+            except ResolutionTooDeep:
+                raise ResolutionTooDeepError from None
+            finally:
+                self.factory.close()
 
         req_set = RequirementSet(check_supported_wheels=check_supported_wheels)
         # process candidates with extras last to ensure their base equivalent is
@@ -0,0 +1,160 @@
+"""Provider and reporter wrappers recording resolution into a trace."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Collection, Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from pip._vendor.resolvelib.providers import AbstractProvider
+from pip._vendor.resolvelib.reporters import BaseReporter
+
+from pip._internal.utils.tracing import Tracer
+
+from .base import Candidate, Requirement
+
+if TYPE_CHECKING:
+    from pip._vendor.resolvelib.providers import Preference
+    from pip._vendor.resolvelib.resolvers import RequirementInformation
+    from pip._vendor.resolvelib.structs import Matches
+
+    PreferenceInformation = RequirementInformation[Requirement, Candidate]
+
+    _ProviderBase = AbstractProvider[Requirement, Candidate, str]
+    _ReporterBase = BaseReporter[Requirement, Candidate, str]
+else:
+    _ProviderBase = AbstractProvider
+    _ReporterBase = BaseReporter
+
+
+class TracingProvider(_ProviderBase):
+    """Count and time the calls resolvelib makes to a provider."""
+
+    def __init__(self, provider: _ProviderBase, tracer: Tracer) -> None:
+        self._provider = provider
+        self._tracer = tracer
+
+    def identify(self, requirement_or_candidate: Requirement | Candidate) -> str:
+        return self._provider.identify(requirement_or_candidate)
+
+    def narrow_requirement_selection(
+        self,
+        identifiers: Iterable[str],
+        resolutions: Mapping[str, Candidate],
+        candidates: Mapping[str, Iterator[Candidate]],
+        information: Mapping[str, Iterator[PreferenceInformation]],
+        backtrack_causes: Sequence[PreferenceInformation],
+    ) -> Iterable[str]:
+        with self._tracer.measure("narrow_requirement_selection"):
+            return self._provider.narrow_requirement_selection(
+                identifiers, resolutions, candidates, information, backtrack_causes
+            )
+
+    def get_preference(
+        self,
+        identifier: str,
+        resolutions: Mapping[str, Candidate],
+        candidates: Mapping[str, Iterator[Candidate]],
+        information: Mapping[str, Iterator[PreferenceInformation]],
+        backtrack_causes: Sequence[PreferenceInformation],
+    ) -> Preference:
+        with self._tracer.measure("get_preference", identifier):
+            return self._provider.get_preference(
+                identifier, resolutions, candidates, information, backtrack_causes
+            )
+
+    def find_matches(
+        self,
+        identifier: str,
+        requirements: Mapping[str, Iterator[Requirement]],
+        incompatibilities: Mapping[str, Iterator[Candidate]],
+    ) -> Matches[Candidate]:
+        with self._tracer.measure("find_matches", identifier):
+            return self._provider.find_matches(
+                identifier, requirements, incompatibilities
+            )
+
+    def is_satisfied_by(self, requirement: Requirement, candidate: Candidate) -> bool:
+        return self._provider.is_satisfied_by(requirement, candidate)
+
+    def get_dependencies(self, candidate: Candidate) -> Iterable[Requirement]:
+        # Dependencies are produced lazily, so the time spent producing them
+        # is only known once they have all been iterated over.
+        elapsed = 0
+        start = time.perf_counter_ns()
+        try:
+            dependencies = iter(self._provider.get_dependencies(candidate))
+            while True:
+                try:
+                    dependency = next(dependencies)
+                except StopIteration:
+                    break
+                elapsed += time.perf_counter_ns() - start
+                yield dependency
+                start = time.perf_counter_ns()
+            elapsed += time.perf_counter_ns() - start
+        finally:
+            self._tracer.record(candidate.name, "get_dependencies_calls")
+            self._tracer.record(
+                candidate.name, "get_dependencies_seconds", elapsed / 10**9
+            )
+
+
+class TracingReporter(_ReporterBase):
+    """Record resolution rounds, backtracking and pins, and forward all events
+    to another reporter."""
+
+    def __init__(self, reporter: _ReporterBase, tracer: Tracer) -> None:
+        self._reporter = reporter
+        self._tracer = tracer
+        self._round_index = 0
+        self._round_start = 0
+
+    def starting(self) -> None:
+        self._reporter.starting()
+
+    def starting_round(self, index: int) -> None:
+        self._round_index = index
+        self._round_start = time.perf_counter_ns()
+        self._reporter.starting_round(index)
+
+    def _end_round(self) -> None:
+        self._tracer.complete(
+            "round",
+            self._round_start,
+            time.perf_counter_ns(),
+            index=self._round_index,
+        )
+        self._tracer.record(None, "rounds")
+
+    def ending_round(self, index: int, state: Any) -> None:
+        self._end_round()
+        self._reporter.ending_round(index, state)
+
+    def ending(self, state: Any) -> None:
+        # ending_round() is not called for the round that ends the resolution.
+        self._end_round()
+        self._reporter.ending(state)
+
+    def adding_requirement(
+        self, requirement: Requirement, parent: Candidate | None
+    ) -> None:
+        self._reporter.adding_requirement(requirement, parent)
+
+    def resolving_conflicts(
+        self, causes: Collection[RequirementInformation[Requirement, Candidate]]
+    ) -> None:
+        identifiers = sorted({cause.requirement.name for cause in causes})
+        self._tracer.instant("backtrack", causes=identifiers)
+        for identifier in identifiers:
+            self._tracer.record(identifier, "backtracks")
+        self._reporter.resolving_conflicts(causes)
+
+    def rejecting_candidate(self, criterion: Any, candidate: Candidate) -> None:
+        self._tracer.record(candidate.name, "rejected_candidates")
+        self._reporter.rejecting_candidate(criterion, candidate)
+
+    def pinning(self, candidate: Candidate) -> None:
+        self._tracer.instant("pin", candidate.name, version=str(candidate.version))
+        self._tracer.record(candidate.name, "pins")
+        self._reporter.pinning(candidate)
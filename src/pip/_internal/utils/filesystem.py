@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import errno
 import fnmatch
 import os
 import os.path
 import random
+import shutil
+import stat
 import sys
 from collections.abc import Generator
 from contextlib import contextmanager
@@ -70,6 +73,66 @@ def adjacent_tmp_file(path: str, **kwargs: Any) -> Generator[BinaryIO, None, Non
 
 replace = retry(stop_after_delay=1, wait=0.25)(os.replace)
 
+# The Linux ioctl making a file share the data of another, copy-on-write.
+_FICLONE = 0x40049409
+
+
+def _clone_file(src: str, dst: str) -> None:
+    import fcntl
+
+    try:
+        with open(src, "rb") as source, open(dst, "wb") as target:
+            fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+    except OSError:
+        if os.path.exists(dst):
+            os.unlink(dst)
+        raise
+
+
+def _copy_executable_bits(src: str, dst: str) -> None:
+    """Make dst executable by whoever can read it, if src is executable."""
+    if os.stat(src).st_mode & 0o111:
+        mode = stat.S_IMODE(os.stat(dst).st_mode)
+        os.chmod(dst, mode | (mode & 0o444) >> 2)
+
+
+class FileLinker:
+    """Create files with the contents of existing ones, sharing their data
+    where the file system allows it.
+
+    Files are cloned (copy-on-write) where supported, or else hard linked, or
+    else copied. A method that fails, e.g. because the files are on different
+    file systems, is not tried again by the same linker. Clones and copies get
+    the permissions of new files, plus the executable bits of the source, so
+    they are writable even if the source is not. Hard links share the
+    permissions of the source.
+    """
+
+    def __init__(self) -> None:
+        self._can_clone = sys.platform == "linux"
+        self._can_link = True
+
+    def link(self, src: str, dst: str) -> None:
+        if self._can_clone:
+            try:
+                _clone_file(src, dst)
+            except OSError:
+                self._can_clone = False
+            else:
+                _copy_executable_bits(src, dst)
+                return
+        if self._can_link:
+            try:
+                os.link(src, dst)
+                return
+            except OSError as exc:
+                # Reaching the maximum number of links of a file says nothing
+                # about linking the other ones.
+                if exc.errno != errno.EMLINK:
+                    self._can_link = False
+        shutil.copyfile(src, dst)
+        _copy_executable_bits(src, dst)
+
 
 # test_writable_dir and _test_writable_dir_win are copied from Flit,
 # with the author's agreement to also place them under pip's license.
@@ -66,12 +66,9 @@ class Hashes:
         """Return whether the given hex digest is allowed."""
         return hex_digest in self._allowed.get(hash_name, [])
 
-    def check_against_chunks(self, chunks: Iterable[bytes]) -> None:
-        """Check good hashes against ones built from iterable of chunks of
-        data.
-
-        Raise HashMismatch if none match.
-
+    def new_hashers(self) -> dict[str, _Hash]:
+        """Return a new hash object for each algorithm with known-good hashes,
+        to be fed the data and passed to check_against_hashers().
         """
         gots = {}
         for hash_name in self._allowed.keys():
@@ -79,16 +76,32 @@ class Hashes:
                 gots[hash_name] = hashlib.new(hash_name)
             except (ValueError, TypeError):
                 raise InstallationError(f"Unknown hash name: {hash_name}")
+        return gots
 
-        for chunk in chunks:
-            for hash in gots.values():
-                hash.update(chunk)
+    def check_against_hashers(self, gots: dict[str, _Hash]) -> None:
+        """Check good hashes against hash objects created by new_hashers().
 
+        Raise HashMismatch if none match.
+
+        """
         for hash_name, got in gots.items():
             if got.hexdigest() in self._allowed[hash_name]:
                 return
         self._raise(gots)
 
+    def check_against_chunks(self, chunks: Iterable[bytes]) -> None:
+        """Check good hashes against ones built from iterable of chunks of
+        data.
+
+        Raise HashMismatch if none match.
+
+        """
+        gots = self.new_hashers()
+        for chunk in chunks:
+            for hash in gots.values():
+                hash.update(chunk)
+        self.check_against_hashers(gots)
+
     def _raise(self, gots: dict[str, _Hash]) -> NoReturn:
         raise HashMismatch(self._allowed, gots)
 
@@ -107,6 +107,58 @@ def get_indentation() -> int:
     return getattr(_log_state, "indentation", 0)
 
 
+class _HeldRecordsFilter(Filter):
+    """Hold back the records a handler gets from threads in hold_logs()."""
+
+    def __init__(self, handler: logging.Handler) -> None:
+        super().__init__()
+        self.handler = handler
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        held_records = getattr(_log_state, "held_records", None)
+        if held_records is None:
+            return True
+        held_records.append((self.handler, record, get_indentation()))
+        return False
+
+
+_held_logs_lock = threading.Lock()
+
+
+def logs_held() -> bool:
+    """Return whether the logs of the current thread are held back."""
+    return getattr(_log_state, "held_records", None) is not None
+
+
+@contextlib.contextmanager
+def hold_logs() -> Generator[None, None, None]:
+    """
+    A context manager holding back the log messages of the current thread,
+    to emit them all at once at its end. This keeps the output of tasks
+    running in parallel threads from being interleaved.
+    """
+    held_records: list[tuple[logging.Handler, logging.LogRecord, int]] = []
+    with _held_logs_lock:
+        for handler in logging.getLogger().handlers:
+            if not any(isinstance(f, _HeldRecordsFilter) for f in handler.filters):
+                handler.addFilter(_HeldRecordsFilter(handler))
+    _log_state.held_records = held_records
+    try:
+        yield
+    finally:
+        _log_state.held_records = None
+        # Records are formatted when handled, so emit them with the
+        # indentation they were logged with.
+        indentation = get_indentation()
+        with _held_logs_lock:
+            try:
+                for handler, record, record_indentation in held_records:
+                    _log_state.indentation = record_indentation
+                    handler.handle(record)
+            finally:
+                _log_state.indentation = indentation
+
+
 class IndentingFormatter(logging.Formatter):
     default_time_format = "%Y-%m-%dT%H:%M:%S"
 
@@ -4,7 +4,9 @@ import logging
 import os
 import shlex
 import subprocess
-from collections.abc import Iterable, Mapping
+import threading
+from collections.abc import Generator, Iterable, Mapping
+from contextlib import contextmanager
 from typing import Any, Callable, Literal, Union
 
 from pip._vendor.rich.markup import escape
@@ -56,6 +58,22 @@ def reveal_command_args(args: list[str] | CommandArgs) -> list[str]:
     return [arg.secret if isinstance(arg, HiddenText) else arg for arg in args]
 
 
+_thread_state = threading.local()
+
+
+@contextmanager
+def thread_environ(environ: Mapping[str, str]) -> Generator[None, None, None]:
+    """Set environment variables for the subprocesses started by
+    call_subprocess() from the current thread, leaving os.environ alone.
+    """
+    saved = getattr(_thread_state, "environ", {})
+    _thread_state.environ = {**saved, **environ}
+    try:
+        yield
+    finally:
+        _thread_state.environ = saved
+
+
 def call_subprocess(
     cmd: list[str] | CommandArgs,
     show_stdout: bool = False,
@@ -121,6 +139,7 @@ def call_subprocess(
 
     log_subprocess("Running command %s", command_desc)
     env = os.environ.copy()
+    env.update(getattr(_thread_state, "environ", {}))
     if extra_environ:
         env.update(extra_environ)
     for name in unset_environ:
@@ -0,0 +1,175 @@
+"""Opt-in instrumentation, written out in the Chrome trace event format.
+
+A trace can be loaded in ``chrome://tracing`` or https://ui.perfetto.dev.
+Besides the events, it holds counters aggregated by resolver identifier (the
+project name, with extras if any) under ``otherData``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_tracer: Tracer | None = None
+
+
+class _Frame:
+    def __init__(self, identifier: str | None) -> None:
+        self.identifier = identifier
+        self.bytes = 0
+
+
+class Tracer:
+    """Collect trace events and per-identifier counters.
+
+    Spans are tracked per thread, so bytes downloaded are attributed to the
+    innermost span of the thread that downloaded them.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = time.perf_counter_ns()
+        self.events: list[dict[str, Any]] = []
+        self.totals: defaultdict[str, float] = defaultdict(int)
+        self.stats: defaultdict[str, defaultdict[str, float]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+
+    def _get_stack(self) -> list[_Frame]:
+        try:
+            return self._local.stack
+        except AttributeError:
+            stack = self._local.stack = []
+            return stack
+
+    def _timestamp(self, ns: int) -> float:
+        return (ns - self._origin) / 1000
+
+    def record(self, identifier: str | None, key: str, amount: float = 1) -> None:
+        """Add ``amount`` to a counter, in total and for the given identifier."""
+        with self._lock:
+            self.totals[key] += amount
+            if identifier is not None:
+                self.stats[identifier][key] += amount
+
+    def add_event(self, event: dict[str, Any]) -> None:
+        event.setdefault("pid", os.getpid())
+        event.setdefault("tid", threading.get_ident())
+        with self._lock:
+            self.events.append(event)
+
+    def instant(self, name: str, identifier: str | None = None, **args: Any) -> None:
+        if identifier is not None:
+            args["identifier"] = identifier
+        ts = self._timestamp(time.perf_counter_ns())
+        self.add_event({"name": name, "ph": "i", "s": "t", "ts": ts, "args": args})
+
+    def complete(self, name: str, start: int, end: int, **args: Any) -> None:
+        """Add an event for something that ran between two perf_counter_ns()."""
+        self.add_event(
+            {
+                "name": name,
+                "ph": "X",
+                "ts": self._timestamp(start),
+                "dur": (end - start) / 1000,
+                "args": args,
+            }
+        )
+
+    @contextlib.contextmanager
+    def measure(self, name: str, identifier: str | None = None) -> Iterator[None]:
+        """Count calls and time spent, without adding a trace event."""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self.record(identifier, f"{name}_calls")
+            self.record(identifier, f"{name}_seconds", (end - start) / 10**9)
+
+    @contextlib.contextmanager
+    def span(
+        self, name: str, identifier: str | None = None, **args: Any
+    ) -> Iterator[None]:
+        """Count calls and time spent, and add a trace event."""
+        stack = self._get_stack()
+        frame = _Frame(identifier)
+        stack.append(frame)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            stack.pop()
+            if identifier is not None:
+                args["identifier"] = identifier
+            if frame.bytes:
+                args["bytes"] = frame.bytes
+            self.complete(name, start, end, **args)
+            self.record(identifier, f"{name}_calls")
+            self.record(identifier, f"{name}_seconds", (end - start) / 10**9)
+
+    def add_bytes(self, count: int) -> None:
+        stack = self._get_stack()
+        for frame in stack:
+            frame.bytes += count
+        identifier = next(
+            (f.identifier for f in reversed(stack) if f.identifier is not None), None
+        )
+        self.record(identifier, "bytes_downloaded", count)
+
+    def write(self, path: str) -> None:
+        with self._lock:
+            data = {
+                "traceEvents": self.events,
+                "displayTimeUnit": "ms",
+                "otherData": {
+                    "totals": self.totals,
+                    "identifiers": {
+                        identifier: self.stats[identifier]
+                        for identifier in sorted(self.stats)
+                    },
+                },
+            }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+
+@contextlib.contextmanager
+def tracing(path: str) -> Iterator[Tracer]:
+    """Collect a trace while in the context, and write it to ``path``."""
+    global _tracer
+    tracer = _tracer = Tracer()
+    try:
+        yield tracer
+    finally:
+        _tracer = None
+        tracer.write(path)
+        logger.info("Wrote trace to %s", path)
+
+
+def trace_span(
+    name: str, identifier: str | None = None, **args: Any
+) -> contextlib.AbstractContextManager[None]:
+    """Trace a span of code, if a trace is being collected."""
+    tracer = _tracer
+    if tracer is None:
+        return contextlib.nullcontext()
+    return tracer.span(name, identifier, **args)
+
+
+def trace_bytes(count: int) -> None:
+    """Count bytes downloaded, if a trace is being collected."""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.add_bytes(count)
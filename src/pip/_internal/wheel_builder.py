@@ -5,7 +5,8 @@ from __future__ import annotations
 import logging
 import os.path
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from tempfile import TemporaryDirectory
 
 from pip._vendor.packaging.utils import canonicalize_name, canonicalize_version
@@ -19,7 +20,7 @@ from pip._internal.models.wheel import Wheel
 from pip._internal.operations.build.wheel import build_wheel_pep517
 from pip._internal.operations.build.wheel_editable import build_wheel_editable
 from pip._internal.req.req_install import InstallRequirement
-from pip._internal.utils.logging import indent_log
+from pip._internal.utils.logging import get_indentation, hold_logs, indent_log
 from pip._internal.utils.misc import ensure_dir, hash_file
 from pip._internal.utils.urls import path_to_url
 from pip._internal.vcs import vcs
@@ -120,9 +121,12 @@ def _build_one(
     output_dir: str,
     verify: bool,
     editable: bool,
+    concurrent: bool = False,
 ) -> str | None:
     """Build one wheel.
 
+    :param concurrent: Whether other wheels may be built at the same time,
+        in other threads.
     :return: The filename of the built wheel, or None if the build failed.
     """
     artifact = "editable" if editable else "wheel"
@@ -138,7 +142,7 @@ def _build_one(
         return None
 
     # Install build deps into temporary directory (PEP 518)
-    with req.build_env:
+    with req.build_env.for_current_thread() if concurrent else req.build_env:
         wheel_path = _build_one_inside_env(req, output_dir, editable)
     if wheel_path and verify:
         try:
@@ -201,13 +205,78 @@ def _build_one_inside_env(
         return None
 
 
+def _build_all(
+    requirements: Iterable[InstallRequirement],
+    wheel_cache: WheelCache,
+    verify: bool,
+    concurrency: int,
+) -> Iterator[tuple[InstallRequirement, str, str | None]]:
+    """Build wheels, yielding each requirement with the directory its wheel
+    is built in and the built wheel, or None if the build failed.
+    """
+    requirements = list(requirements)
+    if concurrency > 1 and len(requirements) > 1:
+        yield from _build_concurrently(requirements, wheel_cache, verify, concurrency)
+        return
+    for req in requirements:
+        assert req.name
+        cache_dir = _get_cache_dir(req, wheel_cache)
+        wheel_file = _build_one(
+            req,
+            cache_dir,
+            verify,
+            req.editable and req.permit_editable_wheels,
+        )
+        yield req, cache_dir, wheel_file
+
+
+def _build_concurrently(
+    requirements: Iterable[InstallRequirement],
+    wheel_cache: WheelCache,
+    verify: bool,
+    concurrency: int,
+) -> Iterator[tuple[InstallRequirement, str, str | None]]:
+    """Build wheels in parallel, yielding the result of each build in the
+    order the requirements are given.
+
+    The log messages of each build are held back until it is done, so that
+    the output of concurrent builds is not interleaved.
+    """
+    indentation = get_indentation()
+
+    def build_one(req: InstallRequirement, cache_dir: str) -> str | None:
+        with indent_log(indentation), hold_logs():
+            return _build_one(
+                req,
+                cache_dir,
+                verify,
+                req.editable and req.permit_editable_wheels,
+                concurrent=True,
+            )
+
+    with ThreadPoolExecutor(concurrency, thread_name_prefix="pip-build") as executor:
+        builds = []
+        for req in requirements:
+            cache_dir = _get_cache_dir(req, wheel_cache)
+            builds.append((req, cache_dir, executor.submit(build_one, req, cache_dir)))
+        try:
+            for req, cache_dir, future in builds:
+                yield req, cache_dir, future.result()
+        finally:
+            # Don't start builds whose result will not be used.
+            for _, _, future in builds:
+                future.cancel()
+
+
 def build(
     requirements: Iterable[InstallRequirement],
     wheel_cache: WheelCache,
     verify: bool,
+    concurrency: int = 1,
 ) -> BuildResult:
     """Build wheels.
 
+    :param concurrency: The maximum number of wheels built at the same time.
     :return: The list of InstallRequirement that succeeded to build and
         the list of InstallRequirement that failed to build.
     """
@@ -222,15 +291,9 @@ def build(
 
     with indent_log():
         build_successes, build_failures = [], []
-        for req in requirements:
-            assert req.name
-            cache_dir = _get_cache_dir(req, wheel_cache)
-            wheel_file = _build_one(
-                req,
-                cache_dir,
-                verify,
-                req.editable and req.permit_editable_wheels,
-            )
+        for req, cache_dir, wheel_file in _build_all(
+            requirements, wheel_cache, verify, concurrency
+        ):
             if wheel_file:
                 # Record the download origin in the cache
                 if req.download_info is not None:
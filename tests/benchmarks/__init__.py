@@ -0,0 +1,11 @@
+"""Benchmarks of pip's hot paths, run offline against generated indexes and wheels.
+
+Run them with ``nox -s benchmark``, or from the repository root with::
+
+    python -m tests.benchmarks --output results.json
+    python -m tests.benchmarks --compare results.json
+
+Each benchmark is run once to warm up, then timed ``--repeat`` times, and run
+once more under :mod:`tracemalloc` to measure its peak memory usage. The
+minimum time is the most stable number to compare across commits.
+"""
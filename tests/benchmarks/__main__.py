@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from pip import __version__
+
+from tests.benchmarks.suite import BENCHMARKS, Result, run_benchmark
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks",
+        description="Run pip's benchmarks, offline.",
+    )
+    parser.add_argument(
+        "patterns",
+        nargs="*",
+        metavar="pattern",
+        help="Only run the benchmarks whose name matches one of these patterns.",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="List the benchmarks, and exit."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Timed runs per benchmark."
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Scale the size of the generated indexes and wheels.",
+    )
+    parser.add_argument("--output", type=Path, help="Write the results to a file.")
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        metavar="FILE",
+        help="Compare with the results written by a previous run.",
+    )
+    return parser.parse_args()
+
+
+def format_change(value: float, baseline: float | None) -> str:
+    if not baseline:
+        return ""
+    return f" ({(value - baseline) / baseline:+.1%})"
+
+
+def main() -> int:
+    args = parse_args()
+    benchmarks = [
+        benchmark
+        for name, benchmark in BENCHMARKS.items()
+        if not args.patterns
+        or any(fnmatch.fnmatch(name, pattern) for pattern in args.patterns)
+    ]
+    if args.list:
+        for benchmark in benchmarks:
+            print(f"{benchmark.name}: {benchmark.description}")
+        return 0
+
+    baseline: dict[str, Any] = {}
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["benchmarks"]
+
+    results: list[Result] = []
+    with tempfile.TemporaryDirectory(prefix="pip-benchmarks-") as directory:
+        for benchmark in benchmarks:
+            result = run_benchmark(
+                benchmark, Path(directory, benchmark.name), args.scale, args.repeat
+            )
+            results.append(result)
+            previous = baseline.get(result.name, {})
+            print(
+                f"{result.name:<28}"
+                f" min {result.min * 1000:9.1f} ms"
+                f"{format_change(result.min, previous.get('min'))}"
+                f"  median {result.median * 1000:9.1f} ms"
+                f"  peak memory {result.peak_memory / 2**20:7.1f} MiB"
+                f"{format_change(result.peak_memory, previous.get('peak_memory'))}",
+                flush=True,
+            )
+
+    if args.output:
+        data = {
+            "metadata": {
+                "pip": __version__,
+                "python": sys.version,
+                "platform": platform.platform(),
+                "scale": args.scale,
+                "repeat": args.repeat,
+            },
+            "benchmarks": {
+                result.name: {
+                    "min": result.min,
+                    "median": result.median,
+                    "times": result.times,
+                    "peak_memory": result.peak_memory,
+                }
+                for result in results
+            },
+        }
+        args.output.write_text(json.dumps(data, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""Generators for the indexes and wheels used by the benchmarks."""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from tests.lib.wheel import make_wheel
+
+# Tags of the wheels published for each version, in the mix seen on PyPI for
+# projects shipping binary wheels.
+WHEEL_TAGS = [
+    "py3-none-any",
+    "cp310-cp310-manylinux_2_17_x86_64.manylinux2014_x86_64",
+    "cp311-cp311-manylinux_2_17_x86_64.manylinux2014_x86_64",
+    "cp312-cp312-manylinux_2_17_x86_64.manylinux2014_x86_64",
+    "cp312-cp312-musllinux_1_2_aarch64",
+    "cp312-cp312-macosx_11_0_arm64",
+    "cp312-cp312-win_amd64",
+]
+
+
+@dataclass(frozen=True)
+class IndexFile:
+    filename: str
+    requires_python: str | None
+    yanked: bool = False
+
+    @property
+    def sha256(self) -> str:
+        return hashlib.sha256(self.filename.encode()).hexdigest()
+
+
+def make_index_files(project: str, versions: int) -> list[IndexFile]:
+    """Make the files of a project with the given number of versions, each
+    with an sdist and a wheel per tag of ``WHEEL_TAGS``."""
+    files = []
+    for i in range(versions):
+        version = f"{i // 100}.{i // 10 % 10}.{i % 10}"
+        requires_python = ">=3.8" if i % 3 else None
+        files.append(IndexFile(f"{project}-{version}.tar.gz", requires_python))
+        files.extend(
+            IndexFile(
+                f"{project}-{version}-{tag}.whl", requires_python, yanked=i % 50 == 7
+            )
+            for tag in WHEEL_TAGS
+        )
+    return files
+
+
+def make_html_page(project: str, files: Iterable[IndexFile]) -> bytes:
+    """Make a Simple API HTML page (PEP 503)."""
+    lines = [
+        "<!DOCTYPE html>",
+        "<html>",
+        f"<head><title>Links for {project}</title></head>",
+        "<body>",
+        f"<h1>Links for {project}</h1>",
+    ]
+    for file in files:
+        attributes = [f'href="../../files/{file.filename}#sha256={file.sha256}"']
+        if file.requires_python:
+            value = html.escape(file.requires_python)
+            attributes.append(f'data-requires-python="{value}"')
+        if file.yanked:
+            attributes.append('data-yanked=""')
+        lines.append(f"<a {' '.join(attributes)}>{file.filename}</a><br />")
+    lines += ["</body>", "</html>"]
+    return "\n".join(lines).encode()
+
+
+def make_json_page(project: str, files: Iterable[IndexFile]) -> bytes:
+    """Make a Simple API JSON page (PEP 691)."""
+    data = {
+        "meta": {"api-version": "1.1"},
+        "name": project,
+        "files": [
+            {
+                "filename": file.filename,
+                "url": f"../../files/{file.filename}",
+                "hashes": {"sha256": file.sha256},
+                "requires-python": file.requires_python,
+                "yanked": file.yanked,
+            }
+            for file in files
+        ],
+    }
+    return json.dumps(data).encode()
+
+
+def write_html_index(root: Path, projects: dict[str, list[IndexFile]]) -> Path:
+    """Write a Simple API HTML index, and return its directory."""
+    simple = root / "simple"
+    for project, files in projects.items():
+        directory = simple / project
+        directory.mkdir(parents=True)
+        directory.joinpath("index.html").write_bytes(make_html_page(project, files))
+    return simple
+
+
+@dataclass(frozen=True)
+class Release:
+    name: str
+    version: str
+    requires: tuple[str, ...] = ()
+
+
+def write_wheels(directory: Path, releases: Iterable[Release]) -> Path:
+    """Build a wheel for each release, into a find-links directory."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for release in releases:
+        make_wheel(
+            release.name,
+            release.version,
+            metadata_updates={"Requires-Dist": list(release.requires)},
+        ).save_to_dir(directory)
+    return directory
+
+
+def iter_deep_graph(depth: int, versions: int) -> Iterator[Release]:
+    """Releases of a chain of projects, each depending on the next one."""
+    for level in range(depth):
+        requires = (f"deep{level + 1}>=1",) if level + 1 < depth else ()
+        for version in range(1, versions + 1):
+            yield Release(f"deep{level}", f"{version}.0", requires)
+
+
+def iter_backtracking_graph(versions: int) -> Iterator[Release]:
+    """Releases where only the oldest version of ``left`` is compatible with
+    ``right``, so the resolver has to backtrack through all of the others."""
+    yield Release("top", "1.0", ("left", "right"))
+    yield Release("right", "1.0", ("shared==1.0",))
+    for version in range(1, versions + 1):
+        yield Release("left", f"{version}.0", (f"shared=={version}.0",))
+        yield Release("shared", f"{version}.0")
+
+
+def write_large_wheel(directory: Path, files: int) -> Path:
+    """Build a wheel with the given number of modules, spread over packages."""
+    modules: dict[str, bytes | str] = {
+        f"large/package{i // 100}/module{i}.py": f"VALUE = {i}\n" * 20
+        for i in range(files)
+    }
+    modules["large/__init__.py"] = ""
+    for package in range((files + 99) // 100):
+        modules[f"large/package{package}/__init__.py"] = ""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = make_wheel("large", "1.0", extra_files=modules).save_to_dir(directory)
+    return Path(path)
@@ -0,0 +1,257 @@
+"""The benchmarks, and the code to run them."""
+
+from __future__ import annotations
+
+import gc
+import os
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pip._internal.commands import create_command
+from pip._internal.index.collector import IndexContent, LinkCollector, parse_links
+from pip._internal.index.package_finder import PackageFinder
+from pip._internal.metadata import get_environment
+from pip._internal.models.scheme import Scheme
+from pip._internal.models.search_scope import SearchScope
+from pip._internal.models.selection_prefs import SelectionPreferences
+from pip._internal.network.session import PipSession
+from pip._internal.operations.install.wheel import WheelStore, install_wheel
+from pip._internal.req.req_uninstall import compact, compress_for_rename
+
+from tests.benchmarks.fixtures import (
+    iter_backtracking_graph,
+    iter_deep_graph,
+    make_html_page,
+    make_index_files,
+    make_json_page,
+    write_html_index,
+    write_large_wheel,
+    write_wheels,
+)
+
+# Prepares a benchmark in the given directory, at the given scale, and returns
+# the function to time.
+Setup = Callable[[Path, float], Callable[[], Any]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    description: str
+    setup: Setup
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(description: str) -> Callable[[Setup], Setup]:
+    def register(setup: Setup) -> Setup:
+        name = setup.__name__.replace("_", "-")
+        BENCHMARKS[name] = Benchmark(name, description, setup)
+        return setup
+
+    return register
+
+
+def scaled(size: int, scale: float) -> int:
+    return max(1, round(size * scale))
+
+
+@benchmark("Parse a Simple API HTML page with 8000 files")
+def parse_links_html(directory: Path, scale: float) -> Callable[[], Any]:
+    files = make_index_files("project", scaled(1000, scale))
+    page = IndexContent(
+        make_html_page("project", files),
+        "text/html",
+        encoding="utf-8",
+        url="https://example.com/simple/project/",
+        cache_link_parsing=False,
+    )
+    return lambda: parse_links(page)
+
+
+@benchmark("Parse a Simple API JSON page with 8000 files")
+def parse_links_json(directory: Path, scale: float) -> Callable[[], Any]:
+    files = make_index_files("project", scaled(1000, scale))
+    page = IndexContent(
+        make_json_page("project", files),
+        "application/vnd.pypi.simple.v1+json",
+        encoding=None,
+        url="https://example.com/simple/project/",
+        cache_link_parsing=False,
+    )
+    return lambda: parse_links(page)
+
+
+@benchmark("Find the best candidate of a project with 1000 versions")
+def find_best_candidate(directory: Path, scale: float) -> Callable[[], Any]:
+    files = make_index_files("project", scaled(1000, scale))
+    index = write_html_index(directory, {"project": files})
+    session = PipSession()
+    search_scope = SearchScope.create(
+        find_links=[], index_urls=[index.as_uri()], no_index=False
+    )
+
+    def run() -> None:
+        # A new finder, as it keeps the candidates it found.
+        finder = PackageFinder.create(
+            LinkCollector(session, search_scope),
+            SelectionPreferences(allow_yanked=False),
+        )
+        result = finder.find_best_candidate("project")
+        assert result.best_candidate is not None
+
+    return run
+
+
+def _resolve(find_links: Path, requirement: str) -> Callable[[], Any]:
+    args = [
+        "--dry-run",
+        "--ignore-installed",
+        "--no-index",
+        "--find-links",
+        str(find_links),
+        "--no-cache-dir",
+        "--disable-pip-version-check",
+        "--root-user-action=ignore",
+        "--quiet",
+        requirement,
+    ]
+
+    def run() -> None:
+        status = create_command("install").main(args)
+        assert status == 0
+
+    return run
+
+
+@benchmark("Resolve a chain of 40 projects, with 5 versions each")
+def resolve_deep(directory: Path, scale: float) -> Callable[[], Any]:
+    releases = iter_deep_graph(scaled(40, scale), versions=5)
+    return _resolve(write_wheels(directory / "wheels", releases), "deep0")
+
+
+@benchmark("Resolve by backtracking through 100 versions of a project")
+def resolve_backtracking(directory: Path, scale: float) -> Callable[[], Any]:
+    releases = iter_backtracking_graph(scaled(100, scale))
+    return _resolve(write_wheels(directory / "wheels", releases), "top")
+
+
+def _make_scheme(target: Path) -> Scheme:
+    return Scheme(
+        platlib=str(target / "platlib"),
+        purelib=str(target / "purelib"),
+        headers=str(target / "headers"),
+        scripts=str(target / "bin"),
+        data=str(target / "data"),
+    )
+
+
+def _install(
+    directory: Path, wheel: Path, wheel_store: WheelStore | None = None
+) -> Callable[[], Any]:
+    runs = 0
+
+    def run() -> None:
+        nonlocal runs
+        runs += 1
+        install_wheel(
+            "large",
+            str(wheel),
+            _make_scheme(directory / f"target{runs}"),
+            "large",
+            pycompile=False,
+            wheel_store=wheel_store,
+        )
+
+    return run
+
+
+@benchmark("Install a wheel with 3000 files, without compiling them")
+def install_large_wheel(directory: Path, scale: float) -> Callable[[], Any]:
+    wheel = write_large_wheel(directory / "wheels", scaled(3000, scale))
+    return _install(directory, wheel)
+
+
+@benchmark("Install a wheel with 3000 files, linked from a wheel store")
+def install_large_wheel_linked(directory: Path, scale: float) -> Callable[[], Any]:
+    wheel = write_large_wheel(directory / "wheels", scaled(3000, scale))
+    return _install(directory, wheel, WheelStore(str(directory / "store")))
+
+
+def _plan_uninstall(directory: Path, scale: float, shared: bool) -> Callable[[], Any]:
+    wheel = write_large_wheel(directory / "wheels", scaled(20000, scale))
+    scheme = _make_scheme(directory / "target")
+    install_wheel("large", str(wheel), scheme, "large", pycompile=False)
+    lib = Path(scheme.purelib)
+    dist = get_environment([str(lib)]).get_distribution("large")
+    assert dist is not None
+    paths = [os.path.join(lib, entry) for entry in dist.iter_declared_entries() or ()]
+    if shared:
+        # Directories holding files of other distributions can't be renamed
+        # as a whole, so each file is renamed on its own.
+        for package in (lib / "large").iterdir():
+            if package.is_dir():
+                package.joinpath("other.py").touch()
+
+    def run() -> None:
+        compact(compress_for_rename(paths))
+
+    return run
+
+
+@benchmark("Plan the uninstallation of a distribution with 20000 files")
+def plan_uninstall(directory: Path, scale: float) -> Callable[[], Any]:
+    return _plan_uninstall(directory, scale, shared=False)
+
+
+@benchmark("Plan the uninstallation of 20000 files sharing their directories")
+def plan_uninstall_shared(directory: Path, scale: float) -> Callable[[], Any]:
+    return _plan_uninstall(directory, scale, shared=True)
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    times: list[float]
+    peak_memory: int
+
+    @property
+    def min(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+
+def run_benchmark(
+    benchmark: Benchmark, directory: Path, scale: float = 1.0, repeat: int = 5
+) -> Result:
+    directory.mkdir(parents=True, exist_ok=True)
+    func = benchmark.setup(directory, scale)
+    # The first run fills the caches kept for the lifetime of a pip process.
+    func()
+
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    # Tracing allocations slows everything down, so it has a run of its own.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(benchmark.name, times, peak_memory)
@@ -0,0 +1,105 @@
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from pip._internal.metadata import get_environment, installed_index, select_backend
+
+pytestmark = pytest.mark.skipif(
+    select_backend().NAME != "importlib",
+    reason="The index is only implemented by the importlib backend",
+)
+
+
+@pytest.fixture
+def index_dir(tmp_path: Path) -> Iterator[Path]:
+    directory = tmp_path / "index"
+    # Files written by the tests are otherwise too recent to be indexed.
+    with (
+        mock.patch("pip._internal.metadata.importlib._index._RACY_WINDOW_NS", 0),
+        installed_index(str(directory)),
+    ):
+        yield directory
+
+
+def make_dist_info(
+    site: Path, name: str, version: str, requires: tuple[str, ...] = ()
+) -> Path:
+    info = site / f"{name}-{version}.dist-info"
+    info.mkdir(parents=True)
+    lines = [f"Name: {name}", f"Version: {version}", "Provides-Extra: test"]
+    lines += [f"Requires-Dist: {req}" for req in requires]
+    info.joinpath("METADATA").write_text("\n".join(lines) + "\n")
+    return info
+
+
+def get_dists(site: Path) -> dict[str, tuple[str, list[str], list[str]]]:
+    env = get_environment([str(site)])
+    return {
+        dist.canonical_name: (
+            str(dist.version),
+            [str(req) for req in dist.iter_dependencies()],
+            list(dist.iter_provided_extras()),
+        )
+        for dist in env.iter_all_distributions()
+    }
+
+
+def test_index_avoids_reading_metadata(tmp_path: Path, index_dir: Path) -> None:
+    site = tmp_path / "site"
+    make_dist_info(site, "simple", "1.0", requires=("dep>=2",))
+    make_dist_info(site, "other", "2.0")
+
+    expected = {
+        "simple": ("1.0", ["dep>=2"], ["test"]),
+        "other": ("2.0", [], ["test"]),
+    }
+    assert get_dists(site) == expected
+    assert len(os.listdir(index_dir)) == 1
+
+    with mock.patch(
+        "pip._internal.metadata.importlib._dists.Distribution._metadata_impl",
+        side_effect=AssertionError("metadata was read"),
+    ):
+        assert get_dists(site) == expected
+
+
+def test_index_picks_up_changes(tmp_path: Path, index_dir: Path) -> None:
+    site = tmp_path / "site"
+    info = make_dist_info(site, "simple", "1.0", requires=("dep>=2",))
+    assert get_dists(site)["simple"] == ("1.0", ["dep>=2"], ["test"])
+
+    # Rewriting the metadata in place leaves the directory untouched.
+    info.joinpath("METADATA").write_text(
+        "Name: simple\nVersion: 1.0\nRequires-Dist: dep>=3\n"
+    )
+    make_dist_info(site, "added", "3.0")
+    assert get_dists(site) == {
+        "simple": ("1.0", ["dep>=3"], []),
+        "added": ("3.0", [], ["test"]),
+    }
+
+
+def test_index_is_not_trusted_for_recent_changes(tmp_path: Path) -> None:
+    site = tmp_path / "site"
+    make_dist_info(site, "simple", "1.0")
+
+    with installed_index(str(tmp_path / "index")):
+        assert get_dists(site) == {"simple": ("1.0", [], ["test"])}
+        with (
+            mock.patch(
+                "pip._internal.metadata.importlib._dists.Distribution._metadata_impl",
+                side_effect=AssertionError("metadata was read"),
+            ),
+            pytest.raises(AssertionError),
+        ):
+            get_dists(site)
+
+
+def test_index_unused_when_disabled(tmp_path: Path) -> None:
+    site = tmp_path / "site"
+    make_dist_info(site, "simple", "1.0")
+    assert get_dists(site) == {"simple": ("1.0", [], ["test"])}
+    assert not tmp_path.joinpath("index").exists()
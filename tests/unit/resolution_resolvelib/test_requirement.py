@@ -1,5 +1,7 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
@@ -122,3 +124,19 @@ def test_new_resolver_full_resolve(factory: Factory, provider: PipProvider) -> N
     r: Resolver[Requirement, Candidate, str] = Resolver(provider, BaseReporter())
     result = r.resolve(reqs)
     assert set(result.mapping.keys()) == {"simplewheel"}
+
+
+def test_new_resolver_prefetch_candidates(factory: Factory) -> None:
+    """Prefetching looks up the best candidate, and fetches its metadata"""
+    factory.preparer.metadata_prefetch = True
+    executor = factory._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+    reqs = list(factory.make_requirements_from_spec("simplewheel<2", comes_from=None))
+    with mock.patch.object(factory.preparer, "prefetch_metadata") as prefetch:
+        factory.prefetch_candidates(reqs)
+        # A project is only prefetched once.
+        factory.prefetch_candidates(reqs)
+        executor.shutdown(wait=True)
+
+    (call,) = prefetch.call_args_list
+    (link,) = call.args
+    assert link.filename == "simplewheel-1.0-py2.py3-none-any.whl"
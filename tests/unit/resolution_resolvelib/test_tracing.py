@@ -0,0 +1,59 @@
+import json
+from pathlib import Path
+
+from pip._vendor.resolvelib import BaseReporter, Resolver
+
+from pip._internal.resolution.resolvelib.base import Candidate, Requirement
+from pip._internal.resolution.resolvelib.factory import Factory
+from pip._internal.resolution.resolvelib.provider import PipProvider
+from pip._internal.resolution.resolvelib.tracing import (
+    TracingProvider,
+    TracingReporter,
+)
+from pip._internal.utils.tracing import Tracer, trace_bytes, trace_span, tracing
+
+
+def test_tracer_attributes_bytes_to_innermost_span() -> None:
+    tracer = Tracer()
+    with tracer.span("outer", "first"):
+        tracer.add_bytes(10)
+        with tracer.span("inner"):
+            tracer.add_bytes(5)
+    tracer.add_bytes(1)
+
+    assert tracer.totals["bytes_downloaded"] == 16
+    assert tracer.stats["first"]["bytes_downloaded"] == 15
+    assert tracer.stats["first"]["outer_calls"] == 1
+    inner, outer = tracer.events
+    assert (inner["name"], inner["args"]) == ("inner", {"bytes": 5})
+    assert outer["args"] == {"identifier": "first", "bytes": 15}
+
+
+def test_tracing_is_disabled_by_default() -> None:
+    with trace_span("span", "first"):
+        trace_bytes(10)
+
+
+def test_resolution_trace(
+    tmp_path: Path, factory: Factory, provider: PipProvider
+) -> None:
+    trace_file = tmp_path / "trace.json"
+    reqs = list(factory.make_requirements_from_spec("simplewheel", comes_from=None))
+    with tracing(str(trace_file)) as tracer:
+        r: Resolver[Requirement, Candidate, str] = Resolver(
+            TracingProvider(provider, tracer),
+            TracingReporter(BaseReporter(), tracer),
+        )
+        result = r.resolve(reqs)
+    assert set(result.mapping.keys()) == {"simplewheel"}
+
+    trace = json.loads(trace_file.read_text())
+    stats = trace["otherData"]["identifiers"]["simplewheel"]
+    assert stats["find_matches_calls"] == 1
+    assert stats["find_all_candidates_calls"] == 1
+    assert stats["get_dependencies_calls"] == 1
+    assert stats["pins"] == 1
+    assert trace["otherData"]["totals"]["rounds"] >= 2
+
+    names = {event["name"] for event in trace["traceEvents"]}
+    assert {"find_all_candidates", "prepare_metadata", "round", "pin"} <= names
@@ -0,0 +1,12 @@
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks.suite import BENCHMARKS, Benchmark, run_benchmark
+
+
+@pytest.mark.parametrize("benchmark", BENCHMARKS.values(), ids=BENCHMARKS)
+def test_benchmark_runs(benchmark: Benchmark, tmp_path: Path) -> None:
+    result = run_benchmark(benchmark, tmp_path, scale=0.01, repeat=2)
+    assert len(result.times) == 2
+    assert result.peak_memory > 0
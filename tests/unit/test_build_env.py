@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import os
+import stat
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from pip._vendor.packaging.requirements import Requirement
+from pip._vendor.packaging.specifiers import SpecifierSet
+
+from pip._internal.build_env import CachingBuildEnvironmentInstaller, _Prefix
+from pip._internal.index.package_finder import BestCandidateResult
+from pip._internal.models.candidate import InstallationCandidate
+from pip._internal.models.link import Link
+from pip._internal.req.req_install import InstallRequirement
+from pip._internal.utils.filesystem import directory_size
+
+
+class FakeIndex:
+    """Available versions of projects, and the requirements of each."""
+
+    def __init__(
+        self, versions: dict[str, list[str]], requires: dict[str, list[str]] | None
+    ) -> None:
+        self.versions = versions
+        self.requires = requires or {}
+
+    def best(self, name: str, specifier: SpecifierSet) -> str | None:
+        return max(specifier.filter(self.versions.get(name, [])), default=None)
+
+
+class FakeInstaller:
+    """Install the requirements, and their dependencies, as empty
+    distributions along with a script and a module."""
+
+    def __init__(self, index: FakeIndex) -> None:
+        self.index = index
+        self.installed: list[list[str]] = []
+
+    def install(
+        self,
+        requirements: Iterable[str],
+        prefix: _Prefix,
+        *,
+        kind: str,
+        for_req: InstallRequirement | None,
+    ) -> None:
+        requirements = list(requirements)
+        self.installed.append(requirements)
+        os.makedirs(prefix.bin_dir)
+        Path(prefix.bin_dir, "tool").write_text("#!python\n")
+        for lib_dir in prefix.lib_dirs:
+            os.makedirs(lib_dir, exist_ok=True)
+            Path(lib_dir, "module.py").write_text(" ".join(requirements))
+        specifiers: dict[str, SpecifierSet] = {}
+        pending = [Requirement(r) for r in requirements]
+        while pending:
+            req = pending.pop()
+            if req.marker is not None and not req.marker.evaluate({"extra": ""}):
+                continue
+            specifier = specifiers.get(req.name, SpecifierSet())
+            specifiers[req.name] = specifier & req.specifier
+            pending.extend(
+                Requirement(r) for r in self.index.requires.get(req.name, [])
+            )
+        for name, specifier in specifiers.items():
+            version = self.index.best(name, specifier)
+            assert version is not None
+            dist_info = Path(prefix.lib_dirs[0], f"{name}-{version}.dist-info")
+            dist_info.mkdir()
+            dist_info.joinpath("METADATA").write_text(
+                f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+                + "".join(
+                    f"Requires-Dist: {r}\n" for r in self.index.requires.get(name, [])
+                )
+            )
+
+
+def make_finder(index: FakeIndex) -> Any:
+    def find_best_candidate(name: str, specifier: SpecifierSet) -> BestCandidateResult:
+        candidate = None
+        version = index.best(name, specifier)
+        if version is not None:
+            filename = f"{name}-{version}-py3-none-any.whl"
+            link = Link(f"https://example.com/{filename}")
+            candidate = InstallationCandidate(name, version, link)
+        candidates = [candidate] if candidate else []
+        return BestCandidateResult(
+            candidates, applicable_candidates=candidates, best_candidate=candidate
+        )
+
+    return mock.Mock(find_best_candidate=find_best_candidate)
+
+
+def make_installer(
+    cache_dir: Path,
+    versions: dict[str, list[str]],
+    requires: dict[str, list[str]] | None = None,
+) -> tuple[CachingBuildEnvironmentInstaller, FakeIndex, FakeInstaller]:
+    index = FakeIndex(versions, requires)
+    wrapped = FakeInstaller(index)
+    installer = CachingBuildEnvironmentInstaller(
+        wrapped, make_finder(index), os.fspath(cache_dir)
+    )
+    return installer, index, wrapped
+
+
+def install(
+    installer: CachingBuildEnvironmentInstaller, path: Path, requirements: list[str]
+) -> _Prefix:
+    prefix = _Prefix(os.fspath(path))
+    installer.install(requirements, prefix, kind="build dependencies", for_req=None)
+    return prefix
+
+
+class TestCachingBuildEnvironmentInstaller:
+    def test_reuses_cached_prefix(self, tmp_path: Path) -> None:
+        installer, _, wrapped = make_installer(
+            tmp_path / "cache", {"setuptools": ["70.0"]}
+        )
+
+        install(installer, tmp_path / "first", ["setuptools>=40"])
+        prefix = install(installer, tmp_path / "second", ["setuptools>=40"])
+
+        assert wrapped.installed == [["setuptools>=40"]]
+        assert Path(prefix.bin_dir, "tool").read_text() == "#!python\n"
+        assert Path(prefix.lib_dirs[0], "module.py").read_text() == "setuptools>=40"
+
+    def test_cached_prefix_is_read_only(self, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "cache"
+        installer, _, _ = make_installer(cache_dir, {"setuptools": ["70.0"]})
+
+        install(installer, tmp_path / "first", ["setuptools"])
+        prefix = install(installer, tmp_path / "second", ["setuptools"])
+
+        (entry,) = cache_dir.iterdir()
+        cached_files = [p for p in (entry / "prefix").rglob("*") if p.is_file()]
+        assert cached_files
+        for path in [*cached_files, Path(prefix.bin_dir, "tool")]:
+            assert not path.stat().st_mode & (stat.S_IWUSR | stat.S_IWGRP)
+
+    def test_modified_cached_prefix_is_replaced(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        installer, _, wrapped = make_installer(
+            tmp_path / "cache", {"setuptools": ["70.0"]}
+        )
+        first = install(installer, tmp_path / "first", ["setuptools"])
+        # The prefix shares its files with the cached prefix.
+        module = Path(first.lib_dirs[0], "module.py")
+        module.chmod(0o644)
+        module.write_text("modified")
+
+        prefix = install(installer, tmp_path / "second", ["setuptools"])
+
+        assert len(wrapped.installed) == 2
+        assert "Replacing modified cached build environment" in caplog.text
+        assert Path(prefix.lib_dirs[0], "module.py").read_text() == "setuptools"
+        install(installer, tmp_path / "third", ["setuptools"])
+        assert len(wrapped.installed) == 2
+
+    def test_new_versions_replace_cached_prefix(self, tmp_path: Path) -> None:
+        installer, index, wrapped = make_installer(
+            tmp_path / "cache", {"setuptools": ["69.0"]}
+        )
+        install(installer, tmp_path / "0", ["setuptools"])
+        index.versions["setuptools"].append("70.0")
+        install(installer, tmp_path / "1", ["setuptools"])
+        prefix = install(installer, tmp_path / "2", ["setuptools"])
+
+        assert len(wrapped.installed) == 2
+        assert Path(prefix.lib_dirs[0], "setuptools-70.0.dist-info").is_dir()
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    def test_new_dependency_versions_replace_cached_prefix(
+        self, tmp_path: Path
+    ) -> None:
+        installer, index, wrapped = make_installer(
+            tmp_path / "cache",
+            {"backend": ["1.0"], "dep": ["1.0"]},
+            {"backend": ["dep"]},
+        )
+        install(installer, tmp_path / "0", ["backend"])
+        install(installer, tmp_path / "1", ["backend"])
+        index.versions["dep"].append("2.0")
+        install(installer, tmp_path / "2", ["backend"])
+        prefix = install(installer, tmp_path / "3", ["backend"])
+
+        assert len(wrapped.installed) == 2
+        assert Path(prefix.lib_dirs[0], "dep-2.0.dist-info").is_dir()
+
+    def test_dependency_specifiers_are_honored(self, tmp_path: Path) -> None:
+        installer, index, wrapped = make_installer(
+            tmp_path / "cache",
+            {"backend": ["1.0"], "dep": ["1.0"]},
+            {"backend": ["dep<2", "other; extra == 'unused'"]},
+        )
+        install(installer, tmp_path / "0", ["backend"])
+        # Versions excluded by the requirements of the cached distributions
+        # don't invalidate them.
+        index.versions["dep"].append("2.0")
+        install(installer, tmp_path / "1", ["backend"])
+
+        assert len(wrapped.installed) == 1
+
+    def test_unpinnable_requirements_are_not_cached(self, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "cache"
+        installer, _, wrapped = make_installer(cache_dir, {"pkg": ["1.0"]})
+
+        install(installer, tmp_path / "first", ["pkg @ https://example.com/pkg.zip"])
+        install(installer, tmp_path / "second", ["pkg @ https://example.com/pkg.zip"])
+
+        assert len(wrapped.installed) == 2
+        assert not cache_dir.exists()
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "cache"
+        installer, _, wrapped = make_installer(
+            cache_dir, {"a": ["1.0"], "b": ["1.0"], "c": ["1.0"]}
+        )
+
+        install(installer, tmp_path / "a", ["a"])
+        # Leave room for two entries only.
+        (entry,) = cache_dir.iterdir()
+        installer._max_size = int(directory_size(os.fspath(entry / "prefix")) * 2.5)
+        install(installer, tmp_path / "b", ["b"])
+        entries = {
+            entry.name: (entry / "entry.json").stat().st_mtime
+            for entry in cache_dir.iterdir()
+        }
+        # Use "a" again, so that "b" is the least recently used entry.
+        for name, mtime in entries.items():
+            os.utime(cache_dir / name / "entry.json", (mtime - 10, mtime - 10))
+        install(installer, tmp_path / "a2", ["a"])
+        install(installer, tmp_path / "c", ["c"])
+
+        assert wrapped.installed == [["a"], ["b"], ["c"]]
+        install(installer, tmp_path / "a3", ["a"])
+        install(installer, tmp_path / "b2", ["b"])
+        assert wrapped.installed == [["a"], ["b"], ["c"], ["b"]]
+
+    def test_invalid_entries_are_evicted(self, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "cache"
+        installer, _, wrapped = make_installer(cache_dir, {"a": ["1.0"]})
+        for name, content in [("invalid", "{"), ("no-size", "{}"), ("list", "[]")]:
+            (cache_dir / name).mkdir(parents=True)
+            (cache_dir / name / "entry.json").write_text(content)
+
+        install(installer, tmp_path / "a", ["a"])
+
+        assert wrapped.installed == [["a"]]
+        assert len(list(cache_dir.iterdir())) == 1
@@ -1,9 +1,11 @@
 import os
+import shutil
 from pathlib import Path
+from unittest import mock
 
 from pip._vendor.packaging.tags import Tag, interpreter_name, interpreter_version
 
-from pip._internal.cache import WheelCache, _hash_dict
+from pip._internal.cache import WheelCache, WheelCacheIndex, _hash_dict, _parse_tag
 from pip._internal.models.link import Link
 from pip._internal.utils.misc import ensure_dir
 
@@ -116,3 +118,115 @@ def test_get_cache_entry(tmpdir: Path) -> None:
     assert not entry.persistent
 
     assert wc.get_cache_entry(other_link, "other", supported_tags) is None
+
+
+def make_cached_wheels(
+    wc: WheelCache, link: Link, *filenames: str, mtime_ns: int = 10**9
+) -> str:
+    cache_path = wc.get_path_for_link(link)
+    ensure_dir(cache_path)
+    for filename in filenames:
+        Path(cache_path, filename).touch()
+    # Directories modified too recently are not indexed.
+    os.utime(cache_path, ns=(0, mtime_ns))
+    return cache_path
+
+
+def test_index_avoids_listing_cache_directory(tmp_path: Path) -> None:
+    link = Link("https://g.c/package.tar.gz")
+    tags = [Tag("cp3", "none", "any"), Tag("py3", "none", "any")]
+    cache_path = make_cached_wheels(
+        WheelCache(os.fspath(tmp_path)),
+        link,
+        "package-1.0-py3-none-any.whl",
+        "package-1.0-cp3-none-any.whl",
+        "package-1.0-cp3-none-win32.whl",
+        "origin.json",
+    )
+    expected = os.path.join(cache_path, "package-1.0-cp3-none-any.whl")
+    wc = WheelCache(os.fspath(tmp_path))
+    assert wc.get(link, "package", tags).file_path == expected
+    wc.close()
+
+    with mock.patch("os.listdir", side_effect=AssertionError("listed")):
+        wc = WheelCache(os.fspath(tmp_path))
+        assert wc.get(link, "package", tags).file_path == expected
+        assert wc.get(link, "other", tags) is link
+
+
+def test_index_picks_up_changes(tmp_path: Path) -> None:
+    link = Link("https://g.c/package.tar.gz")
+    tags = [Tag("cp3", "none", "any"), Tag("py3", "none", "any")]
+    wc = WheelCache(os.fspath(tmp_path))
+    cache_path = make_cached_wheels(wc, link, "package-1.0-py3-none-any.whl")
+    assert wc.get(link, "package", tags).filename == "package-1.0-py3-none-any.whl"
+    wc.close()
+
+    # Adding a wheel changes the modification time of its directory.
+    make_cached_wheels(wc, link, "package-1.0-cp3-none-any.whl", mtime_ns=2 * 10**9)
+    assert wc.get(link, "package", tags).filename == "package-1.0-cp3-none-any.whl"
+    wc.close()
+    wc = WheelCache(os.fspath(tmp_path))
+    assert wc.get(link, "package", tags).filename == "package-1.0-cp3-none-any.whl"
+
+    # Removing the directory leaves the index with a stale entry.
+    shutil.rmtree(cache_path)
+    assert WheelCache(os.fspath(tmp_path)).get(link, "package", tags) is link
+
+
+def test_index_discard(tmp_path: Path) -> None:
+    link = Link("https://g.c/package.tar.gz")
+    wc = WheelCache(os.fspath(tmp_path))
+    cache_path = make_cached_wheels(wc, link, "package-1.0-py3-none-any.whl")
+    assert wc.get(link, "package", [Tag("py3", "none", "any")]) is not link
+    wc.close()
+
+    key = os.path.relpath(cache_path, tmp_path / "wheels").replace(os.sep, "/")
+    index = WheelCacheIndex(os.path.join(tmp_path, "wheels"))
+    assert index._get_entry(key)
+    index.discard([cache_path])
+    assert not WheelCacheIndex(os.path.join(tmp_path, "wheels"))._get_entry(key)
+
+
+def test_index_is_written_once(tmp_path: Path) -> None:
+    wc = WheelCache(os.fspath(tmp_path))
+    links = [Link(f"https://g.c/package-{i}.tar.gz") for i in range(10)]
+    for link in links:
+        make_cached_wheels(wc, link, "package-1.0-py3-none-any.whl")
+    tags = [Tag("py3", "none", "any")]
+    index_path = tmp_path / "wheels" / "index-v1.json"
+
+    with mock.patch("atexit.register") as register:
+        for link in links:
+            assert wc.get(link, "package", tags) is not link
+    index = wc._wheel_cache._index
+    assert index is not None
+    register.assert_called_once_with(index.close)
+    assert not index_path.exists()
+
+    # Writing the index keeps the entries other processes wrote meanwhile.
+    other = WheelCache(os.fspath(tmp_path))
+    new_link = Link("https://g.c/new.tar.gz")
+    make_cached_wheels(other, new_link, "new-1.0-py3-none-any.whl")
+    assert other.get(new_link, "new", tags) is not new_link
+    wc.close()
+    other.close()
+    with mock.patch("os.listdir", side_effect=AssertionError("listed")):
+        wc = WheelCache(os.fspath(tmp_path))
+        for link in links:
+            assert wc.get(link, "package", tags) is not link
+        assert wc.get(new_link, "new", tags) is not new_link
+
+
+def test_index_entries_are_parsed_on_lookup(tmp_path: Path) -> None:
+    wc = WheelCache(os.fspath(tmp_path))
+    links = [Link(f"https://g.c/package-{i}.tar.gz") for i in range(3)]
+    for link in links:
+        make_cached_wheels(wc, link, "package-1.0-py3-none-any.whl")
+        wc.get(link, "package", [Tag("py3", "none", "any")])
+    wc.close()
+
+    wc = WheelCache(os.fspath(tmp_path))
+    with mock.patch("pip._internal.cache._parse_tag", wraps=_parse_tag) as parse:
+        wc.get(links[0], "package", [Tag("py3", "none", "any")])
+    assert parse.call_count == 1
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import datetime
 import os
-from optparse import Option, OptionParser, Values
+from optparse import Option, OptionParser, OptionValueError, Values
 from pathlib import Path
 from venv import EnvBuilder
 
@@ -11,6 +11,7 @@ import pytest
 from pip._internal.cli.cmdoptions import (
     _convert_python_version,
     _handle_uploaded_prior_to,
+    _positive_int_option_check,
 )
 from pip._internal.cli.main_parser import identify_python_interpreter
 
@@ -225,3 +226,14 @@ def test_handle_uploaded_prior_to_p0d_overrides_duration() -> None:
     assert p0d_result > p10d_result
     now = datetime.datetime.now(datetime.timezone.utc)
     assert abs((p0d_result - now).total_seconds()) < 1
+
+
+@pytest.mark.parametrize("value, expected", [("1", 1), ("8", 8)])
+def test_positive_int_option_check(value: str, expected: int) -> None:
+    assert _positive_int_option_check(Option("--n"), "--n", value) == expected
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "two", ""])
+def test_positive_int_option_check_invalid(value: str) -> None:
+    with pytest.raises(OptionValueError):
+        _positive_int_option_check(Option("--n"), "--n", value)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import dataclasses
 import itertools
 import json
 import logging
 import os
 import re
+import threading
 import uuid
 from pathlib import Path
 from textwrap import dedent
@@ -26,6 +28,7 @@ from pip._internal.index.collector import (
     _NotHTTP,
     parse_links,
 )
+from pip._internal.index.page_cache import ParsedPageCache
 from pip._internal.index.sources import _FlatDirectorySource, _IndexDirectorySource
 from pip._internal.models.candidate import InstallationCandidate
 from pip._internal.models.index import PyPI
@@ -41,6 +44,7 @@ from pip._internal.network.session import PipSession
 from tests.lib import (
     TestData,
     make_test_link_collector,
+    make_test_search_scope,
     skip_needs_new_pathname2url_trailing_slash_behavior_win,
     skip_needs_old_pathname2url_trailing_slash_behavior_win,
 )
@@ -717,6 +721,77 @@ def test_parse_links_caches_same_page_by_url() -> None:
     assert "pkg2" in parsed_links_3[0].url
 
 
+def test_parsed_page_cache_round_trip(tmp_path: Path) -> None:
+    json_bytes = json.dumps(
+        {
+            "meta": {"api-version": "1.1"},
+            "name": "holygrail",
+            "files": [
+                {
+                    "filename": "holygrail-1.0.tar.gz",
+                    "url": "/files/holygrail-1.0.tar.gz#sha256=abcd",
+                    "hashes": {"blake2b": "blake2b hash"},
+                    "requires-python": ">=3.7",
+                    "yanked": True,
+                    "upload-time": "2025-01-01T12:00:00.000000Z",
+                },
+                {
+                    "filename": "holygrail-1.0-py3-none-any.whl",
+                    "url": "/files/holygrail-1.0-py3-none-any.whl",
+                    "hashes": {},
+                    "core-metadata": True,
+                },
+                {
+                    "filename": "holygrail-1.1-py3-none-any.whl",
+                    "url": "/files/holygrail-1.1-py3-none-any.whl",
+                    "hashes": {},
+                    "core-metadata": {"sha256": "aabdd41"},
+                },
+            ],
+        }
+    ).encode("utf8")
+    page = IndexContent(
+        json_bytes,
+        "application/vnd.pypi.simple.v1+json",
+        encoding=None,
+        url=f"https://example.com/simple-{uuid.uuid4()}/",
+        etag='"1234"',
+    )
+    links = list(parse_links(page))
+    cache = ParsedPageCache(str(tmp_path))
+    assert cache.get(page) is None
+
+    cache.set(page, links)
+    cached_links = cache.get(page)
+
+    assert cached_links is not None
+    for cached, link in zip(cached_links, links, strict=True):
+        assert cached.url == link.url
+        assert cached.comes_from == link.comes_from
+        assert cached.requires_python == link.requires_python
+        assert cached.yanked_reason == link.yanked_reason
+        assert cached.metadata_file_data == link.metadata_file_data
+        assert cached.upload_time == link.upload_time
+        assert cached.hashes == link.hashes
+
+    # A page with other validators is a different cache entry.
+    assert cache.get(dataclasses.replace(page, etag='"5678"')) is None
+
+
+def test_parsed_page_cache_ignores_pages_without_validators(tmp_path: Path) -> None:
+    page = IndexContent(
+        b'<a href="/pkg1-1.0.tar.gz"></a>',
+        "text/html",
+        encoding=None,
+        url="https://example.com/simple/pkg1/",
+    )
+    cache = ParsedPageCache(str(tmp_path / "cache"))
+    cache.set(page, [Link("https://example.com/pkg1-1.0.tar.gz")])
+
+    assert cache.get(page) is None
+    assert not os.path.exists(tmp_path / "cache")
+
+
 @mock.patch("pip._internal.index.collector.raise_for_status")
 def test_request_http_error(
     mock_raise_for_status: mock.Mock, caplog: pytest.LogCaptureFixture
@@ -868,6 +943,8 @@ def test_collect_sources__file_expand_dir(data: TestData) -> None:
             index_url="ignored-by-no-index",
             extra_index_urls=[],
             no_index=True,
+            index_concurrency=1,
+            cache_dir=None,
             find_links=[data.find_links],
         ),
     )
@@ -895,6 +972,8 @@ def test_collect_sources__file_not_find_link(data: TestData) -> None:
             index_url=data.index_url("empty_with_pkg"),
             extra_index_urls=[],
             no_index=False,
+            index_concurrency=1,
+            cache_dir=None,
             find_links=[],
         ),
     )
@@ -920,6 +999,8 @@ def test_collect_sources__non_existing_path() -> None:
             index_url="ignored-by-no-index",
             extra_index_urls=[],
             no_index=True,
+            index_concurrency=1,
+            cache_dir=None,
             find_links=[os.path.join("this", "does", "not", "exist")],
         ),
     )
@@ -968,6 +1049,69 @@ class TestLinkCollector:
             session=link_collector.session,
         )
 
+    def test_parse_links_uses_page_cache(self, tmp_path: Path) -> None:
+        link_collector = make_test_link_collector()
+        link_collector.page_cache = ParsedPageCache(str(tmp_path))
+        page = IndexContent(
+            b'<a href="/pkg1-1.0.tar.gz"></a>',
+            "text/html",
+            encoding=None,
+            url="https://example.com/simple/pkg1/",
+            cache_link_parsing=False,
+            last_modified="Wed, 01 Jan 2025 12:00:00 GMT",
+        )
+        links = link_collector.parse_links(page)
+        assert [link.url for link in links] == ["https://example.com/pkg1-1.0.tar.gz"]
+
+        with mock.patch("pip._internal.index.collector.parse_links") as parse:
+            assert link_collector.parse_links(page) == links
+        parse.assert_not_called()
+
+    @pytest.mark.parametrize("etag", [None, '"1234"'])
+    def test_parse_links_with_file_filter(
+        self, tmp_path: Path, etag: str | None
+    ) -> None:
+        link_collector = make_test_link_collector()
+        link_collector.page_cache = ParsedPageCache(str(tmp_path))
+        files = [
+            {"url": "/files/pkg1-1.0.tar.gz", "hashes": {}},
+            {"url": "/files/pkg1-1.0-py3-none-any.whl", "hashes": {}},
+            {
+                "url": "/files/pkg1-2.0-py3-none-any.whl",
+                "hashes": {},
+                "requires-python": ">=4",
+                "yanked": True,
+            },
+        ]
+        page = IndexContent(
+            json.dumps({"meta": {"api-version": "1.0"}, "files": files}).encode(),
+            "application/vnd.pypi.simple.v1+json",
+            encoding=None,
+            url="https://example.com/simple/pkg1/",
+            cache_link_parsing=False,
+            etag=etag,
+        )
+        file_filter = mock.Mock(side_effect=lambda url, rp, yanked: rp is None)
+
+        # When the page is cached, all of its links are stored first.
+        links = link_collector.parse_links(page, file_filter)
+        if etag is None:
+            assert [link.filename for link in links] == [
+                "pkg1-1.0.tar.gz",
+                "pkg1-1.0-py3-none-any.whl",
+            ]
+            file_filter.assert_any_call("/files/pkg1-2.0-py3-none-any.whl", ">=4", "")
+        else:
+            assert len(links) == 3
+            links = link_collector.parse_links(page, file_filter)
+            assert [link.filename for link in links] == [
+                "pkg1-1.0.tar.gz",
+                "pkg1-1.0-py3-none-any.whl",
+            ]
+            file_filter.assert_any_call(
+                "https://example.com/files/pkg1-2.0-py3-none-any.whl", ">=4", ""
+            )
+
     def test_collect_page_sources(
         self, caplog: pytest.LogCaptureFixture, data: TestData
     ) -> None:
@@ -1063,6 +1207,56 @@ class TestLinkCollector:
             ("pip._internal.index.collector", logging.DEBUG, expected_message),
         ]
 
+    def test_collect_sources_concurrently(self) -> None:
+        index_urls = ["https://a.example/simple", "https://b.example/simple"]
+        link_collector = LinkCollector(
+            session=PipSession(),
+            search_scope=make_test_search_scope(index_urls=index_urls),
+            index_concurrency=2,
+        )
+        # Both pages must be fetched at the same time to get past the barrier.
+        barrier = threading.Barrier(2, timeout=10)
+
+        def candidates_from_page(link: Link) -> list[InstallationCandidate]:
+            barrier.wait()
+            return [InstallationCandidate("twine", "1.0", link)]
+
+        collected_sources = link_collector.collect_sources(
+            "twine", candidates_from_page=candidates_from_page
+        )
+        pages = [
+            candidate.link.url
+            for source in collected_sources.index_urls
+            if source is not None
+            for candidate in source.page_candidates()
+        ]
+
+        # The results are still returned in priority order.
+        assert pages == [
+            "https://a.example/simple/twine/",
+            "https://b.example/simple/twine/",
+        ]
+
+    def test_collect_sources_concurrently_reraises(self) -> None:
+        link_collector = LinkCollector(
+            session=PipSession(),
+            search_scope=make_test_search_scope(
+                index_urls=["https://a.example/simple"]
+            ),
+            index_concurrency=2,
+        )
+
+        def candidates_from_page(link: Link) -> list[InstallationCandidate]:
+            raise NetworkConnectionError("boom")
+
+        collected_sources = link_collector.collect_sources(
+            "twine", candidates_from_page=candidates_from_page
+        )
+        (source,) = collected_sources.index_urls
+        assert source is not None
+        with pytest.raises(NetworkConnectionError, match="boom"):
+            list(source.page_candidates())
+
 
 @pytest.mark.parametrize(
     "find_links, no_index, suppress_no_index, expected",
@@ -1092,6 +1286,8 @@ def test_link_collector_create(
         index_url="default_url",
         extra_index_urls=["url1", "url2"],
         no_index=no_index,
+        index_concurrency=1,
+        cache_dir=None,
     )
     link_collector = LinkCollector.create(
         session,
@@ -1128,6 +1324,8 @@ def test_link_collector_create_find_links_expansion(
         index_url="default_url",
         extra_index_urls=[],
         no_index=False,
+        index_concurrency=1,
+        cache_dir=None,
     )
     # Only create temp2 and not temp1 to test that "~" expansion only occurs
     # when the directory exists.
@@ -0,0 +1,53 @@
+"""Check which modules get imported when creating commands.
+
+The network and resolution machinery is expensive to import, so commands must
+only import it when they actually use it.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pip
+
+# Modules that must be imported lazily, on first use.
+DEFERRED_MODULES = [
+    "pip._vendor.requests",
+    "pip._vendor.urllib3",
+    "pip._vendor.cachecontrol",
+    "pip._vendor.resolvelib",
+    "pip._internal.network.session",
+    "pip._internal.index.package_finder",
+    "pip._internal.operations.prepare",
+    "pip._internal.resolution.resolvelib.resolver",
+]
+
+
+def get_imported_modules(code: str) -> set[str]:
+    """Run code in a fresh interpreter, and return the modules it imported."""
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(pip.__file__)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    # Each line reads "import time: <self> | <cumulative> | <module>".
+    return {
+        line.rpartition("|")[2].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+@pytest.mark.parametrize("command_name", ["download", "index", "lock", "wheel"])
+def test_creating_command_defers_network_imports(command_name: str) -> None:
+    modules = get_imported_modules(
+        "from pip._internal.commands import create_command; "
+        f"create_command({command_name!r})"
+    )
+    assert "pip._internal.cli.req_command" in modules
+    assert [name for name in DEFERRED_MODULES if name in modules] == []
@@ -1,5 +1,8 @@
 import os
-from typing import Callable
+import threading
+import time
+from optparse import Values
+from typing import Callable, cast
 from unittest import mock
 
 import pytest
@@ -11,6 +14,8 @@ from pip._internal.cli.req_command import (
     SessionCommandMixin,
 )
 from pip._internal.commands import commands_dict, create_command
+from pip._internal.commands.list import ListCommand
+from pip._internal.network.session import PipSession
 
 # These are the expected names of the commands whose classes inherit from
 # IndexGroupCommand.
@@ -134,6 +139,88 @@ def test_index_group_pip_version_check(
         mock_version_check.assert_not_called()
 
 
+@mock.patch("pip._internal.cli.index_command._pip_self_version_check_emit")
+@mock.patch("pip._internal.cli.index_command._pip_self_version_check_fetch")
+def test_pip_version_check_runs_alongside_command_body(
+    mock_fetch: mock.Mock, mock_emit: mock.Mock
+) -> None:
+    """The fetch runs in the background, and its result is emitted after the
+    command body."""
+    fetched = threading.Event()
+
+    def fetch(session: PipSession, options: Values) -> str:
+        fetched.set()
+        return "prompt"
+
+    mock_fetch.side_effect = fetch
+    command = create_command("download")
+    options = command.parser.get_default_values()
+    options.disable_pip_version_check = False
+
+    with command.pip_version_check(options, []):
+        assert fetched.wait(timeout=5)
+        mock_emit.assert_not_called()
+    mock_emit.assert_called_once_with("prompt")
+
+
+@mock.patch("pip._internal.cli.index_command.SELF_VERSION_CHECK_BUDGET", 0.05)
+@mock.patch("pip._internal.cli.index_command._pip_self_version_check_emit")
+@mock.patch("pip._internal.cli.index_command._pip_self_version_check_fetch")
+def test_pip_version_check_over_budget_is_skipped(
+    mock_fetch: mock.Mock, mock_emit: mock.Mock
+) -> None:
+    release = threading.Event()
+    mock_fetch.side_effect = lambda session, options: release.wait(timeout=5)
+    command = create_command("download")
+    options = command.parser.get_default_values()
+    options.disable_pip_version_check = False
+
+    start = time.monotonic()
+    with command.pip_version_check(options, []):
+        pass
+    release.set()
+
+    assert time.monotonic() - start < 1
+    mock_emit.assert_not_called()
+
+
+@mock.patch("pip._internal.cli.index_command._pip_self_version_check_emit")
+@mock.patch("pip._internal.cli.index_command._pip_self_version_check_fetch")
+def test_pip_version_check_never_prompts(
+    mock_fetch: mock.Mock, mock_emit: mock.Mock
+) -> None:
+    """The background check must not ask for credentials, even when the
+    command itself may."""
+    prompting = []
+    mock_fetch.side_effect = lambda session, options: prompting.append(
+        session.auth.prompting
+    )
+    command = create_command("download")
+    options = command.parser.get_default_values()
+    options.disable_pip_version_check = False
+    options.no_input = False
+
+    with command.pip_version_check(options, []):
+        pass
+
+    assert prompting == [False]
+
+
+@mock.patch("pip._internal.cli.index_command._pip_self_version_check_fetch")
+def test_pip_version_check_error_is_reported(
+    mock_fetch: mock.Mock, caplog: pytest.LogCaptureFixture
+) -> None:
+    mock_fetch.side_effect = OSError("unreachable")
+    command = create_command("download")
+    options = command.parser.get_default_values()
+    options.disable_pip_version_check = False
+
+    with command.pip_version_check(options, []):
+        pass
+
+    assert "error checking the latest version of pip" in caplog.text
+
+
 @mock.patch("pip._internal.cli.index_command._pip_self_version_check_fetch")
 def test_install_pip_version_check_skipped_when_pip_is_a_requirement(
     mock_version_check: mock.Mock,
@@ -169,6 +256,27 @@ def test_requirement_commands() -> None:
     check_commands(is_requirement_command, ["download", "install", "lock", "wheel"])
 
 
+@pytest.mark.parametrize(
+    "args, deprecated_features, warns",
+    [
+        (["--resolver-trace=trace.json"], ["legacy-resolver"], True),
+        ([], ["legacy-resolver"], False),
+        (["--resolver-trace=trace.json"], [], False),
+    ],
+)
+def test_resolver_trace_with_legacy_resolver(
+    caplog: pytest.LogCaptureFixture,
+    args: list[str],
+    deprecated_features: list[str],
+    warns: bool,
+) -> None:
+    command = cast(RequirementCommand, create_command("install"))
+    options, _ = command.parse_args(args)
+    options.deprecated_features_enabled = deprecated_features
+    command.make_resolver(mock.Mock(), mock.Mock(), options)
+    assert ("--resolver-trace has no effect" in caplog.text) == warns
+
+
 @pytest.mark.parametrize("flag", ["", "--outdated", "--uptodate"])
 @mock.patch("pip._internal.cli.index_command._pip_self_version_check_fetch")
 @mock.patch.dict(os.environ, {"PIP_DISABLE_PIP_VERSION_CHECK": "no"})
@@ -184,3 +292,44 @@ def test_list_pip_version_check(version_check_mock: mock.Mock, flag: str) -> Non
         version_check_mock.assert_called_once()
     else:
         version_check_mock.assert_not_called()
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_list_latest_infos_keep_order(concurrency: int) -> None:
+    """
+    Ensure that looking up the latest versions in parallel still yields the
+    distributions in their original order, skipping those not found.
+    """
+    release = threading.Event()
+    names = ["slow", "missing", "fast", "other"]
+
+    def find_all_candidates(name: str) -> list[mock.Mock]:
+        if name == "slow" and concurrency > 1:
+            # Hold the first lookup until a later one has completed.
+            assert release.wait(timeout=5)
+        if name == "fast":
+            release.set()
+        if name == "missing":
+            return []
+        candidate = mock.Mock()
+        candidate.version.is_prerelease = False
+        candidate.link.is_wheel = True
+        return [candidate]
+
+    finder = mock.Mock()
+    finder.find_all_candidates.side_effect = find_all_candidates
+    finder.make_candidate_evaluator.return_value.sort_best_candidate.side_effect = (
+        lambda candidates: (candidates[0] if candidates else None)
+    )
+    packages = [mock.Mock(canonical_name=name) for name in names]
+
+    command = cast(ListCommand, create_command("list"))
+    options, _ = command.parse_args(["--lookup-concurrency", str(concurrency)])
+    with (
+        mock.patch.object(command, "_build_session"),
+        mock.patch.object(command, "_build_package_finder", return_value=finder),
+    ):
+        infos = list(command.iter_packages_latest_infos(packages, options))
+
+    assert [dist.canonical_name for dist in infos] == ["slow", "fast", "other"]
+    assert all(dist.latest_filetype == "wheel" for dist in infos)
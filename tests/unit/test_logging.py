@@ -2,7 +2,7 @@ import logging
 import time
 from contextlib import redirect_stderr, redirect_stdout
 from io import StringIO
-from threading import Thread
+from threading import Event, Thread
 from unittest.mock import patch
 
 import pytest
@@ -12,7 +12,9 @@ from pip._internal.utils.logging import (
     IndentingFormatter,
     PipConsole,
     RichPipStreamHandler,
+    hold_logs,
     indent_log,
+    logs_held,
 )
 
 logger = logging.getLogger(__name__)
@@ -195,3 +197,39 @@ class TestColorizedStreamHandler:
         # Sanity check that the log record was written, since flush() happens
         # after write().
         assert output.startswith("my error")
+
+
+def test_hold_logs() -> None:
+    stream = StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(IndentingFormatter(fmt="%(message)s"))
+    logging.getLogger().addHandler(handler)
+    first_logged = Event()
+    main_logged = Event()
+
+    def thread_function() -> None:
+        with indent_log(), hold_logs():
+            assert logs_held()
+            logger.warning("first")
+            first_logged.set()
+            main_logged.wait()
+            logger.warning("second")
+        assert not logs_held()
+
+    try:
+        thread = Thread(target=thread_function)
+        thread.start()
+        first_logged.wait()
+        logger.warning("main")
+        main_logged.set()
+        thread.join()
+    finally:
+        logging.getLogger().removeHandler(handler)
+
+    # The held messages come after the one logged in the meantime, together
+    # and with the indentation of the thread that logged them.
+    assert stream.getvalue().splitlines() == [
+        "WARNING: main",
+        "  WARNING: first",
+        "  WARNING: second",
+    ]
@@ -264,3 +264,24 @@ class TestWheelFile:
         """
         with pytest.raises(InvalidWheelFilename):
             Wheel("six-1.16.0_build1-py3-none-any.whl")
+
+    def test_filename_parse_is_cached(self) -> None:
+        """
+        Test that wheels with the same filename share the parsed tags.
+        """
+        w1 = Wheel("simple-0.1-py2.py3-none-any.whl")
+        w2 = Wheel("simple-0.1-py2.py3-none-any.whl")
+        assert w1.file_tags is w2.file_tags
+        for _ in range(2):
+            with pytest.raises(InvalidWheelFilename):
+                Wheel("simple-0.1_1-py2-none-any.whl")
+
+    def test_find_most_preferred_tag(self) -> None:
+        tags = [
+            Tag("py3", "none", "TEST"),
+            Tag("py2", "none", "any"),
+            Tag("py3", "none", "any"),
+        ]
+        tag_to_priority = {tag: idx for idx, tag in enumerate(tags)}
+        w = Wheel("simple-0.1-py2.py3-none-any.whl")
+        assert w.find_most_preferred_tag(tags, tag_to_priority) == 1
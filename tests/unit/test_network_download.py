@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import sys
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, call, patch
 
 import pytest
 
-from pip._internal.exceptions import IncompleteDownloadError
+from pip._internal.exceptions import HashMismatch, IncompleteDownloadError
 from pip._internal.models.link import Link
 from pip._internal.network.download import (
     Downloader,
@@ -18,6 +20,7 @@ from pip._internal.network.download import (
 )
 from pip._internal.network.session import PipSession
 from pip._internal.network.utils import HEADERS
+from pip._internal.utils.hashes import Hashes
 
 from tests.lib.requests_mocks import MockResponse
 
@@ -387,3 +390,98 @@ def test_resumed_download_caching(tmpdir: Path) -> None:
         cache_files = list(cache_dir.rglob("*"))
         # Should have cache files (both metadata and body files)
         assert len([f for f in cache_files if f.is_file()]) == 2
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_downloader_batch(concurrency: int, tmpdir: Path) -> None:
+    session = PipSession()
+    links = [Link(f"http://example.com/pkg{i}-1.0.tar.gz") for i in range(3)]
+    downloader = Downloader(session, "off", concurrency=concurrency)
+    # With concurrency, all downloads must be in flight at once to get
+    # past the barrier.
+    barrier = threading.Barrier(concurrency, timeout=10)
+
+    def _http_get(link: Link) -> MockResponse:
+        barrier.wait()
+        resp = MockResponse(link.filename.encode())
+        resp.headers = {"content-length": str(len(link.filename))}
+        return resp
+
+    with patch.object(Downloader, "_http_get", side_effect=_http_get):
+        downloaded = dict(downloader.batch(links, str(tmpdir)))
+
+    assert sorted(downloaded) == sorted(links)
+    for link, (filepath, _) in downloaded.items():
+        assert Path(filepath).read_bytes() == link.filename.encode()
+
+
+def test_downloader_batch_concurrently_reraises(tmpdir: Path) -> None:
+    session = PipSession(resume_retries=0)
+    links = [Link(f"http://example.com/pkg{i}-1.0.tar.gz") for i in range(2)]
+    downloader = Downloader(session, "off", concurrency=2)
+
+    def _http_get(link: Link) -> MockResponse:
+        # Claim more bytes than are sent, so the download is incomplete.
+        resp = MockResponse(b"0123")
+        resp.headers = {"content-length": "8"}
+        return resp
+
+    with patch.object(Downloader, "_http_get", side_effect=_http_get):
+        with pytest.raises(IncompleteDownloadError):
+            list(downloader.batch(links, str(tmpdir)))
+
+
+@pytest.mark.parametrize(
+    "resume_status, expected_bytes",
+    [
+        # The download is resumed, so hashing continues where it stopped.
+        (206, b"0cfa7e9d-1868-4dd7-9fb3-f2561d5dfd89"),
+        # The download is restarted, so hashing starts over.
+        (200, b"f2561d5dfd89"),
+    ],
+)
+def test_downloader_checks_hashes_while_downloading(
+    resume_status: int, expected_bytes: bytes, tmpdir: Path
+) -> None:
+    session = PipSession(resume_retries=1)
+    link = Link("http://example.com/foo.tgz")
+    downloader = Downloader(session, "off")
+
+    incomplete_resp = MockResponse(b"0cfa7e9d-1868-4dd7-9fb3-")
+    incomplete_resp.headers = {"content-length": "36"}
+    resume_resp = MockResponse(b"f2561d5dfd89")
+    resume_resp.headers = {"content-length": "12"}
+    resume_resp.status_code = resume_status
+
+    hashes = Hashes({"sha256": [hashlib.sha256(expected_bytes).hexdigest()]})
+    with (
+        patch.object(
+            Downloader, "_http_get", side_effect=[incomplete_resp, resume_resp]
+        ),
+        patch.object(Hashes, "check_against_path") as check_against_path,
+    ):
+        filepath, _ = downloader(link, str(tmpdir), hashes)
+
+    assert Path(filepath).read_bytes() == expected_bytes
+    check_against_path.assert_not_called()
+
+
+def test_downloader_hash_mismatch(tmpdir: Path) -> None:
+    session = PipSession()
+    links = [Link(f"http://example.com/pkg{i}-1.0.tar.gz") for i in range(2)]
+    downloader = Downloader(session, "off")
+
+    def _http_get(link: Link) -> MockResponse:
+        resp = MockResponse(link.filename.encode())
+        resp.headers = {"content-length": str(len(link.filename))}
+        return resp
+
+    hashes = {
+        links[0]: Hashes({"sha256": [hashlib.sha256(b"pkg0-1.0.tar.gz").hexdigest()]}),
+        links[1]: Hashes({"sha256": [hashlib.sha256(b"other").hexdigest()]}),
+    }
+    with patch.object(Downloader, "_http_get", side_effect=_http_get):
+        downloads = iter(downloader.batch(links, str(tmpdir), hashes))
+        assert next(downloads)[0] == links[0]
+        with pytest.raises(HashMismatch):
+            next(downloads)
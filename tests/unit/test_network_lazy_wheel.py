@@ -1,13 +1,24 @@
+from __future__ import annotations
+
+import io
+import os
+import re
+import zipfile
 from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
 
 import pytest
 
 from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.packaging.version import Version
+from pip._vendor.requests.models import Response
+from pip._vendor.requests.structures import CaseInsensitiveDict
 
 from pip._internal.exceptions import InvalidWheel
 from pip._internal.network.lazy_wheel import (
     HTTPRangeRequestUnsupported,
+    _iter_byteranges,
     dist_from_wheel_url,
 )
 from pip._internal.network.session import PipSession
@@ -69,3 +80,151 @@ def test_dist_from_wheel_url_not_zip(session: PipSession) -> None:
         dist_from_wheel_url(
             canonicalize_name("python"), "https://www.python.org/", session
         )
+
+
+class RangeSession:
+    """Serve a file from memory, answering range requests like a server
+    with or without support for multi-range requests. Without it, the
+    server answers multi-range requests with the first range, or with the
+    whole file when full_response is set.
+    """
+
+    def __init__(
+        self, content: bytes, multiple_ranges: bool, full_response: bool = False
+    ) -> None:
+        self.content = content
+        self.multiple_ranges = multiple_ranges
+        self.full_response = full_response
+        self.requested: list[str] = []
+        self.responses: list[Response] = []
+
+    def _byte_range(self, spec: str) -> tuple[int, int]:
+        first, last = spec.split("-")
+        if not first:
+            return max(0, len(self.content) - int(last)), len(self.content) - 1
+        return int(first), min(int(last), len(self.content) - 1)
+
+    def get(self, url: str, headers: dict[str, str], stream: bool) -> Response:
+        spec = re.fullmatch(r"bytes=(.*)", headers["Range"]).group(1)  # type: ignore
+        self.requested.append(spec)
+        byte_ranges = [self._byte_range(r) for r in spec.split(",")]
+        response = Response()
+        response.status_code = 206
+        response.url = url
+        response.headers = CaseInsensitiveDict()
+        self.responses.append(response)
+        if len(byte_ranges) > 1 and self.full_response:
+            response.status_code = 200
+            body = self.content
+        elif len(byte_ranges) == 1 or not self.multiple_ranges:
+            first, last = byte_ranges[0]
+            body = self.content[first : last + 1]
+            response.headers["Content-Range"] = (
+                f"bytes {first}-{last}/{len(self.content)}"
+            )
+        else:
+            response.headers["Content-Type"] = "multipart/byteranges; boundary=XX"
+            body = b""
+            for first, last in byte_ranges:
+                content_range = f"bytes {first}-{last}/{len(self.content)}"
+                body += (
+                    b"\r\n--XX\r\nContent-Type: application/zip\r\n"
+                    + f"Content-Range: {content_range}".encode()
+                    + b"\r\n\r\n"
+                    + self.content[first : last + 1]
+                )
+            body += b"\r\n--XX--\r\n"
+        response.raw = io.BytesIO(body)
+        return response
+
+
+@pytest.mark.parametrize("multiple_ranges", [True, False])
+def test_dist_from_wheel_url_round_trips(
+    shared_data: TestData, multiple_ranges: bool
+) -> None:
+    """The metadata is read with a request for the tail of the wheel, one
+    for the rest of its large central directory, and one for the .dist-info
+    directory.
+    """
+    mypy_whl = shared_data.packages / "mypy-0.782-py3-none-any.whl"
+    session: Any = RangeSession(mypy_whl.read_bytes(), multiple_ranges)
+    dist = dist_from_wheel_url(canonicalize_name("mypy"), "mypy.whl", session)
+
+    assert dist.version == Version("0.782")
+    assert {str(d) for d in dist.iter_dependencies(["dmypy"])} == MYPY_0_782_REQS
+    assert len(session.requested) == 3
+    assert session.requested[0] == "-10240"
+
+
+@pytest.mark.parametrize("multiple_ranges", [True, False])
+def test_dist_from_wheel_url_scattered_dist_info(
+    tmp_path: Path, multiple_ranges: bool
+) -> None:
+    """Members of .dist-info not stored next to each other are fetched with
+    a single request when the server supports multi-range requests.
+    """
+    wheel_path = tmp_path / "simple-1.0-py3-none-any.whl"
+    with zipfile.ZipFile(wheel_path, "w") as zf:
+        zf.writestr(
+            "simple-1.0.dist-info/WHEEL",
+            "Wheel-Version: 1.0\nRoot-Is-Purelib: true\nTag: py3-none-any\n",
+        )
+        zf.writestr("simple/data.bin", os.urandom(100_000))
+        zf.writestr(
+            "simple-1.0.dist-info/METADATA",
+            "Metadata-Version: 2.1\nName: simple\nVersion: 1.0\n",
+        )
+        zf.writestr("simple/more.bin", os.urandom(100_000))
+        zf.writestr("simple-1.0.dist-info/RECORD", "")
+    session: Any = RangeSession(wheel_path.read_bytes(), multiple_ranges)
+    dist = dist_from_wheel_url(canonicalize_name("simple"), "simple.whl", session)
+
+    assert dist.version == Version("1.0")
+    if multiple_ranges:
+        assert len(session.requested) == 2
+        assert session.requested[1].count(",") == 1
+    else:
+        # The second range is fetched on its own after the first response.
+        assert len(session.requested) == 3
+        assert "," in session.requested[1]
+        assert "," not in session.requested[2]
+
+
+def test_dist_from_wheel_url_multiple_ranges_full_response(tmp_path: Path) -> None:
+    """A server answering multi-range requests with the whole file is not
+    read from, and the ranges are then fetched one by one.
+    """
+    wheel_path = tmp_path / "simple-1.0-py3-none-any.whl"
+    with zipfile.ZipFile(wheel_path, "w") as zf:
+        zf.writestr(
+            "simple-1.0.dist-info/WHEEL",
+            "Wheel-Version: 1.0\nRoot-Is-Purelib: true\nTag: py3-none-any\n",
+        )
+        zf.writestr("simple/data.bin", os.urandom(100_000))
+        zf.writestr(
+            "simple-1.0.dist-info/METADATA",
+            "Metadata-Version: 2.1\nName: simple\nVersion: 1.0\n",
+        )
+        zf.writestr("simple/more.bin", os.urandom(100_000))
+        zf.writestr("simple-1.0.dist-info/RECORD", "")
+    session: Any = RangeSession(
+        wheel_path.read_bytes(), multiple_ranges=False, full_response=True
+    )
+    dist = dist_from_wheel_url(canonicalize_name("simple"), "simple.whl", session)
+
+    assert dist.version == Version("1.0")
+    assert len(session.requested) == 4
+    assert "," in session.requested[1]
+    # The body was neither read nor left open.
+    assert session.responses[1]._content is False
+    assert session.responses[1].raw.closed
+    assert "," not in session.requested[2]
+    assert "," not in session.requested[3]
+
+
+def test_iter_byteranges() -> None:
+    body = (
+        b"--B\r\nContent-Range: bytes 0-2/10\r\n\r\nabc\r\n"
+        b"--B\r\ncontent-range: bytes 7-9/10\r\n\r\n--B\r\n--B--\r\n"
+    )
+    assert list(_iter_byteranges(body, b"B")) == [(0, b"abc"), (7, b"--B")]
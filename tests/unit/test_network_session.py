@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import logging
 import os
+import socket
 from pathlib import Path
 from typing import Any
+from unittest import mock
 from urllib.parse import urlparse
 from urllib.request import getproxies
 
@@ -16,6 +18,7 @@ from pip._internal.models.link import Link
 from pip._internal.network.session import (
     CI_ENVIRONMENT_VARIABLES,
     PipSession,
+    TLSSessionResumingContext,
     user_agent,
 )
 
@@ -91,6 +94,44 @@ class TestPipSession:
 
         assert not hasattr(session.adapters["http://"], "cache")
 
+    def test_pool_defaults(self) -> None:
+        session = PipSession()
+
+        for prefix in ("http://", "https://"):
+            pool_kw = session.adapters[prefix].poolmanager.connection_pool_kw
+            assert pool_kw["maxsize"] == 10
+            assert pool_kw["block"] is False
+            assert "socket_options" not in pool_kw
+
+    @pytest.mark.parametrize("cache", [False, True])
+    def test_pool_options(self, tmpdir: Path, cache: bool) -> None:
+        session = PipSession(
+            cache=os.fspath(tmpdir.joinpath("test-cache")) if cache else None,
+            trusted_hosts=["example.com"],
+            max_host_connections=4,
+            tcp_keepalive=True,
+        )
+
+        for prefix in ("http://", "https://", "https://example.com/"):
+            pool_kw = session.adapters[prefix].poolmanager.connection_pool_kw
+            assert pool_kw["maxsize"] == 4
+            assert pool_kw["block"] is True
+            assert (
+                socket.SOL_SOCKET,
+                socket.SO_KEEPALIVE,
+                1,
+            ) in pool_kw["socket_options"]
+
+    def test_ssl_context_resumes_sessions(self) -> None:
+        ssl_context = mock.Mock()
+        session = PipSession(ssl_context=ssl_context)
+
+        pool_kw = session.adapters["https://"].poolmanager.connection_pool_kw
+        assert isinstance(pool_kw["ssl_context"], TLSSessionResumingContext)
+        # Configuration is applied to the wrapped context.
+        pool_kw["ssl_context"].check_hostname = False
+        assert ssl_context.check_hostname is False
+
     def test_trusted_hosts_adapter(self, tmpdir: Path) -> None:
         session = PipSession(
             cache=os.fspath(tmpdir.joinpath("test-cache")),
@@ -284,3 +325,51 @@ class TestPipSession:
             f"Invalid proxy {proxy} or session.proxies: "
             f"{session.proxies} is not correctly passed to session.request."
         )
+
+
+class TestTLSSessionResumingContext:
+    def make_context(self) -> tuple[mock.Mock, TLSSessionResumingContext]:
+        wrapped = mock.Mock()
+
+        def wrap_socket(sock: Any, **kwargs: Any) -> mock.Mock:
+            ssl_sock = mock.Mock(session_reused=kwargs["session"] is not None)
+            # Like a TLS 1.3 ticket, the session is only known after the first
+            # read from the socket.
+            ssl_sock.session = None
+            return ssl_sock
+
+        wrapped.wrap_socket.side_effect = wrap_socket
+        return wrapped, TLSSessionResumingContext(wrapped)
+
+    def test_first_connection_uses_no_session(self) -> None:
+        wrapped, context = self.make_context()
+
+        context.wrap_socket(mock.sentinel.sock, server_hostname="example.com")
+
+        wrapped.wrap_socket.assert_called_once_with(
+            mock.sentinel.sock, server_hostname="example.com", session=None
+        )
+
+    def test_resumes_session_of_previous_connection(self) -> None:
+        wrapped, context = self.make_context()
+
+        first = context.wrap_socket(mock.sentinel.sock, server_hostname="example.com")
+        first.session = mock.sentinel.session
+        second = context.wrap_socket(mock.sentinel.sock, server_hostname="example.com")
+
+        assert wrapped.wrap_socket.call_args.kwargs["session"] is mock.sentinel.session
+        assert second.session_reused
+
+        # The session outlives the connection it came from.
+        del first
+        context.wrap_socket(mock.sentinel.sock, server_hostname="example.com")
+        assert wrapped.wrap_socket.call_args.kwargs["session"] is mock.sentinel.session
+
+    def test_sessions_are_per_host(self) -> None:
+        wrapped, context = self.make_context()
+
+        first = context.wrap_socket(mock.sentinel.sock, server_hostname="example.com")
+        first.session = mock.sentinel.session
+        context.wrap_socket(mock.sentinel.sock, server_hostname="example.org")
+
+        assert wrapped.wrap_socket.call_args.kwargs["session"] is None
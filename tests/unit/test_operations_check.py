@@ -0,0 +1,110 @@
+import logging
+import shutil
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from pip._vendor.packaging.utils import canonicalize_name
+
+from pip._internal.metadata import get_environment, get_metadata_distribution
+from pip._internal.operations.check import (
+    CheckResult,
+    IncrementalChecker,
+    PackageSet,
+    _simulate_installation_of,
+    check_package_set,
+    create_package_set_from_installed,
+)
+from pip._internal.req.constructors import install_req_from_line
+
+
+def make_dist_info(site: Path, name: str, version: str, *requires: str) -> None:
+    info = site / f"{name}-{version}.dist-info"
+    info.mkdir(parents=True)
+    lines = [f"Name: {name}", f"Version: {version}"]
+    lines += [f"Requires-Dist: {req}" for req in requires]
+    info.joinpath("METADATA").write_text("\n".join(lines) + "\n")
+
+
+def remove_dist_info(site: Path, name: str, version: str) -> None:
+    shutil.rmtree(site / f"{name}-{version}.dist-info")
+
+
+class TestIncrementalChecker:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        self.site = tmp_path / "site"
+        self.checker = IncrementalChecker(str(tmp_path / "check"))
+        self.caplog = caplog
+        caplog.set_level(logging.DEBUG, logger="pip._internal.operations.check")
+        make_dist_info(self.site, "app", "1.0", "lib>=2", "tool")
+        make_dist_info(self.site, "lib", "1.0")
+        make_dist_info(self.site, "tool", "1.0", "extra; python_version < '3'")
+        make_dist_info(self.site, "other", "1.0", "gone")
+
+    def check(self, expected_checked: int) -> CheckResult:
+        self.caplog.clear()
+        with mock.patch(
+            "pip._internal.operations.check.get_default_environment",
+            return_value=get_environment([str(self.site)]),
+        ):
+            versions, result, problems = self.checker.check()
+            package_set, _ = create_package_set_from_installed()
+
+        # The result always matches the one of a full check.
+        assert result == check_package_set(package_set)
+        assert versions == {name: d.version for name, d in package_set.items()}
+        assert not problems
+        assert f"Checking {expected_checked} of " in self.caplog.text
+        return result
+
+    def test_unchanged_packages_are_not_checked_again(self) -> None:
+        missing, conflicting = self.check(expected_checked=4)
+        assert set(missing) == {"other"}
+        assert set(conflicting) == {"app"}
+
+        assert self.check(expected_checked=0) == (missing, conflicting)
+
+    def test_dependents_of_changed_packages_are_checked(self) -> None:
+        self.check(expected_checked=4)
+
+        remove_dist_info(self.site, "lib", "1.0")
+        make_dist_info(self.site, "lib", "2.0")
+        # lib and app, which depends on it.
+        missing, conflicting = self.check(expected_checked=2)
+        assert set(missing) == {"other"}
+        assert conflicting == {}
+
+        remove_dist_info(self.site, "tool", "1.0")
+        make_dist_info(self.site, "gone", "1.0")
+        # gone, and the packages depending on it or on the removed tool.
+        missing, conflicting = self.check(expected_checked=3)
+        assert set(missing) == {"app"}
+        assert conflicting == {}
+
+    def test_changed_requirements_are_checked(self) -> None:
+        self.check(expected_checked=4)
+
+        remove_dist_info(self.site, "other", "1.0")
+        make_dist_info(self.site, "other", "1.0", "lib<1")
+        missing, conflicting = self.check(expected_checked=1)
+        assert missing == {}
+        assert set(conflicting) == {"app", "other"}
+
+
+def test_simulated_installation_uses_metadata_of_requirements_in_preparation() -> None:
+    req = install_req_from_line("app==2.0")
+    req.needs_more_preparation = True
+    req.set_dist(
+        get_metadata_distribution(
+            b"Name: app\nVersion: 2.0\nRequires-Dist: lib>=3\n",
+            "app-2.0-py3-none-any.whl",
+            "app",
+        )
+    )
+    package_set: PackageSet = {}
+    assert _simulate_installation_of([req], package_set) == {"app"}
+    details = package_set[canonicalize_name("app")]
+    assert str(details.version) == "2.0"
+    assert [str(r) for r in details.dependencies] == ["lib>=3"]
@@ -1,5 +1,8 @@
+import hashlib
 import os
 import shutil
+import threading
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from shutil import rmtree
 from tempfile import mkdtemp
@@ -9,10 +12,16 @@ from unittest.mock import Mock, patch
 import pytest
 
 from pip._internal.exceptions import HashMismatch
-from pip._internal.models.link import Link
+from pip._internal.models.link import Link, MetadataFile
 from pip._internal.network.download import Downloader
 from pip._internal.network.session import PipSession
-from pip._internal.operations.prepare import unpack_url
+from pip._internal.operations.prepare import (
+    BackgroundPreparer,
+    RequirementPreparer,
+    unpack_url,
+)
+from pip._internal.req.constructors import install_req_from_line
+from pip._internal.req.req_install import InstallRequirement
 from pip._internal.utils.hashes import Hashes
 
 from tests.lib import TestData
@@ -135,3 +144,146 @@ class Test_unpack_url:
                 hashes=Hashes({"md5": ["bogus"]}),
                 verbosity=0,
             )
+
+
+def _make_prefetching_preparer(session: Mock, tmpdir: Path) -> RequirementPreparer:
+    return RequirementPreparer(
+        build_dir=os.fspath(tmpdir / "build"),
+        src_dir=os.fspath(tmpdir / "src"),
+        download_dir=None,
+        build_isolation=True,
+        build_isolation_installer=Mock(),
+        check_build_deps=False,
+        build_tracker=Mock(),
+        session=session,
+        progress_bar="off",
+        finder=Mock(),
+        require_hashes=False,
+        use_user_site=False,
+        lazy_wheel=False,
+        verbosity=0,
+        legacy_resolver=False,
+        metadata_prefetch=True,
+    )
+
+
+@patch("pip._internal.operations.prepare.raise_for_status")
+def test_prefetched_metadata_is_used(mock_raise_for_status: Mock, tmpdir: Path) -> None:
+    contents = b"Metadata-Version: 2.1\nName: simple\nVersion: 1.0\n"
+    digest = hashlib.sha256(contents).hexdigest()
+    link = Link(
+        "https://example.com/simple-1.0-py3-none-any.whl",
+        metadata_file_data=MetadataFile({"sha256": digest}),
+    )
+    session = Mock()
+    session.resume_retries = 0
+    session.get.return_value = MockResponse(contents)
+    preparer = _make_prefetching_preparer(session, tmpdir)
+
+    preparer.prefetch_metadata(link)
+    req = install_req_from_line("simple==1.0")
+    req.link = link
+    with patch("pip._internal.operations.prepare.get_http_url") as get_http_url:
+        dist = preparer._fetch_metadata_using_link_data_attr(req)
+
+    assert dist is not None
+    assert dist.canonical_name == "simple"
+    assert str(dist.version) == "1.0"
+    get_http_url.assert_not_called()
+    session.get.assert_called_once()
+
+
+@patch("pip._internal.operations.prepare.raise_for_status")
+def test_prefetched_metadata_hash_mismatch(
+    mock_raise_for_status: Mock, tmpdir: Path
+) -> None:
+    link = Link(
+        "https://example.com/simple-1.0-py3-none-any.whl",
+        metadata_file_data=MetadataFile({"sha256": "0" * 64}),
+    )
+    session = Mock()
+    session.resume_retries = 0
+    session.get.return_value = MockResponse(b"Name: simple\nVersion: 1.0\n")
+    preparer = _make_prefetching_preparer(session, tmpdir)
+
+    preparer.prefetch_metadata(link)
+    req = install_req_from_line("simple==1.0")
+    req.link = link
+    with pytest.raises(HashMismatch):
+        preparer._fetch_metadata_using_link_data_attr(req)
+
+
+def test_failed_metadata_prefetch_is_not_used(tmpdir: Path) -> None:
+    link = Link(
+        "https://example.com/simple-1.0-py3-none-any.whl",
+        metadata_file_data=MetadataFile(None),
+    )
+    session = Mock()
+    session.resume_retries = 0
+    session.get.side_effect = OSError("connection reset")
+    preparer = _make_prefetching_preparer(session, tmpdir)
+
+    preparer.prefetch_metadata(link)
+    assert preparer._get_prefetched_metadata_file(link.metadata_link()) is None
+
+
+class TestBackgroundPreparer:
+    def make_requirements(self, *names: str) -> list[InstallRequirement]:
+        requirements = []
+        for name in names:
+            requirement = install_req_from_line(name)
+            requirement.needs_more_preparation = True
+            requirements.append(requirement)
+        return requirements
+
+    def test_requirements_are_available_once_prepared(self) -> None:
+        a, b = self.make_requirements("a", "b")
+        a_waited = threading.Event()
+
+        def prepare(reqs: Iterable[InstallRequirement]) -> Iterator[InstallRequirement]:
+            assert list(reqs) == [a, b]
+            yield b
+            assert a_waited.wait(timeout=5)
+            yield a
+
+        preparer = Mock()
+        preparer.iter_prepared_requirements_more.side_effect = prepare
+        with BackgroundPreparer(preparer, [a, b]) as background_preparer:
+            # b is prepared first, while a is still in preparation.
+            background_preparer.wait(b)
+            a_waited.set()
+            background_preparer.wait(a)
+
+    def test_preparation_error_is_raised_when_waiting(self) -> None:
+        a, b = self.make_requirements("a", "b")
+
+        def prepare(reqs: Iterable[InstallRequirement]) -> Iterator[InstallRequirement]:
+            yield a
+            raise HashMismatch({}, {})
+
+        preparer = Mock()
+        preparer.iter_prepared_requirements_more.side_effect = prepare
+        with BackgroundPreparer(preparer, [a, b]) as background_preparer:
+            background_preparer.wait(a)
+            with pytest.raises(HashMismatch):
+                background_preparer.wait(b)
+
+    def test_exiting_stops_the_preparation(self) -> None:
+        a, b = self.make_requirements("a", "b")
+        prepared = []
+        closed = threading.Event()
+
+        def prepare(reqs: Iterable[InstallRequirement]) -> Iterator[InstallRequirement]:
+            try:
+                for req in reqs:
+                    prepared.append(req)
+                    yield req
+            finally:
+                closed.set()
+
+        preparer = Mock()
+        preparer.iter_prepared_requirements_more.side_effect = prepare
+        with BackgroundPreparer(preparer, [a, b]) as background_preparer:
+            background_preparer.wait(a)
+        assert closed.is_set()
+        assert prepared in ([a], [a, b])
@@ -6,10 +6,11 @@ import os
 import shutil
 import sys
 import tempfile
-from collections.abc import Iterator
+import threading
+from collections.abc import Callable, Iterator
 from functools import partial
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 from unittest import mock
 
 import pytest
@@ -28,12 +29,18 @@ from pip._internal.exceptions import (
     PreviousBuildDirError,
 )
 from pip._internal.index.package_finder import PackageFinder
+from pip._internal.metadata import BaseDistribution
 from pip._internal.models.direct_url import ArchiveInfo, DirectUrl
 from pip._internal.models.link import Link
 from pip._internal.network.session import PipSession
 from pip._internal.operations.build.build_tracker import get_build_tracker
 from pip._internal.operations.prepare import RequirementPreparer
-from pip._internal.req import InstallRequirement, RequirementSet
+from pip._internal.req import (
+    InstallRequirement,
+    RequirementSet,
+    _install_concurrently,
+    install_given_reqs,
+)
 from pip._internal.req.constructors import (
     _get_url_from_path,
     _looks_like_path,
@@ -1063,3 +1070,170 @@ def test_get_url_from_path__installable_error(isdir_mock: mock.Mock) -> None:
         _get_url_from_path(path, name)
     err_msg = e.value.args[0]
     assert "Neither 'setup.py' nor 'pyproject.toml' found" in err_msg
+
+
+class TestInstallConcurrently:
+    def make_requirement(self, name: str) -> mock.Mock:
+        requirement = mock.Mock(should_reinstall=False, install_succeeded=False)
+        requirement.name = name
+        return requirement
+
+    def test_overlapping_requirements_are_installed_in_order(self) -> None:
+        a, b, c = (self.make_requirement(name) for name in "abc")
+        roots = {"a": {("lib", "x")}, "b": {("lib", "x")}, "c": {("lib", "y")}}
+        c_installed = threading.Event()
+        events = []
+
+        def install(requirement: mock.Mock) -> Callable[..., None]:
+            def _install(**kwargs: object) -> None:
+                events.append(f"start {requirement.name}")
+                if requirement is a:
+                    # Only returns if c is installed at the same time as a.
+                    assert c_installed.wait(timeout=5)
+                elif requirement is c:
+                    c_installed.set()
+                events.append(f"end {requirement.name}")
+
+            return _install
+
+        for requirement in (a, b, c):
+            requirement.install.side_effect = install(requirement)
+
+        with mock.patch(
+            "pip._internal.req._get_install_roots",
+            side_effect=lambda req, **kwargs: roots[req.name],
+        ):
+            installed = list(_install_concurrently([a, b, c], 3, pycompile=False))
+
+        # a and c may complete at the same time, but b always waits for a.
+        assert installed[2] is b
+        assert set(installed[:2]) == {a, c}
+        assert events.index("end a") < events.index("start b")
+        for requirement in (a, b, c):
+            requirement.install.assert_called_once_with(
+                pycompile=False, unchanged_files=set()
+            )
+
+    def test_error_is_reraised_after_running_installs(self) -> None:
+        a, b, c = (self.make_requirement(name) for name in "abc")
+        a.install.side_effect = InstallationError("boom")
+        roots = {"a": {("lib", "x")}, "b": {("lib", "y")}, "c": {("lib", "x")}}
+
+        with mock.patch(
+            "pip._internal.req._get_install_roots",
+            side_effect=lambda req, **kwargs: roots[req.name],
+        ):
+            installed = []
+
+            def install() -> None:
+                for requirement in _install_concurrently([a, b, c], 2):
+                    installed.append(requirement)
+
+            with pytest.raises(InstallationError, match="boom"):
+                install()
+
+        assert installed == [b]
+        c.install.assert_not_called()
+
+
+class TestInstallGivenReqs:
+    def make_requirement(self, name: str, events: list[str]) -> mock.Mock:
+        requirement = mock.Mock(should_reinstall=False, install_succeeded=False)
+        requirement.name = name
+        requirement.install.side_effect = lambda **kwargs: events.append(
+            f"install {name}"
+        )
+        return requirement
+
+    def install(self, requirements: list[Any], wait: Callable[[Any], None]) -> None:
+        install_given_reqs(
+            requirements,
+            root=None,
+            home=None,
+            prefix=None,
+            warn_script_location=False,
+            use_user_site=False,
+            pycompile=False,
+            progress_bar="off",
+            wait_for_preparation=wait,
+        )
+
+    def test_each_requirement_is_waited_for_before_installing(self) -> None:
+        events: list[str] = []
+        requirements = [self.make_requirement(name, events) for name in "abc"]
+        self.install(requirements, lambda req: events.append(f"wait {req.name}"))
+        assert events == [
+            "wait a",
+            "install a",
+            "wait b",
+            "install b",
+            "wait c",
+            "install c",
+        ]
+
+    def test_failed_preparation_stops_the_installation(self) -> None:
+        events: list[str] = []
+        a, b, c = (self.make_requirement(name, events) for name in "abc")
+
+        def wait(requirement: mock.Mock) -> None:
+            if requirement is b:
+                raise InstallationError("download failed")
+
+        with pytest.raises(InstallationError, match="download failed"):
+            self.install([a, b, c], wait)
+        assert events == ["install a"]
+
+    def test_failed_preparation_rolls_back_the_installation(
+        self, tmp_path: Path
+    ) -> None:
+        events: list[str] = []
+        a, b, c = (self.make_requirement(name, events) for name in "abc")
+        a.should_reinstall = True
+        pathset = a.uninstall.return_value
+        for name in ("a-2.0", "b-1.0", "other-1.0"):
+            info_dir = tmp_path / f"{name}.dist-info"
+            info_dir.mkdir()
+            info_dir.joinpath("METADATA").write_text(
+                "Name: {}\nVersion: {}\n".format(*name.split("-"))
+            )
+        pathset.rollback.side_effect = lambda: events.append("restore a")
+
+        def wait(requirement: mock.Mock) -> None:
+            if requirement is c:
+                raise InstallationError("download failed")
+
+        def remove(dist: BaseDistribution, keep: set[str]) -> None:
+            assert keep == set()
+            events.append(f"remove {os.path.basename(dist.info_location or '')}")
+
+        with mock.patch(
+            "pip._internal.req.get_scheme",
+            return_value=mock.Mock(purelib=str(tmp_path), platlib=str(tmp_path)),
+        ):
+            with mock.patch("pip._internal.req.remove_installed_files", remove):
+                with pytest.raises(InstallationError, match="download failed"):
+                    self.install([a, b, c], wait)
+
+        assert events == [
+            "install a",
+            "install b",
+            "remove b-1.0.dist-info",
+            "remove a-2.0.dist-info",
+            "restore a",
+        ]
+        pathset.rollback.assert_called_once_with()
+        pathset.commit.assert_not_called()
+
+    def test_failed_installation_keeps_previous_installations(self) -> None:
+        events: list[str] = []
+        a, b = (self.make_requirement(name, events) for name in "ab")
+        a.should_reinstall = True
+        b.install.side_effect = InstallationError("install failed")
+
+        with mock.patch("pip._internal.req.remove_installed_files") as remove:
+            with pytest.raises(InstallationError, match="install failed"):
+                self.install([a, b], lambda req: None)
+
+        remove.assert_not_called()
+        a.uninstall.return_value.commit.assert_called_once_with()
+        a.uninstall.return_value.rollback.assert_not_called()
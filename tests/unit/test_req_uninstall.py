@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import sys
 from collections.abc import Iterator
+from importlib.util import cache_from_source
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -16,6 +17,7 @@ from pip._internal.req.req_uninstall import (
     compact,
     compress_for_output_listing,
     compress_for_rename,
+    remove_installed_files,
     uninstallation_paths,
 )
 
@@ -57,6 +59,36 @@ def test_uninstallation_paths() -> None:
     assert paths2 == paths
 
 
+def test_remove_installed_files(tmp_path: Path) -> None:
+    entries = [
+        "pkg/__init__.py",
+        "pkg/mod.py",
+        "pkg/unchanged.py",
+        "pkg-1.0.dist-info/RECORD",
+        "../../bin/script",
+    ]
+    lib = tmp_path / "lib" / "site-packages"
+    for entry in entries:
+        create_file(os.path.normpath(lib / entry))
+    create_file(cache_from_source(os.path.normpath(lib / "pkg/mod.py")))
+    create_file(os.path.normpath(lib / "other/mod.py"))
+
+    class dist:
+        def iter_declared_entries(self) -> Iterator[str] | None:
+            return iter(entries)
+
+        location = str(lib)
+
+    remove_installed_files(
+        dist(),  # type: ignore[arg-type]
+        keep=[str(lib / "pkg" / "unchanged.py")],
+    )
+
+    assert sorted(p.name for p in lib.iterdir()) == ["other", "pkg"]
+    assert [p.name for p in (lib / "pkg").iterdir()] == ["unchanged.py"]
+    assert not (tmp_path / "bin" / "script").exists()
+
+
 def test_compressed_listing(tmpdir: Path) -> None:
     def in_tmpdir(paths: list[str]) -> list[str]:
         return [
@@ -253,15 +285,21 @@ class TestStashedUninstallPathSet:
     ]
 
     @classmethod
-    def mock_walk(cls, root: str) -> Iterator[tuple[str, list[str], list[str]]]:
+    def make_tree(cls, tmpdir: Path) -> None:
         for dirname, subdirs, files in cls.WALK_RESULT:
-            dirname = os.path.sep.join(dirname.split("/"))
-            if dirname.startswith(root):
-                yield dirname[len(root) + 1 :], subdirs, files
+            root = os.path.join(tmpdir, *dirname.split("/"))
+            if not os.path.exists(root):
+                os.mkdir(root)
+            for d in subdirs:
+                os.mkdir(os.path.join(root, d))
+            for f in files:
+                with open(os.path.join(root, f), "wb"):
+                    pass
 
-    def test_compress_for_rename(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_compress_for_rename(self, tmpdir: Path) -> None:
+        self.make_tree(tmpdir)
         paths = [
-            os.path.sep.join(p.split("/"))
+            os.path.join(tmpdir, *p.split("/"))
             for p in [
                 "A/B/b.py",
                 "A/B/D/c.py",
@@ -272,7 +310,7 @@ class TestStashedUninstallPathSet:
         ]
 
         expected_paths = [
-            os.path.sep.join(p.split("/"))
+            os.path.join(tmpdir, *p.split("/"))
             for p in [
                 "A/B/",  # selected everything below A/B
                 "A/C/d.py",  # did not select everything below A/C
@@ -281,24 +319,28 @@ class TestStashedUninstallPathSet:
             ]
         ]
 
-        monkeypatch.setattr("os.walk", self.mock_walk)
-
         actual_paths = compress_for_rename(paths)
         assert set(expected_paths) == set(actual_paths)
 
+    @pytest.mark.skipif("sys.platform == 'win32'")
+    def test_compress_for_rename_nested(self, tmp_path: Path) -> None:
+        for path in ["top/a.py", "top/other.txt", "top/sub/b.py", "elsewhere/c.py"]:
+            create_file(str(tmp_path.joinpath(path)))
+        os.symlink(tmp_path / "elsewhere", tmp_path / "top" / "sub" / "link")
+        paths = [str(tmp_path.joinpath(p)) for p in ["top/a.py", "top/sub/b.py"]]
+
+        # top/sub is renamed as a whole even though top is not, and the link
+        # to a directory in it is not followed.
+        assert compress_for_rename(paths) == {
+            str(tmp_path / "top" / "a.py"),
+            os.path.join(tmp_path, "top", "sub", ""),
+        }
+
     @classmethod
     def make_stash(
         cls, tmpdir: Path, paths: list[str]
     ) -> tuple[StashedUninstallPathSet, list[tuple[str, str]]]:
-        for dirname, subdirs, files in cls.WALK_RESULT:
-            root = os.path.join(tmpdir, *dirname.split("/"))
-            if not os.path.exists(root):
-                os.mkdir(root)
-            for d in subdirs:
-                os.mkdir(os.path.join(root, d))
-            for f in files:
-                with open(os.path.join(root, f), "wb"):
-                    pass
+        cls.make_tree(tmpdir)
 
         pathset = StashedUninstallPathSet()
 
@@ -324,6 +366,21 @@ class TestStashedUninstallPathSet:
 
         assert stashed_paths == pathset._moves
 
+    def test_stash_metadata_directory(self, tmp_path: Path) -> None:
+        lib = tmp_path / "lib"
+        create_file(str(lib / "pkg" / "__init__.py"))
+        create_file(str(lib / "pkg-1.0.dist-info" / "METADATA"))
+        pathset = StashedUninstallPathSet()
+        for name in ("pkg", "pkg-1.0.dist-info"):
+            new_path = pathset.stash(os.path.join(lib, name, ""))
+            assert os.path.exists(new_path)
+
+        # Stashed metadata directories are not left next to the environment.
+        assert os.listdir(lib) == ["~kg"]
+
+        pathset.rollback()
+        assert sorted(os.listdir(lib)) == ["pkg", "pkg-1.0.dist-info"]
+
     def test_commit(self, tmpdir: Path) -> None:
         pathset, stashed_paths = self.make_stash(
             tmpdir,
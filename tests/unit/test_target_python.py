@@ -126,3 +126,19 @@ class TestTargetPython:
         }
         actual = target_python.get_unsorted_tags()
         assert actual == {Tag("py2", "none", "any"), Tag("py3", "none", "any")}
+
+    def test_get_tag_priorities(self) -> None:
+        target_python = TargetPython(py_version_info=None)
+        target_python._valid_tags = [
+            Tag("py3", "none", "any"),
+            Tag("py2", "none", "any"),
+        ]
+        priorities = target_python.get_tag_priorities()
+        assert priorities == {
+            Tag("py3", "none", "any"): 0,
+            Tag("py2", "none", "any"): 1,
+        }
+        # The mapping is read-only, and computed only once.
+        with pytest.raises(TypeError):
+            priorities[Tag("py4", "none", "any")] = 2  # type: ignore[index]
+        assert target_python.get_tag_priorities() is priorities
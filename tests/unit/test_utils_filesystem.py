@@ -1,7 +1,15 @@
+from __future__ import annotations
+
+import errno
 import os
+import stat
 from pathlib import Path
 
+import pytest
+
+from pip._internal.utils import filesystem
 from pip._internal.utils.filesystem import (
+    FileLinker,
     _subdirs_without_generic,
     subdirs_without_files,
     subdirs_without_wheels,
@@ -223,3 +231,75 @@ class TestSubdirsWithoutWheels:
         # All directories should be yielded since none have wheels
         assert len(result) == 4  # test_dir, a, a/b, c
         assert test_dir in result
+
+
+class TestFileLinker:
+    """Tests for FileLinker."""
+
+    def test_link(self, tmp_path: Path) -> None:
+        src = tmp_path / "src"
+        src.write_text("data")
+        linker = FileLinker()
+        linker.link(str(src), str(tmp_path / "dst"))
+        assert (tmp_path / "dst").read_text() == "data"
+
+    def test_falls_back_to_hard_links(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        clones = []
+
+        def clone_file(src: str, dst: str) -> None:
+            clones.append(dst)
+            raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+        monkeypatch.setattr(filesystem, "_clone_file", clone_file)
+        src = tmp_path / "src"
+        src.write_text("data")
+        linker = FileLinker()
+        linker.link(str(src), str(tmp_path / "first"))
+        linker.link(str(src), str(tmp_path / "second"))
+        assert len(clones) <= 1
+        assert (tmp_path / "first").samefile(src)
+        assert (tmp_path / "second").samefile(src)
+
+    def test_falls_back_to_copies_across_devices(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        links = []
+
+        def clone_file(src: str, dst: str) -> None:
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        def link(src: str, dst: str) -> None:
+            links.append(dst)
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(filesystem, "_clone_file", clone_file)
+        monkeypatch.setattr(os, "link", link)
+        src = tmp_path / "src"
+        src.write_text("data")
+        src.chmod(0o755)
+        linker = FileLinker()
+        linker.link(str(src), str(tmp_path / "first"))
+        linker.link(str(src), str(tmp_path / "second"))
+        assert links == [str(tmp_path / "first")]
+        for name in ["first", "second"]:
+            assert (tmp_path / name).read_text() == "data"
+            assert not (tmp_path / name).samefile(src)
+            assert (tmp_path / name).stat().st_mode & 0o777 == 0o755
+
+    def test_copies_of_read_only_files_are_writable(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def clone_file(src: str, dst: str) -> None:
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(filesystem, "_clone_file", clone_file)
+        monkeypatch.setattr(os, "link", clone_file)
+        src = tmp_path / "src"
+        src.write_text("data")
+        src.chmod(0o555)
+        FileLinker().link(str(src), str(tmp_path / "dst"))
+        mode = (tmp_path / "dst").stat().st_mode
+        assert mode & stat.S_IWUSR
+        assert mode & stat.S_IXUSR
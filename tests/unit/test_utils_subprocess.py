@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import locale
+import os
 import sys
+import threading
 from logging import DEBUG, ERROR, INFO, WARNING
 
 import pytest
@@ -16,6 +18,7 @@ from pip._internal.utils.subprocess import (
     format_command_args,
     make_command,
     subprocess_logger,
+    thread_environ,
 )
 
 
@@ -396,3 +399,21 @@ def test_unicode_decode_error(caplog: pytest.LogCaptureFixture) -> None:
     assert len(caplog.records) == 2
     # First log record is "Running ..."
     assert caplog.record_tuples[1] == ("pip.subprocessor", INFO, "\\xff")
+
+
+def test_thread_environ() -> None:
+    args = [sys.executable, "-c", "import os; print(os.environ.get('PIP_TEST_VAR'))"]
+    results = []
+
+    def thread_function() -> None:
+        results.append(call_subprocess(args, command_desc="other thread").strip())
+
+    with thread_environ({"PIP_TEST_VAR": "value"}):
+        assert "PIP_TEST_VAR" not in os.environ
+        results.append(call_subprocess(args, command_desc="this thread").strip())
+        thread = threading.Thread(target=thread_function)
+        thread.start()
+        thread.join()
+    results.append(call_subprocess(args, command_desc="after").strip())
+
+    assert results == ["value", "None", "None"]
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import csv
+import importlib.util
 import os
 import pathlib
 import sys
 import textwrap
+import zipfile
 from email import message_from_string
 from pathlib import Path
 from typing import cast
@@ -19,6 +21,7 @@ from pip._vendor.packaging.utils import canonicalize_name
 
 from pip._internal.exceptions import InstallationError
 from pip._internal.locations import get_scheme
+from pip._internal.metadata import get_environment
 from pip._internal.models.direct_url import (
     DIRECT_URL_METADATA_NAME,
     ArchiveInfo,
@@ -31,6 +34,7 @@ from pip._internal.operations.install.wheel import (
     RecordPath,
     get_console_script_specs,
 )
+from pip._internal.req.req_uninstall import UninstallPathSet, uninstallation_paths
 from pip._internal.utils.compat import WINDOWS
 from pip._internal.utils.misc import hash_file
 from pip._internal.utils.unpacking import unpack_file
@@ -405,6 +409,113 @@ class TestInstallUnpackedWheel:
         assert os.path.exists(os.path.join(tmpdir, "some", "path", bin_dir))
         assert os.path.exists(os.path.join(tmpdir, "some", "path", "my_data"))
 
+    def test_install_with_bytecode_compiler(self, data: TestData, tmpdir: Path) -> None:
+        os.makedirs(tmpdir / "serial")
+        os.makedirs(tmpdir / "deferred")
+        self.prep(data, tmpdir / "serial")
+        wheel.install_wheel(
+            self.name,
+            self.wheelpath,
+            scheme=self.scheme,
+            req_description=str(self.req),
+        )
+        with open(os.path.join(self.dest_dist_info, "RECORD")) as f:
+            expected_record = f.read()
+
+        self.prep(data, tmpdir / "deferred")
+        compiler = wheel.BytecodeCompiler()
+        wheel.install_wheel(
+            self.name,
+            self.wheelpath,
+            scheme=self.scheme,
+            req_description=str(self.req),
+            bytecode_compiler=compiler,
+        )
+        pyc_path = importlib.util.cache_from_source(
+            os.path.join(self.scheme.purelib, "sample", "__init__.py")
+        )
+        assert not os.path.exists(pyc_path)
+
+        compiler.compile()
+        assert os.path.isfile(pyc_path)
+        self.assert_installed(0o644)
+        with open(os.path.join(self.dest_dist_info, "RECORD")) as f:
+            assert f.read() == expected_record
+
+    def test_install_with_wheel_store(self, data: TestData, tmpdir: Path) -> None:
+        os.makedirs(tmpdir / "copied")
+        self.prep(data, tmpdir / "copied")
+        wheel.install_wheel(
+            self.name,
+            self.wheelpath,
+            scheme=self.scheme,
+            req_description=str(self.req),
+        )
+        with open(os.path.join(self.dest_dist_info, "RECORD")) as f:
+            expected_record = f.read()
+
+        store = wheel.WheelStore(os.path.join(tmpdir, "store"))
+        for name in ["first", "second"]:
+            os.makedirs(tmpdir / name)
+            self.prep(data, tmpdir / name)
+            wheel.install_wheel(
+                self.name,
+                self.wheelpath,
+                scheme=self.scheme,
+                req_description=str(self.req),
+                wheel_store=store,
+            )
+            # Hard linked files are read-only, like the files of the store.
+            self.assert_installed(0o444)
+            with open(os.path.join(self.dest_dist_info, "RECORD")) as f:
+                assert f.read() == expected_record
+            with open(os.path.join(self.dest_dist_info, "INSTALLER")) as f:
+                assert f.read() == "pip\n"
+
+        with zipfile.ZipFile(self.wheelpath) as z:
+            entry = store.get_entry(self.wheelpath, z)
+        assert os.listdir(os.path.join(tmpdir, "store")) == [entry.split(os.sep)[-4]]
+        # The files generated by the installation are not in the store.
+        assert not os.path.exists(
+            os.path.join(entry, "sample-1.2.0.dist-info", "INSTALLER")
+        )
+        package_data = os.path.join(entry, "sample", "package_data.dat")
+        with open(package_data) as f:
+            assert f.read() == "some data"
+        assert not os.stat(package_data).st_mode & 0o222
+
+    def test_wheel_store_replaces_modified_entries(
+        self, data: TestData, tmpdir: Path
+    ) -> None:
+        store = wheel.WheelStore(os.path.join(tmpdir, "store"))
+        os.makedirs(tmpdir / "first")
+        self.prep(data, tmpdir / "first")
+        wheel.install_wheel(
+            self.name,
+            self.wheelpath,
+            scheme=self.scheme,
+            req_description=str(self.req),
+            wheel_store=store,
+        )
+        # Edit an installed file, which may be a hard link to the store.
+        installed = os.path.join(self.scheme.purelib, "sample", "package_data.dat")
+        os.chmod(installed, 0o644)
+        with open(installed, "w") as f:
+            f.write("edited data")
+
+        os.makedirs(tmpdir / "second")
+        self.prep(data, tmpdir / "second")
+        wheel.install_wheel(
+            self.name,
+            self.wheelpath,
+            scheme=self.scheme,
+            req_description=str(self.req),
+            wheel_store=store,
+        )
+        installed = os.path.join(self.scheme.purelib, "sample", "package_data.dat")
+        with open(installed) as f:
+            assert f.read() == "some data"
+
     def test_dist_info_contains_empty_dir(self, data: TestData, tmpdir: Path) -> None:
         """
         Test that empty dirs are not installed
@@ -463,6 +574,238 @@ class TestInstallUnpackedWheel:
         assert entrypoint in exc_text
 
 
+def test_get_install_roots(tmp_path: pathlib.Path) -> None:
+    wheel_path = make_wheel(
+        "sample",
+        "1.0",
+        extra_files={"sample/__init__.py": "", "sample.pth": ""},
+        extra_data_files={
+            "platlib/_sample.so": "",
+            "scripts/sample-cli": "",
+            "data/share/sample.txt": "",
+        },
+    ).save_to_dir(tmp_path)
+    assert wheel.get_install_roots(str(wheel_path)) == {
+        ("lib", "sample"),
+        ("lib", "sample.pth"),
+        ("lib", "sample-1.0.dist-info"),
+        ("lib", "_sample.so"),
+        ("scripts", "sample-cli"),
+        ("data", "share"),
+    }
+
+
+def test_get_install_roots_includes_entry_point_scripts(
+    tmp_path: pathlib.Path,
+) -> None:
+    first = make_wheel(
+        "first",
+        "1.0",
+        entry_points={"console_scripts": ["Shared-Tool = first:main"]},
+    ).save_to_dir(tmp_path)
+    second = make_wheel(
+        "second",
+        "1.0",
+        extra_data_files={"scripts/shared-tool": ""},
+    ).save_to_dir(tmp_path)
+    first_roots = wheel.get_install_roots(str(first))
+    assert ("scripts", "shared-tool") in first_roots
+    assert first_roots & wheel.get_install_roots(str(second))
+
+
+def test_get_installed_roots_match_install_roots(tmp_path: pathlib.Path) -> None:
+    first = make_wheel(
+        "first",
+        "1.0",
+        extra_files={"first/__init__.py": ""},
+        extra_data_files={"data/share/first.txt": ""},
+        entry_points={"console_scripts": ["Shared-Tool = first:main"]},
+    ).save_to_dir(tmp_path)
+    second = make_wheel(
+        "second",
+        "2.0",
+        extra_data_files={"scripts/shared-tool": "", "data/share/second.txt": ""},
+    ).save_to_dir(tmp_path)
+    scheme = get_scheme(
+        "first",
+        user=False,
+        home=None,
+        root=None,
+        isolated=False,
+        prefix=str(tmp_path / "prefix"),
+    )
+    wheel.install_wheel("first", str(first), scheme, "first", pycompile=False)
+    dist = get_environment([scheme.purelib]).get_distribution("first")
+    assert dist is not None
+
+    # The files removed when uninstalling first overlap with the files that
+    # second installs, even though second does not install first's files.
+    roots = wheel.get_installed_roots(dist, scheme)
+    assert ("lib", "first") in roots
+    assert ("lib", "first-1.0.dist-info") in roots
+    assert roots & wheel.get_install_roots(str(second)) == {
+        ("scripts", "shared-tool"),
+        ("data", "share"),
+    }
+
+
+def test_bytecode_compiler_records_compiled_files(tmp_path: pathlib.Path) -> None:
+    sources = []
+    for i in range(4):
+        source = tmp_path / f"module{i}.py"
+        source.write_text(f"VALUE = {i}\n")
+        sources.append(str(source))
+    broken = tmp_path / "broken.py"
+    broken.write_text("def broken(:\n")
+    record = tmp_path / "RECORD"
+    record.write_text("module0.py,,\r\nRECORD,,\r\n")
+
+    compiler = wheel.BytecodeCompiler(workers=2)
+    compiler.add(str(record), str(tmp_path), [*sources, str(broken)])
+    compiler.compile()
+
+    with open(record, newline="") as f:
+        record_paths = [row[0] for row in csv.reader(f)]
+    pyc_paths = [
+        os.path.relpath(importlib.util.cache_from_source(source), tmp_path)
+        for source in sources
+    ]
+    assert record_paths == sorted(
+        ["module0.py", "RECORD", *(p.replace(os.path.sep, "/") for p in pyc_paths)]
+    )
+    assert not os.path.exists(importlib.util.cache_from_source(str(broken)))
+
+
+def test_bytecode_compiler_does_not_fork(tmp_path: pathlib.Path) -> None:
+    sources = []
+    for i in range(2):
+        source = tmp_path / f"module{i}.py"
+        source.write_text(f"VALUE = {i}\n")
+        sources.append(str(source))
+    record = tmp_path / "RECORD"
+    record.write_text("RECORD,,\r\n")
+
+    compiler = wheel.BytecodeCompiler(workers=2)
+    compiler.add(str(record), str(tmp_path), sources)
+    with patch.object(
+        wheel, "ProcessPoolExecutor", wraps=wheel.ProcessPoolExecutor
+    ) as executor:
+        compiler.compile()
+
+    mp_context = executor.call_args.kwargs["mp_context"]
+    assert mp_context.get_start_method() in ("forkserver", "spawn")
+    for path in sources:
+        assert os.path.exists(importlib.util.cache_from_source(path))
+
+
+class TestDifferentialUpgrade:
+    files: dict[str, bytes | str] = {
+        "sample/__init__.py": "VERSION = 1\n",
+        "sample/same.py": "SAME = True\n",
+        "sample/dropped.py": "",
+        "sample/data.json": "{}",
+    }
+    new_files: dict[str, bytes | str] = {
+        "sample/__init__.py": "VERSION = 2\n",
+        "sample/same.py": "SAME = True\n",
+        "sample/added.py": "",
+        "sample/data.json": "{}",
+    }
+
+    def prep(self, tmp_path: pathlib.Path) -> None:
+        self.lib = str(tmp_path / "lib")
+        self.scheme = Scheme(
+            purelib=self.lib,
+            platlib=self.lib,
+            headers=str(tmp_path / "headers"),
+            scripts=str(tmp_path / "bin"),
+            data=str(tmp_path / "data"),
+        )
+        wheel_path = make_wheel("sample", "1.0", extra_files=self.files).save_to_dir(
+            tmp_path
+        )
+        wheel.install_wheel("sample", str(wheel_path), self.scheme, "sample")
+        self.new_wheel_path = str(
+            make_wheel("sample", "2.0", extra_files=self.new_files).save_to_dir(
+                tmp_path
+            )
+        )
+
+    def get_unchanged_files(self) -> set[str]:
+        dist = get_environment([self.lib]).get_distribution("sample")
+        assert dist is not None
+        return wheel.get_unchanged_files(
+            "sample", self.new_wheel_path, self.scheme, dist
+        )
+
+    def uninstall(self, keep: set[str]) -> UninstallPathSet:
+        dist = get_environment([self.lib]).get_distribution("sample")
+        assert dist is not None
+        pathset = UninstallPathSet(dist)
+        with patch.object(UninstallPathSet, "_permitted", return_value=True):
+            for path in uninstallation_paths(dist):
+                pathset.add(path)
+        pathset.keep(keep)
+        pathset.remove(auto_confirm=True)
+        return pathset
+
+    def test_get_unchanged_files(self, tmp_path: pathlib.Path) -> None:
+        self.prep(tmp_path)
+        same = os.path.join(self.lib, "sample", "same.py")
+        data = os.path.join(self.lib, "sample", "data.json")
+        assert self.get_unchanged_files() == {same, data}
+
+        # A file changed since it was installed is not unchanged.
+        with open(data, "a") as f:
+            f.write(" ")
+        assert self.get_unchanged_files() == {same}
+        os.chmod(same, 0o755)
+        assert self.get_unchanged_files() == set()
+
+    def test_upgrade(self, tmp_path: pathlib.Path) -> None:
+        self.prep(tmp_path)
+        same = os.path.join(self.lib, "sample", "same.py")
+        same_pyc = importlib.util.cache_from_source(same)
+        inodes = {path: os.stat(path).st_ino for path in (same, same_pyc)}
+
+        unchanged_files = self.get_unchanged_files()
+        pathset = self.uninstall(keep=unchanged_files)
+        wheel.install_wheel(
+            "sample",
+            self.new_wheel_path,
+            self.scheme,
+            "sample",
+            unchanged_files=unchanged_files,
+        )
+        pathset.commit()
+
+        # The unchanged file and its bytecode are left in place.
+        assert {path: os.stat(path).st_ino for path in inodes} == inodes
+        assert not os.path.exists(os.path.join(self.lib, "sample", "dropped.py"))
+        dist = get_environment([self.lib]).get_distribution("sample")
+        assert dist is not None
+        assert str(dist.version) == "2.0"
+        record = {row[0] for row in csv.reader(dist.read_text("RECORD").splitlines())}
+        for path in self.new_files:
+            assert path in record
+            assert os.path.exists(os.path.join(self.lib, path))
+        assert os.path.relpath(same_pyc, self.lib).replace(os.sep, "/") in record
+        assert "sample/dropped.py" not in record
+
+    def test_rollback(self, tmp_path: pathlib.Path) -> None:
+        self.prep(tmp_path)
+        pathset = self.uninstall(keep=self.get_unchanged_files())
+        assert not os.path.exists(os.path.join(self.lib, "sample", "dropped.py"))
+
+        pathset.rollback()
+        dist = get_environment([self.lib]).get_distribution("sample")
+        assert dist is not None
+        assert str(dist.version) == "1.0"
+        for path, content in self.files.items():
+            with open(os.path.join(self.lib, path)) as f:
+                assert f.read() == content
+
+
 class TestMessageAboutScriptsNotOnPATH:
     tilde_warning_msg = (
         "NOTE: The current PATH contains path(s) starting with `~`, "
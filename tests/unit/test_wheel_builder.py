@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 import pytest
 
@@ -71,3 +72,46 @@ def test_should_cache_git_sha(tmpdir: Path) -> None:
     url = "git+https://g.c/o/r@master#egg=mypkg"
     req = ReqMock(link=Link(url), source_dir=repo_path)
     assert not wheel_builder._should_cache(cast(InstallRequirement, req))
+
+
+@dataclass
+class BuildReqMock:
+    name: str
+    link: Link
+    editable: bool = False
+    permit_editable_wheels: bool = False
+    download_info: None = None
+    local_file_path: str | None = None
+
+
+def test_build_concurrently(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    # Both builds must run at the same time to get past the barrier.
+    barrier = threading.Barrier(2, timeout=10)
+
+    def build_one(
+        req: BuildReqMock, output_dir: str, *args: Any, **kwargs: Any
+    ) -> str | None:
+        barrier.wait()
+        if req.name == "broken":
+            return None
+        wheel_path = os.path.join(output_dir, f"{req.name}-1.0-py3-none-any.whl")
+        return wheel_path
+
+    monkeypatch.setattr(wheel_builder, "_build_one", build_one)
+    monkeypatch.setattr(
+        wheel_builder, "_get_cache_dir", lambda req, wheel_cache: os.fspath(tmp_path)
+    )
+    requirements = [
+        BuildReqMock("broken", Link("https://g.c/broken-1.0.tar.gz")),
+        BuildReqMock("simple", Link("https://g.c/simple-1.0.tar.gz")),
+    ]
+    successes, failures = wheel_builder.build(
+        cast(list[InstallRequirement], requirements),
+        wheel_cache=cast(Any, None),
+        verify=False,
+        concurrency=2,
+    )
+
+    assert [req.name for req in successes] == ["simple"]
+    assert [req.name for req in failures] == ["broken"]
+    assert requirements[1].link.filename == "simple-1.0-py3-none-any.whl"